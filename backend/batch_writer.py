@@ -0,0 +1,142 @@
+"""
+Write-behind batching for MongoDB inserts.
+
+Documents are queued by the request handlers and written by a single
+background task with ``insert_many`` once ``max_batch_size`` documents are
+waiting or ``flush_interval`` seconds have passed since the first one. The
+queue is bounded, so a slow database pushes back on callers instead of
+growing memory without limit.
+
+Any object with an async ``insert_many(documents, ordered=...)`` works as the
+collection, which keeps the writer testable without a running mongod.
+``after_flush`` is awaited with every batch that was written, e.g. to keep
+derived collections up to date in bulk.
+
+The callers were answered before their documents were written, so a failed
+write is retried ``max_retries`` times with exponential backoff before the
+batch is given up on (and counted in ``dropped``). The queue keeps filling
+meanwhile and pushes back once it is full. An unordered ``insert_many`` can
+fail after writing part of a batch; a retry that only fails on duplicate
+keys therefore means the batch is complete.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# MongoDB's duplicate key error code
+DUPLICATE_KEY = 11000
+
+
+def only_duplicates(error: Exception) -> bool:
+    """Whether a bulk insert failed only on documents that already exist"""
+    details = getattr(error, "details", None) or {}
+    write_errors = details.get("writeErrors")
+    return (
+        bool(write_errors)
+        and all(e.get("code") == DUPLICATE_KEY for e in write_errors)
+        and not details.get("writeConcernErrors")
+    )
+
+
+class BatchWriter:
+    def __init__(self, collection: Any, max_batch_size: int = 100, flush_interval: float = 0.05,
+                 max_queue_size: int = 10000,
+                 after_flush: Optional[Callable[[List[dict]], Awaitable[Any]]] = None,
+                 max_retries: int = 3, retry_delay: float = 0.5):
+        self.collection = collection
+        self.after_flush = after_flush
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        # Documents given up on after every retry failed
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[dict] = []
+        self._inflight: Optional[asyncio.Future] = None
+        self._closed = False
+
+    def start(self):
+        """Start the background flush task (needs a running event loop)"""
+        if self._task is None and not self._closed:
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, document: dict):
+        """Queue a document, waiting while the queue is full"""
+        if self._closed:
+            raise RuntimeError("BatchWriter is closed")
+        self.start()
+        await self._queue.put(document)
+
+    async def close(self):
+        """Stop the background task and write everything still queued"""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._inflight is not None:
+            await self._inflight
+        pending, self._batch = self._batch, []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for i in range(0, len(pending), self.max_batch_size):
+            await self._flush(pending[i:i + self.max_batch_size])
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(self._batch) < self.max_batch_size:
+                try:
+                    self._batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._batch = self._batch, []
+            # Shielded so that close() can wait for a write already under way
+            self._inflight = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._inflight)
+            self._inflight = None
+
+    async def _flush(self, batch: List[dict]):
+        if not batch:
+            return
+        if not await self._insert(batch):
+            self.dropped += len(batch)
+            return
+        if self.after_flush is not None:
+            try:
+                await self.after_flush(batch)
+            except Exception:
+                logger.exception("after_flush failed for %d documents", len(batch))
+
+    async def _insert(self, batch: List[dict]) -> bool:
+        """insert_many with retries; False once every attempt failed"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+                return True
+            except Exception as e:
+                if attempt and only_duplicates(e):
+                    # The rest was written by an earlier attempt
+                    return True
+                if attempt == self.max_retries:
+                    logger.exception("Failed to write %d queued documents, dropping them", len(batch))
+                    return False
+                logger.warning("Writing %d queued documents failed (%s), retrying", len(batch), e)
+                await asyncio.sleep(self.retry_delay * 2 ** attempt)
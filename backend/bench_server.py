@@ -0,0 +1,231 @@
+"""
+Load and latency benchmark for the API.
+
+Boots ``server:app`` in process, against an in-memory mock Mongo
+(mongomock-motor) or a real MongoDB URL, and drives a set of endpoints at a
+fixed concurrency. Requests go through the ASGI app directly, or over HTTP
+to a local uvicorn with ``--transport http``. For every scenario it records
+throughput, latency percentiles, response size and the peak Python memory
+allocated while serving one request (tracemalloc, measured in a separate
+sequential pass so it doesn't slow the timed run).
+
+    python bench_server.py --requests 2000 --concurrency 32 --json bench.json
+    python bench_server.py --mongo mongodb://localhost:27017 --transport http
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from typing import List, NamedTuple, Optional
+
+import httpx
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    path: str
+    body: Optional[dict] = None
+
+
+SCENARIOS = [
+    Scenario("visual-styles", "GET", "/api/visual-styles"),
+    Scenario("hooks", "GET", "/api/hooks"),
+    Scenario("hooks-page", "GET", "/api/hooks?limit=50"),
+    Scenario("scripts-engagement", "GET", "/api/scripts/engagement"),
+    Scenario("scripts-viral-plug", "GET", "/api/scripts/viral_plug"),
+    Scenario("status-post", "POST", "/api/status", {"client_name": "bench"}),
+    Scenario("status-page", "GET", "/api/status?limit=100"),
+]
+
+ALLOCATION_SAMPLES = 50
+
+
+def load_app(mongo: str):
+    """Import server.py, wired to mongomock unless ``mongo`` is a URL"""
+    os.environ.setdefault("DB_NAME", "viraltool_bench")
+    if mongo != "mock":
+        os.environ["MONGO_URL"] = mongo
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    import server
+
+    if mongo == "mock":
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("--mongo mock needs mongomock-motor (pip install mongomock-motor)")
+        server.connect_mongo = lambda: AsyncMongoMockClient(tz_aware=True)
+    return server.app
+
+
+async def send(client: httpx.AsyncClient, scenario: Scenario) -> httpx.Response:
+    return await client.request(scenario.method, scenario.path, json=scenario.body)
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    size = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors, size
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await send(client, scenario)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+            size = len(response.content)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    # The 99 cut points between percentiles, cuts[49] is the median
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    else:
+        cuts = [latencies[0] if latencies else 0.0] * 99
+    return {
+        "scenario": scenario.name,
+        "method": scenario.method,
+        "path": scenario.path,
+        "requests": requests,
+        "errors": errors,
+        "wall_seconds": round(wall, 3),
+        "requests_per_second": round(len(latencies) / wall, 1) if wall else 0.0,
+        "latency_ms": {
+            "p50": round(cuts[49] * 1000, 2),
+            "p90": round(cuts[89] * 1000, 2),
+            "p99": round(cuts[98] * 1000, 2),
+            "max": round(max(latencies, default=0.0) * 1000, 2),
+        },
+        "response_bytes": size,
+    }
+
+
+async def measure_allocations(client: httpx.AsyncClient, scenario: Scenario, samples: int) -> int:
+    """Median peak bytes allocated while serving one request"""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            await send(client, scenario)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return int(statistics.median(peaks))
+
+
+class UvicornThread:
+    """Serve the app with uvicorn on a free local port, in a background thread"""
+
+    def __init__(self, app):
+        import uvicorn
+
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self) -> str:
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        port = self.server.servers[0].sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join()
+
+
+async def run_benchmark(app, scenarios: List[Scenario], args, base_url: Optional[str] = None) -> List[dict]:
+    headers = {"Accept-Encoding": args.encoding}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    lifespan = None
+    if base_url is None:
+        # No lifespan support in ASGITransport, so run the app's lifespan here
+        lifespan = app.router.lifespan_context(app)
+        await lifespan.__aenter__()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", headers=headers)
+    else:
+        client = httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=30)
+    results = []
+    try:
+        for scenario in scenarios:
+            for _ in range(args.warmup):
+                await send(client, scenario)
+            result = await run_scenario(client, scenario, args.requests, args.concurrency)
+            if base_url is None:
+                result["alloc_peak_bytes"] = await measure_allocations(client, scenario, ALLOCATION_SAMPLES)
+            results.append(result)
+            print(f"{scenario.name:<20}{result['requests_per_second']:>10} req/s"
+                  f"  p50 {result['latency_ms']['p50']:>7} ms  p99 {result['latency_ms']['p99']:>7} ms"
+                  f"  errors {result['errors']}")
+    finally:
+        await client.aclose()
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongo", default="mock", help="'mock' for mongomock-motor, or a MongoDB URL")
+    parser.add_argument("--transport", choices=("asgi", "http"), default="asgi")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="untimed requests per scenario")
+    parser.add_argument("--encoding", default="gzip", help="Accept-Encoding header sent with every request")
+    parser.add_argument("--scenarios", help=f"comma separated subset of {[s.name for s in SCENARIOS]}")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    scenarios = SCENARIOS
+    if args.scenarios:
+        wanted = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+        unknown = set(wanted) - {s.name for s in SCENARIOS}
+        if unknown:
+            parser.error(f"Unknown scenarios {sorted(unknown)}")
+        scenarios = [s for s in SCENARIOS if s.name in wanted]
+
+    app = load_app(args.mongo)
+    # server.py logs at INFO, which would include a line per httpx request
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.transport == "http":
+        with UvicornThread(app) as base_url:
+            results = asyncio.run(run_benchmark(app, scenarios, args, base_url))
+    else:
+        results = asyncio.run(run_benchmark(app, scenarios, args))
+
+    if args.json:
+        settings = {key: value for key, value in vars(args).items() if key != "json"}
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"commit": git_commit(), "settings": settings, "results": results}, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Precompile the API catalog into one JSON artifact.
+
+The artifact stores every listing already validated and serialized, plus a
+hash of each source file; server.py loads it instead of validating
+catalog_data.json and the content files, and ignores it as soon as any
+source changes. The backend is deployed from the repository as it is, so
+catalog.json is committed: rebuild it with the catalog or content changes
+(the tests fail while it is stale).
+
+Before writing, hooks and scripts are checked for near-duplicate texts
+(near_duplicates.py) in the main catalog and the English content file. The
+build (and ``--check``, which the tests run) fails on any duplicate pair
+not listed in duplicates_baseline.json; ``--update-baseline`` accepts the
+current ones.
+
+    python build_catalog.py
+    python build_catalog.py --output /srv/catalog.json
+    python build_catalog.py --check
+    python build_catalog.py --update-baseline
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import server
+from catalog import read_artifact, source_fingerprint, write_artifact
+from near_duplicates import DEFAULT_THRESHOLD, find_duplicates, format_clusters, pair_keys
+from search import SEARCH_FIELDS
+
+DUPLICATES_BASELINE = Path(__file__).parent / "duplicates_baseline.json"
+
+# Catalogs checked for duplicates; translations follow the English file
+DUPLICATE_CATALOGS = ("main", "en")
+
+
+def catalog_sections(records: dict, name: str) -> dict:
+    sections = records["sections"] if name == "main" else records["locales"].get(name, {})
+    return {section: sections.get(section, []) for section in SEARCH_FIELDS}
+
+
+def check_duplicates(records: dict, threshold: float, update_baseline: bool) -> int:
+    """Report near-duplicates missing from the baseline; their number"""
+    baseline = {}
+    if DUPLICATES_BASELINE.exists():
+        baseline = json.loads(DUPLICATES_BASELINE.read_text(encoding="utf-8"))["catalogs"]
+    current, new = {}, 0
+    for name in DUPLICATE_CATALOGS:
+        clusters = find_duplicates(catalog_sections(records, name), threshold)
+        current[name] = pair_keys(clusters)
+        known = set(baseline.get(name, ()))
+        fresh = [
+            c for c in clusters
+            if any(f"{c.section}.{c.field} {p.a} {p.b}" not in known for p in c.pairs)
+        ]
+        if fresh and not update_baseline:
+            print(f"Near-duplicates in the {name} catalog:")
+            print(format_clusters(fresh))
+        new += len(fresh)
+    if update_baseline:
+        DUPLICATES_BASELINE.write_text(
+            json.dumps({"threshold": threshold, "catalogs": current}, indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"Wrote {DUPLICATES_BASELINE}: {sum(len(pairs) for pairs in current.values())} accepted pairs")
+        return 0
+    return new
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, default=server.CATALOG_ARTIFACT,
+                        help=f"artifact path (default {server.CATALOG_ARTIFACT})")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that the artifact is up to date and has no new duplicates; exit 1 if not")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="similarity at which two texts count as duplicates")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help=f"accept the current duplicates into {DUPLICATES_BASELINE.name}")
+    parser.add_argument("--allow-duplicates", action="store_true",
+                        help="report new duplicates but build anyway")
+    args = parser.parse_args()
+
+    fingerprint = source_fingerprint(server.catalog_sources())
+    if args.check:
+        records = read_artifact(args.output, fingerprint)
+        if records is None:
+            print(f"{args.output} is missing or stale")
+            return 1
+        duplicates = check_duplicates(records, args.threshold, update_baseline=False)
+        if duplicates:
+            print(f"{duplicates} new duplicate cluster(s); fix them or run with --update-baseline")
+            return 1
+        print(f"{args.output} is up to date")
+        return 0
+
+    start = time.perf_counter()
+    records = server.build_catalog_records()
+    duplicates = check_duplicates(records, args.threshold, args.update_baseline)
+    if duplicates and not args.allow_duplicates:
+        print(f"{duplicates} new duplicate cluster(s); fix them or run with --update-baseline")
+        return 1
+    write_artifact(args.output, fingerprint, records)
+    count = sum(len(items) for items in records["sections"].values())
+    print(f"Wrote {args.output}: {count} items, {len(records['locales'])} locales, "
+          f"{args.output.stat().st_size / 1024:.0f} KiB in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
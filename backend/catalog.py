@@ -0,0 +1,418 @@
+"""
+Pre-serialized catalog responses.
+
+The visual styles, hooks and scripts only change when the catalog is
+reloaded (see catalog_store.py), so every listing is encoded once into
+ready-to-send bytes (plain, gzip and - when the optional ``brotli`` package
+is installed - brotli). Serving a request is then a dict lookup, an ETag
+comparison and a write. ETags start with the catalog version.
+
+Listings are encoded on first use rather than at startup, and the whole
+catalog can be precompiled into one JSON artifact (see build_catalog.py) so
+a cold process skips reading and validating the source files.
+"""
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Clients may keep the body but must revalidate it with the ETag
+CACHE_CONTROL = "public, no-cache"
+
+# Compressing tiny bodies (e.g. an empty list) only makes them larger
+MIN_COMPRESS_SIZE = 256
+
+# Quality 11 shaves ~8% more but is ~20x slower, which adds up at startup
+BROTLI_QUALITY = 9
+
+# Page size when a cursor is given without a limit, and the largest allowed
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Distinct (page, projection) bodies kept encoded per listing
+PAGE_CACHE_SIZE = 256
+
+# Export stream lines are buffered into chunks of about this many bytes
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Translated content files shipped with the frontend, by locale
+LOCALE_FILES = {
+    'en': 'contentData.json',
+    'de': 'contentDataDe.json',
+    'es': 'contentDataEs.json',
+    'fr': 'contentDataFr.json',
+    'jp': 'contentDataJp.json',
+    'kr': 'contentDataKr.json',
+    'pt': 'contentDataPt.json',
+    'ru': 'contentDataRu.json',
+}
+
+# API section name -> key in the content files
+CONTENT_SECTIONS = {
+    "visual-styles": "visualStyles",
+    "hooks": "hooks",
+    "scripts": "scripts",
+}
+
+# Bump when the artifact layout changes
+ARTIFACT_VERSION = 1
+
+
+class EncodedBody(NamedTuple):
+    etag: str
+    identity: bytes
+    gzip: Optional[bytes]
+    br: Optional[bytes]
+
+
+def dump_json(payload: Any) -> bytes:
+    """Serialize like FastAPI's JSONResponse does"""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_body(payload: Any, version: Optional[int] = None) -> EncodedBody:
+    """Serialize a payload once and precompress it"""
+    raw = dump_json(payload)
+    etag = hashlib.sha256(raw).hexdigest()[:32]
+    if version is not None:
+        etag = f"v{version}-{etag}"
+    compress = len(raw) >= MIN_COMPRESS_SIZE
+    return EncodedBody(
+        etag=etag,
+        identity=raw,
+        gzip=gzip.compress(raw, compresslevel=9, mtime=0) if compress else None,
+        br=brotli.compress(raw, quality=BROTLI_QUALITY) if compress and brotli else None,
+    )
+
+
+def encode_cursor(item_id: str) -> str:
+    """Opaque cursor pointing just after the item with this id"""
+    return base64.urlsafe_b64encode(item_id.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        return base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+
+class CatalogListing:
+    """An ordered listing, encoded whole on first use and pageable by id cursor"""
+
+    def __init__(self, models: Iterable[Any], version: Optional[int] = None):
+        self._set_records((m.model_dump(mode="json") for m in models), version)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict], version: Optional[int] = None) -> "CatalogListing":
+        """Listing over already serialized records"""
+        listing = cls.__new__(cls)
+        listing._set_records(records, version)
+        return listing
+
+    def _set_records(self, records: Iterable[dict], version: Optional[int]):
+        self.records = tuple(records)
+        self.version = version
+        self.positions = {r["id"]: i for i, r in enumerate(self.records)}
+        self.fields = tuple(self.records[0]) if self.records else ()
+        # Pages and projections are encoded on first use and then reused
+        self._encode_page = lru_cache(maxsize=PAGE_CACHE_SIZE)(self._encode_page_uncached)
+
+    @cached_property
+    def body(self) -> EncodedBody:
+        return encode_body(list(self.records), self.version)
+
+    def parse_fields(self, fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+        """Turn "id,type,paragraph1" into a tuple in record field order"""
+        if fields is None:
+            return None
+        requested = {f.strip() for f in fields.split(",") if f.strip()}
+        if not requested:
+            raise ValueError("No fields requested")
+        unknown = requested.difference(self.fields) if self.fields else set()
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        return tuple(f for f in self.fields if f in requested)
+
+    def page(
+        self, limit: Optional[int], cursor: Optional[str], fields: Optional[str]
+    ) -> Tuple[EncodedBody, Optional[str]]:
+        """Encoded page plus the cursor for the next one (None on the last page)"""
+        start = 0
+        if cursor is not None:
+            item_id = decode_cursor(cursor)
+            if item_id not in self.positions:
+                raise ValueError("Invalid cursor")
+            start = self.positions[item_id] + 1
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE if cursor is not None else len(self.records)
+        end = min(start + limit, len(self.records))
+        next_cursor = encode_cursor(self.records[end - 1]["id"]) if end < len(self.records) else None
+        return self._encode_page(start, end, self.parse_fields(fields)), next_cursor
+
+    def _encode_page_uncached(self, start: int, end: int, fields: Optional[Tuple[str, ...]]) -> EncodedBody:
+        records = self.records[start:end]
+        if fields is not None:
+            records = [{f: r[f] for f in fields} for r in records]
+        return encode_body(list(records), self.version)
+
+
+EMPTY_LISTING = CatalogListing(())
+
+
+def validate_records(section: str, items: Iterable[Any], model: Any) -> List[dict]:
+    """Serialize items through their model, rejecting duplicate ids"""
+    records = [model.model_validate(item).model_dump(mode="json") for item in items]
+    seen = set()
+    for record in records:
+        if record["id"] in seen:
+            raise ValueError(f"Duplicate {section} id: {record['id']}")
+        seen.add(record["id"])
+    return records
+
+
+def load_catalog_data(path: Path, models: Dict[str, Any]) -> dict:
+    """Read the versioned catalog data file into serialized records
+
+    The file holds {"version": <int>, "visual-styles": [...], "hooks": [...],
+    "scripts": [...]}; bump the version with every edit.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    version = data.get("version")
+    if not isinstance(version, int):
+        raise ValueError(f"{path} has no integer version")
+    return {
+        "catalog_version": version,
+        "sections": {section: validate_records(section, data[section], models[section]) for section in CONTENT_SECTIONS},
+    }
+
+
+def load_locale_records(data_dir: Path, models: Dict[str, Any]) -> Dict[str, Dict[str, List[dict]]]:
+    """Read every content file into serialized records, by locale and section
+
+    ``models`` maps each section to the pydantic model its items are
+    validated against, so locale responses match the English endpoints.
+    Missing files only disable their locale.
+    """
+    locales = {}
+    for locale, filename in LOCALE_FILES.items():
+        path = Path(data_dir) / filename
+        if not path.exists():
+            logger.warning("Content file %s not found, locale %s disabled", path, locale)
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        locales[locale] = {
+            section: validate_records(section, data[key], models[section])
+            for section, key in CONTENT_SECTIONS.items()
+        }
+    return locales
+
+
+def source_fingerprint(paths: Iterable[Path]) -> Dict[str, Optional[str]]:
+    """Content hash of every catalog source file (None if missing)"""
+    fingerprint = {}
+    for path in paths:
+        path = Path(path)
+        fingerprint[path.name] = hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
+    return fingerprint
+
+
+def write_artifact(path: Path, fingerprint: Dict[str, Optional[str]], records: dict):
+    """Write the precompiled catalog atomically
+
+    ``records`` holds "catalog_version", "sections" (section -> records)
+    and "locales" (locale -> section -> records).
+    """
+    artifact = {"version": ARTIFACT_VERSION, "sources": fingerprint, **records}
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.write_bytes(dump_json(artifact))
+    os.replace(tmp_path, path)
+
+
+def read_artifact(path: Path, fingerprint: Dict[str, Optional[str]]) -> Optional[dict]:
+    """The precompiled catalog, or None if it is missing or was built from other sources"""
+    try:
+        artifact = json.loads(Path(path).read_bytes())
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        logger.warning("Catalog artifact %s is corrupt, ignoring it", path)
+        return None
+    if artifact.get("version") != ARTIFACT_VERSION or artifact.get("sources") != fingerprint:
+        logger.info("Catalog artifact %s is stale, loading from the sources", path)
+        return None
+    return artifact
+
+
+class Catalog(NamedTuple):
+    """Every listing served by the API"""
+
+    sections: Dict[str, CatalogListing]
+    hooks_by_category: "CatalogIndex"
+    scripts_by_type: "CatalogIndex"
+    locales: Dict[str, Dict[str, CatalogListing]]
+    version: Optional[int] = None
+
+
+def catalog_from_records(records: dict) -> Catalog:
+    """Listings and indexes over serialized records (see write_artifact)"""
+    version = records.get("catalog_version")
+    sections = records["sections"]
+    return Catalog(
+        sections={name: CatalogListing.from_records(items, version) for name, items in sections.items()},
+        hooks_by_category=CatalogIndex(sections["hooks"], lambda h: category_slug(h["category"]), version),
+        scripts_by_type=CatalogIndex(sections["scripts"], lambda s: s["type"], version),
+        locales={
+            locale: {name: CatalogListing.from_records(items, version) for name, items in catalog.items()}
+            for locale, catalog in records["locales"].items()
+        },
+        version=version,
+    )
+
+
+def iter_ndjson(catalogs: Iterable[Tuple[Optional[str], Dict[str, CatalogListing]]]) -> Iterator[bytes]:
+    """Stream catalogs as NDJSON, one item per line
+
+    Items are serialized one at a time and flushed in small chunks, so
+    memory stays flat and the first bytes go out before the rest is done.
+    """
+    chunk = bytearray()
+    for locale, catalog in catalogs:
+        for section in CONTENT_SECTIONS:
+            for record in catalog[section].records:
+                chunk += dump_json({"locale": locale, "section": section, "item": record})
+                chunk += b"\n"
+                if len(chunk) >= EXPORT_CHUNK_SIZE:
+                    yield bytes(chunk)
+                    chunk.clear()
+    if chunk:
+        yield bytes(chunk)
+
+
+def category_slug(category: str) -> str:
+    """URL form of a hook category, e.g. "Ex TikTok" -> ex-tiktok"""
+    return category.lower().replace(" ", "-")
+
+
+class CatalogIndex:
+    """Records grouped by a key once, with a listing per key"""
+
+    def __init__(self, items: Iterable[dict], key: Callable[[dict], str], version: Optional[int] = None):
+        groups: Dict[str, list] = {}
+        for item in items:
+            groups.setdefault(key(item), []).append(item)
+        self.listings: Dict[str, CatalogListing] = {
+            k: CatalogListing.from_records(v, version) for k, v in groups.items()
+        }
+
+    def listing(self, key: str) -> CatalogListing:
+        return self.listings.get(key, EMPTY_LISTING)
+
+
+def _accepted_encodings(header: str) -> set:
+    """Parse an Accept-Encoding header, skipping codings with q=0"""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+def _negotiate(body: EncodedBody, accept_encoding: str) -> Tuple[Optional[str], bytes, str]:
+    """Pick the smallest representation the client accepts"""
+    accepted = _accepted_encodings(accept_encoding)
+    if body.br is not None and ("br" in accepted or "*" in accepted):
+        return "br", body.br, f'"{body.etag}-br"'
+    if body.gzip is not None and ("gzip" in accepted or "*" in accepted):
+        return "gzip", body.gzip, f'"{body.etag}-gz"'
+    return None, body.identity, f'"{body.etag}"'
+
+
+def _etag_matches(if_none_match: Optional[str], body: EncodedBody) -> bool:
+    """Weak comparison as required for If-None-Match, across all encodings"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        for suffix in ("-br", "-gz"):
+            if tag.endswith(suffix):
+                tag = tag[: -len(suffix)]
+                break
+        if tag == body.etag:
+            return True
+    return False
+
+
+def catalog_response(request: Request, body: EncodedBody) -> Response:
+    """Send a pre-encoded body, or 304 if the client already has it"""
+    encoding, content, etag = _negotiate(body, request.headers.get("accept-encoding", ""))
+    headers = {
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+        "Cache-Control": CACHE_CONTROL,
+    }
+    if _etag_matches(request.headers.get("if-none-match"), body):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def listing_response(
+    request: Request,
+    listing: CatalogListing,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Response:
+    """Send a whole listing, or one page / projection of it
+
+    The next page is advertised in the X-Next-Cursor and Link headers so the
+    body stays a plain list, as for the unpaginated endpoints.
+    """
+    if limit is None and cursor is None and fields is None:
+        return catalog_response(request, listing.body)
+    try:
+        body, next_cursor = listing.page(limit, cursor, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response = catalog_response(request, body)
+    if next_cursor:
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
@@ -0,0 +1,213 @@
+"""
+Hot-reloadable catalog.
+
+The catalog is read from a versioned data file and the translated content
+files. A CatalogSnapshot holds everything served from one version of it:
+the listings with their encoded bodies and indexes, plan composers, search
+indexes and duplicate reports. CatalogStore publishes one snapshot at a
+time and replaces it with a single reference assignment, so readers never
+take a lock and never see half a reload. A request should read
+``store.current`` once and use that snapshot throughout.
+
+Every snapshot, the first one included (``load`` at startup), is built in
+a worker thread, off the request path. That loads and validates the files,
+encodes every body, builds the plan composers and search indexes (copies of
+the previous ones, re-indexing only the documents that changed), and only
+then swaps the snapshot in. Reloads run when a source file changes
+(``watch`` polls their size and modification time) or on demand, e.g. from
+the admin endpoint. A file that fails to load leaves the current snapshot
+serving.
+"""
+import asyncio
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from catalog import Catalog, CatalogListing, catalog_from_records, dump_json
+from near_duplicates import cluster_dict, find_duplicates
+from plans import PlanComposer
+from search import SEARCH_FIELDS, SearchIndex
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two checks of the source files
+WATCH_INTERVAL = 2.0
+
+# Duplicate reports kept per snapshot (one per locale and threshold)
+MAX_DUPLICATE_REPORTS = 32
+
+# (modification time, size) per source file, None when missing
+SourceStamp = Dict[str, Optional[Tuple[int, int]]]
+
+
+def source_stamp(paths: List[Path]) -> SourceStamp:
+    stamp = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            stamp[str(path)] = None
+        else:
+            stamp[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return stamp
+
+
+class CatalogSnapshot:
+    """One version of the catalog and everything derived from it"""
+
+    def __init__(self, catalog: Catalog, stamp: SourceStamp):
+        self.catalog = catalog
+        self.version = catalog.version
+        self.stamp = stamp
+        self.loaded_at = datetime.now(timezone.utc)
+        # Derived per locale (None for the main catalog) on first use, or
+        # up front by prepare()
+        self._composers: Dict[Optional[str], PlanComposer] = {}
+        self._search: Dict[Optional[str], SearchIndex] = {}
+        self._duplicates: Dict[Tuple[Optional[str], float], bytes] = {}
+
+    def listings(self, locale: Optional[str] = None) -> Dict[str, CatalogListing]:
+        """The main catalog's sections, or a translated one's"""
+        if locale is None:
+            return self.catalog.sections
+        try:
+            return self.catalog.locales[locale]
+        except KeyError:
+            raise LookupError(f"Unknown locale: {locale}")
+
+    def _search_sections(self, locale: Optional[str]) -> dict:
+        listings = self.listings(locale)
+        return {section: listings[section].records for section in SEARCH_FIELDS}
+
+    def plan_composer(self, locale: Optional[str] = None) -> PlanComposer:
+        composer = self._composers.get(locale)
+        if composer is None:
+            listings = self.listings(locale)
+            composer = PlanComposer(
+                listings["visual-styles"].records, listings["hooks"].records, listings["scripts"].records
+            )
+            self._composers[locale] = composer
+        return composer
+
+    def search_index(self, locale: Optional[str] = None) -> SearchIndex:
+        index = self._search.get(locale)
+        if index is None:
+            index = SearchIndex.from_sections(self._search_sections(locale))
+            self._search[locale] = index
+        return index
+
+    def duplicates(self, locale: Optional[str], threshold: float) -> bytes:
+        """Near-duplicate clusters as an encoded JSON body (slow, run in a thread)"""
+        body = self._duplicates.get((locale, threshold))
+        if body is None:
+            clusters = find_duplicates(self._search_sections(locale), threshold)
+            body = dump_json([cluster_dict(c) for c in clusters])
+            if len(self._duplicates) >= MAX_DUPLICATE_REPORTS:
+                del self._duplicates[next(iter(self._duplicates))]
+            self._duplicates[(locale, threshold)] = body
+        return body
+
+    def prepare(self, previous: Optional["CatalogSnapshot"] = None):
+        """Encode every body and build the composers and search indexes
+
+        Search indexes start from copies of ``previous``'s, so only the
+        documents that changed are re-indexed.
+        """
+        catalog = self.catalog
+        for listings in [catalog.sections, *catalog.locales.values()]:
+            for listing in listings.values():
+                listing.body
+        for index in (catalog.hooks_by_category, catalog.scripts_by_type):
+            for listing in index.listings.values():
+                listing.body
+        for locale in [None, *catalog.locales]:
+            self.plan_composer(locale)
+            old = previous._search.get(locale) if previous is not None else None
+            if old is None:
+                self.search_index(locale)
+            else:
+                index = old.copy()
+                index.update(self._search_sections(locale))
+                self._search[locale] = index
+
+
+class CatalogStore:
+    """Publishes catalog snapshots and reloads them when the sources change
+
+    ``load`` returns the catalog records (see catalog.write_artifact) and
+    ``sources`` the files they are read from.
+    """
+
+    def __init__(self, load: Callable[[], dict], sources: Callable[[], List[Path]]):
+        self._load = load
+        self._sources = sources
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._first_load = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._failed_stamp: Optional[SourceStamp] = None
+
+    @property
+    def current(self) -> CatalogSnapshot:
+        """The published snapshot
+
+        load() publishes the first one; without it, the first call builds
+        and prepares it, blocking.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._first_load:
+                if self._snapshot is None:
+                    self.reload_now()
+            snapshot = self._snapshot
+        return snapshot
+
+    async def load(self) -> CatalogSnapshot:
+        """Publish the first snapshot from a worker thread, if there is none yet"""
+        if self._snapshot is None:
+            await self.reload()
+        return self._snapshot
+
+    def _build(self) -> CatalogSnapshot:
+        # Stamped before reading, so an edit made during the read triggers
+        # another reload
+        stamp = source_stamp(self._sources())
+        return CatalogSnapshot(catalog_from_records(self._load()), stamp)
+
+    def reload_now(self) -> CatalogSnapshot:
+        """Build, prepare and publish a new snapshot (blocking)"""
+        with self._reload_lock:
+            previous = self._snapshot
+            snapshot = self._build()
+            snapshot.prepare(previous)
+            self._snapshot = snapshot
+            self._failed_stamp = None
+        logger.info("Catalog version %s loaded", snapshot.version)
+        return snapshot
+
+    async def reload(self) -> CatalogSnapshot:
+        """reload_now() in a worker thread"""
+        return await asyncio.to_thread(self.reload_now)
+
+    def changed(self) -> bool:
+        """Whether the sources differ from the published snapshot's"""
+        if self._snapshot is None:
+            return False
+        stamp = source_stamp(self._sources())
+        return stamp != self._snapshot.stamp and stamp != self._failed_stamp
+
+    async def watch(self, interval: float = WATCH_INTERVAL):
+        """Reload whenever the sources change, until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            if not self.changed():
+                continue
+            stamp = source_stamp(self._sources())
+            try:
+                await self.reload()
+            except Exception:
+                # Not retried until the files change again
+                self._failed_stamp = stamp
+                logger.exception("Catalog reload failed, still serving version %s", self._snapshot.version)
@@ -0,0 +1,206 @@
+"""
+Near-duplicate detection for hooks and scripts.
+
+Every text field (Hook.idea, Script.paragraph1/paragraph2) is folded like
+the search index does, reduced to overlapping character 5-grams and
+sketched with MinHash. Locality-sensitive hashing over bands of the sketch
+finds candidate pairs without comparing every pair, and each candidate is
+then checked against the exact Jaccard similarity of its 5-gram sets, so
+the threshold is exact and only recall is probabilistic.
+
+The sketch uses one hash per shingle (one permutation hashing) instead of
+one per shingle and row: the hash picks a bin and the bin keeps its
+smallest value. Empty bins borrow from the next filled one (rotation
+densification), which keeps similar texts colliding even when they are
+short.
+
+Character shingles work the same for every language and don't need word
+boundaries, so the Japanese and Korean catalogs need no special casing.
+
+    python near_duplicates.py
+    python near_duplicates.py --locale en --threshold 0.6 --json duplicates.json
+"""
+import argparse
+import hashlib
+import json
+import re
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from search import SEARCH_FIELDS, fold
+
+SHINGLE_SIZE = 5
+
+# Sketch size, split into BANDS bands of ROWS values each. A pair with
+# similarity s becomes a candidate with probability 1 - (1 - s**ROWS)**BANDS:
+# ~99% at 0.7, ~5% at 0.3.
+NUM_BINS = 64
+BANDS = 16
+ROWS = NUM_BINS // BANDS
+
+DEFAULT_THRESHOLD = 0.7
+
+_EMPTY = 1 << 64
+_WORDS = re.compile(r"[^\W_]+")
+
+DocKey = Tuple[str, str, str]
+
+
+def shingles(text: str) -> FrozenSet[int]:
+    """Hashed character 5-grams of the folded text, punctuation collapsed"""
+    normalized = " ".join(_WORDS.findall(fold(text)))
+    if len(normalized) <= SHINGLE_SIZE:
+        grams = {normalized} if normalized else set()
+    else:
+        grams = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+    return frozenset(
+        int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "little")
+        for gram in grams
+    )
+
+
+def sketch(hashes: Iterable[int]) -> Tuple[int, ...]:
+    """MinHash sketch of a non-empty shingle set"""
+    bins = [_EMPTY] * NUM_BINS
+    for h in hashes:
+        i = h % NUM_BINS
+        value = h // NUM_BINS
+        if value < bins[i]:
+            bins[i] = value
+    values = list(bins)
+    for i, value in enumerate(bins):
+        if value == _EMPTY:
+            # Borrow from the next filled bin; the offset keeps borrowed
+            # values apart from real ones
+            for distance in range(1, NUM_BINS):
+                borrowed = bins[(i + distance) % NUM_BINS]
+                if borrowed != _EMPTY:
+                    values[i] = borrowed + distance * _EMPTY
+                    break
+    return tuple(values)
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    return len(a & b) / len(a | b)
+
+
+class DuplicatePair(NamedTuple):
+    a: str
+    b: str
+    similarity: float
+
+
+class DuplicateCluster(NamedTuple):
+    """Items whose ``field`` texts are near-duplicates of each other"""
+
+    section: str
+    field: str
+    ids: Tuple[str, ...]
+    similarity: float  # of the closest pair
+    pairs: Tuple[DuplicatePair, ...]
+
+
+def candidate_pairs(sketches: Dict[DocKey, Tuple[int, ...]]) -> set:
+    """Pairs of documents of the same section and field sharing a band"""
+    buckets = defaultdict(list)
+    for key, values in sketches.items():
+        section, _, field = key
+        for band in range(BANDS):
+            buckets[(section, field, band, values[band * ROWS:(band + 1) * ROWS])].append(key)
+    pairs = set()
+    for keys in buckets.values():
+        for i in range(len(keys)):
+            for j in range(i + 1, len(keys)):
+                pairs.add((keys[i], keys[j]))
+    return pairs
+
+
+def find_duplicates(sections: Dict[str, Iterable[dict]], threshold: float = DEFAULT_THRESHOLD) -> List[DuplicateCluster]:
+    """Near-duplicate clusters per section and field, closest first
+
+    ``sections`` maps "hooks" / "scripts" to records.
+    """
+    shingle_sets: Dict[DocKey, FrozenSet[int]] = {}
+    for section, records in sections.items():
+        for record in records:
+            for field in SEARCH_FIELDS[section]:
+                if record.get(field):
+                    hashes = shingles(record[field])
+                    if hashes:
+                        shingle_sets[(section, record["id"], field)] = hashes
+    sketches = {key: sketch(hashes) for key, hashes in shingle_sets.items()}
+
+    parent: Dict[DocKey, DocKey] = {}
+
+    def root(key: DocKey) -> DocKey:
+        while parent.get(key, key) != key:
+            key = parent[key]
+        return key
+
+    matches = []
+    for a, b in candidate_pairs(sketches):
+        similarity = jaccard(shingle_sets[a], shingle_sets[b])
+        if similarity >= threshold:
+            matches.append((a, b, similarity))
+            parent[root(a)] = root(b)
+
+    groups: Dict[DocKey, List[Tuple[DocKey, DocKey, float]]] = defaultdict(list)
+    for a, b, similarity in matches:
+        groups[root(a)].append((a, b, similarity))
+    clusters = []
+    for cluster_root, members in groups.items():
+        section, _, field = cluster_root
+        pairs = tuple(sorted(
+            (DuplicatePair(*sorted((a[1], b[1])), round(similarity, 3)) for a, b, similarity in members),
+            key=lambda pair: (-pair.similarity, pair.a, pair.b),
+        ))
+        ids = tuple(sorted({item_id for pair in pairs for item_id in (pair.a, pair.b)}))
+        clusters.append(DuplicateCluster(section, field, ids, pairs[0].similarity, pairs))
+    clusters.sort(key=lambda c: (-c.similarity, c.section, c.field, c.ids))
+    return clusters
+
+
+def cluster_dict(cluster: DuplicateCluster) -> dict:
+    return {**cluster._asdict(), "pairs": [pair._asdict() for pair in cluster.pairs]}
+
+
+def pair_keys(clusters: Iterable[DuplicateCluster]) -> List[str]:
+    """One "section.field a b" string per duplicate pair, for baselines"""
+    return sorted(f"{c.section}.{c.field} {p.a} {p.b}" for c in clusters for p in c.pairs)
+
+
+def format_clusters(clusters: List[DuplicateCluster], texts: Optional[Dict[Tuple[str, str], dict]] = None) -> str:
+    lines = []
+    for c in clusters:
+        lines.append(f"{c.section}.{c.field}  {c.similarity:.2f}  {', '.join(c.ids)}")
+        if texts is not None:
+            for item_id in c.ids:
+                text = " ".join(texts[(c.section, item_id)][c.field].split())
+                lines.append(f"    {item_id:<6} {text[:100]}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--locale", help="check a translated catalog instead of the main one")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="minimum Jaccard similarity")
+    parser.add_argument("--json", help="also write the clusters to this file")
+    args = parser.parse_args()
+
+    import server
+
+    listings = server.get_listings(args.locale.lower() if args.locale else None)
+    sections = {section: listings[section].records for section in SEARCH_FIELDS}
+    clusters = find_duplicates(sections, args.threshold)
+    texts = {(section, r["id"]): r for section, records in sections.items() for r in records}
+    print(format_clusters(clusters, texts))
+    print(f"\n{len(clusters)} clusters, {sum(len(c.pairs) for c in clusters)} pairs at >= {args.threshold}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([cluster_dict(c) for c in clusters], f, indent=2, ensure_ascii=False)
+        print(f"Clusters written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
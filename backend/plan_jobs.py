@@ -0,0 +1,155 @@
+"""
+Background jobs generating plan campaigns.
+
+A job draws plans from a CampaignSampler in chunks on the event loop and
+yields between chunks, so a large campaign never holds up other requests.
+Each plan is serialized once, as an NDJSON line, when it is produced.
+Clients poll the job's progress, or stream its results while it runs: the
+stream sends what is already there and then waits for more until the job
+ends.
+
+Jobs live in process memory. Finished jobs are kept (up to
+``max_finished``) so that late pollers can still read them.
+"""
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
+
+from catalog import EXPORT_CHUNK_SIZE, dump_json
+from plans import CampaignSampler
+
+logger = logging.getLogger(__name__)
+
+# Plans drawn between two yields to the event loop
+JOB_CHUNK_SIZE = 256
+
+# Finished jobs kept for polling, oldest dropped first
+MAX_FINISHED_JOBS = 100
+
+# "exhausted": the catalog ran out of unused hooks or scripts before the count
+FINISHED_STATUSES = ("done", "exhausted", "failed", "cancelled")
+
+
+class PlanJob:
+    def __init__(self, sampler: CampaignSampler, requested: int):
+        self.id = uuid.uuid4().hex
+        self.sampler = sampler
+        self.requested = requested
+        self.lines: List[bytes] = []
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def progress(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "requested": self.requested,
+            "produced": len(self.lines),
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+    def _notify(self):
+        # Wake every waiting stream, later ones wait on a fresh event
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _finish(self, status: str, error: Optional[str] = None):
+        self.status = status
+        self.error = error
+        self.finished_at = datetime.now(timezone.utc)
+        self._notify()
+
+    async def run(self):
+        self.status = "running"
+        try:
+            while len(self.lines) < self.requested:
+                for _ in range(min(JOB_CHUNK_SIZE, self.requested - len(self.lines))):
+                    plan = self.sampler.next_plan()
+                    if plan is None:
+                        self._finish("exhausted")
+                        return
+                    self.lines.append(dump_json(plan._asdict()) + b"\n")
+                self._notify()
+                await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            self._finish("cancelled")
+            raise
+        except Exception as e:
+            logger.exception("Plan job %s failed", self.id)
+            self._finish("failed", str(e))
+            return
+        self._finish("done")
+
+    async def iter_ndjson(self) -> AsyncIterator[bytes]:
+        """The job's plans as NDJSON, following the job until it ends"""
+        sent = 0
+        while True:
+            changed = self._changed
+            if sent < len(self.lines):
+                end = len(self.lines)
+                chunk = bytearray()
+                for line in self.lines[sent:end]:
+                    chunk += line
+                    if len(chunk) >= EXPORT_CHUNK_SIZE:
+                        yield bytes(chunk)
+                        chunk.clear()
+                if chunk:
+                    yield bytes(chunk)
+                sent = end
+                continue
+            if self.finished:
+                return
+            await changed.wait()
+
+
+class PlanJobs:
+    """Registry of the plan jobs of this process"""
+
+    def __init__(self, max_finished: int = MAX_FINISHED_JOBS):
+        self.max_finished = max_finished
+        self.jobs: "OrderedDict[str, PlanJob]" = OrderedDict()
+
+    def submit(self, sampler: CampaignSampler, count: int) -> PlanJob:
+        """Start a job in the background (needs a running event loop)"""
+        job = PlanJob(sampler, count)
+        job.task = asyncio.create_task(job.run())
+        self.jobs[job.id] = job
+        self._prune()
+        return job
+
+    def get(self, job_id: str) -> Optional[PlanJob]:
+        return self.jobs.get(job_id)
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
+
+    async def cancel(self, job: PlanJob):
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+        if not job.finished:
+            # Cancelled before it got to run
+            job._finish("cancelled")
+
+    async def close(self):
+        """Cancel every running job"""
+        for job in list(self.jobs.values()):
+            await self.cancel(job)
@@ -0,0 +1,255 @@
+"""
+Content plan composer.
+
+A plan is one visual style, one hook and five scripts, following the rules
+of the script step in frontend/src/App.js:
+
+- slots 1 and 2 take one script of each opener type, in either order
+  (other + engagement, or mistake + mistake_engagement for mistake styles)
+- slots 3 and 5 take filler scripts (other, or mistake)
+- slot 4 takes the viral plug (viral_plug, or mistake_viral)
+- mistake styles go with the "... - Mistakes" hook categories, the other
+  styles with every other category
+- no script appears twice in a plan
+
+Scripts are grouped into per-type pools once, and the slot layouts of each
+kind of style are worked out up front, so composing a plan is a handful of
+random draws instead of a scan over every script.
+
+A campaign is a series of plans that share no hook and no script, e.g. one
+per creator account. CampaignSampler shuffles every pool once and pops from
+it, so each plan costs the same however many came before it.
+"""
+import random
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+SLOT_COUNT = 5
+
+# Most plans returned by one compose call
+MAX_PLANS = 1000
+
+# Draws per requested plan before giving up on finding more distinct ones
+MAX_ATTEMPTS_PER_PLAN = 20
+
+
+class PlanRules(NamedTuple):
+    """Script type per slot for one kind of visual style"""
+
+    opener: Tuple[str, str]
+    filler: str
+    plug: str
+
+    def layouts(self) -> Tuple[Tuple[str, ...], ...]:
+        """The type of every slot, once per opener order"""
+        first, second = self.opener
+        return tuple(
+            (a, b, self.filler, self.plug, self.filler)
+            for a, b in ((first, second), (second, first))
+        )
+
+
+STANDARD_RULES = PlanRules(opener=("other", "engagement"), filler="other", plug="viral_plug")
+MISTAKE_RULES = PlanRules(opener=("mistake", "mistake_engagement"), filler="mistake", plug="mistake_viral")
+
+
+def is_mistake_style(style: dict) -> bool:
+    return "mistake" in style["title"].lower()
+
+
+def is_mistake_hook(hook: dict) -> bool:
+    return hook["category"].endswith(" - Mistakes")
+
+
+class Plan(NamedTuple):
+    style_id: str
+    hook_id: str
+    script_ids: Tuple[str, ...]
+
+
+class SlotLayout(NamedTuple):
+    """A slot layout, as the draws needed to fill it
+
+    ``draws`` holds (script type, slots) pairs: one sample of len(slots)
+    distinct scripts from that type's pool fills all of those slots.
+    """
+
+    types: Tuple[str, ...]
+    draws: Tuple[Tuple[str, Tuple[int, ...]], ...]
+
+    @classmethod
+    def from_types(cls, types: Tuple[str, ...]) -> "SlotLayout":
+        slots: Dict[str, List[int]] = {}
+        for slot, script_type in enumerate(types):
+            slots.setdefault(script_type, []).append(slot)
+        return cls(types, tuple((t, tuple(s)) for t, s in slots.items()))
+
+
+class PlanComposer:
+    """Samples valid plans from a catalog's styles, hooks and scripts (as records)"""
+
+    def __init__(self, styles: Iterable[dict], hooks: Iterable[dict], scripts: Iterable[dict]):
+        self.styles = {s["id"]: s for s in styles}
+        self.hooks = {h["id"]: h for h in hooks}
+        pools: Dict[str, List[str]] = {}
+        for script in scripts:
+            pools.setdefault(script["type"], []).append(script["id"])
+        self.pools = {script_type: tuple(ids) for script_type, ids in pools.items()}
+        self.script_types = {script_id: t for t, ids in self.pools.items() for script_id in ids}
+        # Hook ids per kind of style, keyed by is_mistake_style()
+        self.hook_pools = {
+            kind: tuple(h["id"] for h in self.hooks.values() if is_mistake_hook(h) == kind)
+            for kind in (False, True)
+        }
+        self.layouts = {
+            kind: tuple(SlotLayout.from_types(types) for types in rules.layouts())
+            for kind, rules in ((False, STANDARD_RULES), (True, MISTAKE_RULES))
+        }
+
+    def style(self, style_id: str) -> dict:
+        try:
+            return self.styles[style_id]
+        except KeyError:
+            raise LookupError(f"Unknown visual style: {style_id}")
+
+    def hook(self, hook_id: str) -> dict:
+        try:
+            return self.hooks[hook_id]
+        except KeyError:
+            raise LookupError(f"Unknown hook: {hook_id}")
+
+    def slot_layouts(self, style_id: str, first_type: Optional[str] = None) -> Tuple[SlotLayout, ...]:
+        """Layouts a style can use, each with enough scripts to fill it
+
+        ``first_type`` pins the type of slot 1, like the tab picked in the
+        wizard. Raises ValueError when no layout can be filled.
+        """
+        kind = is_mistake_style(self.style(style_id))
+        layouts = self.layouts[kind]
+        if first_type is not None:
+            layouts = tuple(layout for layout in layouts if layout.types[0] == first_type)
+            if not layouts:
+                opener = (MISTAKE_RULES if kind else STANDARD_RULES).opener
+                raise ValueError(f"Slot 1 of this style must be one of: {', '.join(opener)}")
+        usable = tuple(
+            layout for layout in layouts
+            if all(len(self.pools.get(t, ())) >= len(slots) for t, slots in layout.draws)
+        )
+        if not usable:
+            short = sorted({
+                t for layout in layouts for t, slots in layout.draws
+                if len(self.pools.get(t, ())) < len(slots)
+            })
+            raise ValueError(f"Not enough scripts of type {', '.join(short)} for this style")
+        return usable
+
+    def check_hook(self, style_id: str, hook_id: str):
+        """Raise ValueError unless the hook fits the style"""
+        kind = is_mistake_style(self.style(style_id))
+        if is_mistake_hook(self.hook(hook_id)) != kind:
+            raise ValueError(
+                f"Hook {hook_id} doesn't fit style {style_id}: mistake styles take the "
+                f"'- Mistakes' hook categories, the other styles the rest"
+            )
+
+    def draw(self, layouts: Tuple[SlotLayout, ...], rng: random.Random) -> Tuple[str, ...]:
+        """Script ids for one plan, from one of ``layouts``"""
+        layout = layouts[0] if len(layouts) == 1 else rng.choice(layouts)
+        slots: List[str] = [""] * SLOT_COUNT
+        for script_type, positions in layout.draws:
+            for position, script_id in zip(positions, rng.sample(self.pools[script_type], len(positions))):
+                slots[position] = script_id
+        return tuple(slots)
+
+    def compose(
+        self,
+        style_id: str,
+        hook_id: str,
+        count: int = 1,
+        first_type: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> List[Plan]:
+        """Up to ``count`` distinct plans for a style and hook
+
+        Fewer plans are returned only when the pools don't hold that many
+        distinct combinations. The same ``seed`` gives the same plans.
+        """
+        self.check_hook(style_id, hook_id)
+        layouts = self.slot_layouts(style_id, first_type)
+        rng = random.Random(seed)
+        seen = set()
+        plans = []
+        for _ in range(count * MAX_ATTEMPTS_PER_PLAN):
+            script_ids = self.draw(layouts, rng)
+            if script_ids in seen:
+                continue
+            seen.add(script_ids)
+            plans.append(Plan(style_id, hook_id, script_ids))
+            if len(plans) == count:
+                break
+        return plans
+
+    def valid(self, plan: Plan) -> bool:
+        """Whether a plan follows every rule, e.g. one edited by hand"""
+        if plan.style_id not in self.styles or plan.hook_id not in self.hooks:
+            return False
+        if len(plan.script_ids) != SLOT_COUNT or len(set(plan.script_ids)) != SLOT_COUNT:
+            return False
+        kind = is_mistake_style(self.styles[plan.style_id])
+        if is_mistake_hook(self.hooks[plan.hook_id]) != kind:
+            return False
+        slot_types = tuple(self.script_types.get(script_id) for script_id in plan.script_ids)
+        return any(slot_types == layout.types for layout in self.layouts[kind])
+
+
+class CampaignSampler:
+    """Draws plans that share no hook and no script, rotating through styles"""
+
+    def __init__(self, composer: PlanComposer, style_ids: Iterable[str], seed: Optional[int] = None):
+        self.composer = composer
+        self.rng = random.Random(seed)
+        style_ids = list(dict.fromkeys(style_ids))
+        self.kinds = {style_id: is_mistake_style(composer.style(style_id)) for style_id in style_ids}
+        # Styles whose pools can't fill a single plan are left out up front
+        self.style_ids = [
+            style_id for style_id in style_ids
+            if composer.hook_pools[self.kinds[style_id]] and self._fillable(style_id)
+        ]
+        if not self.style_ids:
+            raise ValueError("None of the styles can be filled from this catalog")
+        self.pools = {t: self._shuffled(ids) for t, ids in composer.pools.items()}
+        self.hooks = {kind: self._shuffled(ids) for kind, ids in composer.hook_pools.items()}
+        self.turn = self.rng.randrange(len(self.style_ids))
+
+    def _fillable(self, style_id: str) -> bool:
+        try:
+            self.composer.slot_layouts(style_id)
+        except ValueError:
+            return False
+        return True
+
+    def _shuffled(self, ids: Tuple[str, ...]) -> List[str]:
+        ids = list(ids)
+        self.rng.shuffle(ids)
+        return ids
+
+    def _fits(self, layout: SlotLayout) -> bool:
+        return all(len(self.pools.get(t, ())) >= len(slots) for t, slots in layout.draws)
+
+    def next_plan(self) -> Optional[Plan]:
+        """The next plan, or None once the remaining pools can't fill any style"""
+        while self.style_ids:
+            style_id = self.style_ids[self.turn % len(self.style_ids)]
+            kind = self.kinds[style_id]
+            layouts = [layout for layout in self.composer.layouts[kind] if self._fits(layout)]
+            if not layouts or not self.hooks[kind]:
+                self.style_ids.remove(style_id)
+                continue
+            self.turn += 1
+            layout = layouts[0] if len(layouts) == 1 else self.rng.choice(layouts)
+            slots: List[str] = [""] * SLOT_COUNT
+            for script_type, positions in layout.draws:
+                pool = self.pools[script_type]
+                for position in positions:
+                    slots[position] = pool.pop()
+            return Plan(style_id, self.hooks[kind].pop(), tuple(slots))
+        return None
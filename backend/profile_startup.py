@@ -0,0 +1,113 @@
+"""
+Cold start profile for server.py.
+
+Every measurement runs in a fresh interpreter, so nothing is cached from a
+previous run. Reports the slowest imports (``python -X importtime``), the
+time to import the app, to load the catalog from the precompiled artifact
+and from the sources, and to encode the first full listing.
+
+    python profile_startup.py
+    python profile_startup.py --runs 10 --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent
+
+# Runs in the child interpreter and prints one JSON line of timings
+PROBE = """
+import json, time
+start = time.perf_counter()
+import server
+imported = time.perf_counter()
+catalog = server.get_catalog()
+loaded = time.perf_counter()
+catalog.sections["hooks"].body
+encoded = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "catalog": loaded - imported,
+    "first_body": encoded - loaded,
+}))
+"""
+
+
+def child_env(**overrides) -> dict:
+    env = dict(os.environ)
+    env.update(overrides)
+    return env
+
+
+def import_times(top: int) -> list:
+    """The ``top`` modules by self time while importing server.py"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=BACKEND_DIR, env=child_env(), capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append({"module": name.strip(), "self_ms": int(self_us) / 1000,
+                        "cumulative_ms": int(cumulative_us) / 1000})
+    return sorted(modules, key=lambda m: -m["self_ms"])[:top]
+
+
+def probe(runs: int, **env) -> dict:
+    """Median of each PROBE timing over ``runs`` fresh interpreters, in ms"""
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=BACKEND_DIR, env=child_env(**env), capture_output=True, text=True, check=True,
+        )
+        samples.append(json.loads(result.stdout.splitlines()[-1]))
+    return {key: round(statistics.median(s[key] for s in samples) * 1000, 1) for key in samples[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="interpreters per measurement")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    parser.add_argument("--artifact", type=Path, help="catalog artifact (default: the server's)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    import server
+    from catalog import read_artifact, source_fingerprint
+
+    artifact = args.artifact or server.CATALOG_ARTIFACT
+    fresh = read_artifact(artifact, source_fingerprint(server.catalog_sources())) is not None
+
+    results = {"imports": import_times(args.top)}
+    print(f"{'self ms':>9}{'cumul. ms':>11}  module")
+    for m in results["imports"]:
+        print(f"{m['self_ms']:>9.1f}{m['cumulative_ms']:>11.1f}  {m['module']}")
+
+    results["sources"] = probe(args.runs, CATALOG_ARTIFACT=str(BACKEND_DIR / "missing-catalog.json"))
+    if fresh:
+        results["artifact"] = probe(args.runs, CATALOG_ARTIFACT=str(artifact))
+    else:
+        print(f"\n{artifact} is missing or stale, run build_catalog.py to profile it")
+
+    print(f"\n{'catalog from':<14}{'import ms':>11}{'catalog ms':>12}{'1st body ms':>13}{'total ms':>10}")
+    for name in ("sources", "artifact"):
+        if name in results:
+            r = results[name]
+            print(f"{name:<14}{r['import']:>11}{r['catalog']:>12}{r['first_body']:>13}{sum(r.values()):>10.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
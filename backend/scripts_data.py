@@ -1,248 +0,0 @@
-# Scripts Data
-OTHER_SCRIPTS = [
-    {"paragraph1": "they track your sleep schedule based on scroll patterns", "paragraph2": "they can tell when you're scrolling half asleep, doomscrolling at 3am, or skipping through everything too fast. that data loops back into how your own content is distributed. i have no words 😵‍💫"},
-    {"paragraph1": "they know when you're scrolling on the toilet", "paragraph2": "i wish this was a joke but it's in their behavior detection data. posture, angle, session length… the system adjusts your own post distribution based on how you consume too. toilet scrollers get toilet reach 💀"},
-    {"paragraph1": "they know your political opinions. and it does affect your reach", "paragraph2": "if you comment on or like content with \"sensitive topics,\" your profile gets quietly downranked. they didn't say it directly but everyone in training knew. stay mysterious online bestie or your views will suffer 🫶"},
-    {"paragraph1": "your drafts are leaking data even when you don't post", "paragraph2": "they showed us that the app watches how often you save, rewatch, or rewrite drafts. if you keep hoarding them without posting, the system assumes you lack direction = lower trust score. your perfectionism is literally shadowbanning you 😭"},
-    {"paragraph1": "posting from bad wifi or data literally sabotages you", "paragraph2": "like i'm sorry but if you're posting from mcdonalds or on 3G... you're done. they deprioritize uploads with low connection quality bc it messes with playback speed. mobile data = blurry = less reach 😔"},
-    {"paragraph1": "green clothes trigger spam filters", "paragraph2": "idk WHY but green outfits kept showing up in the internal spam dataset. they think it's linked to greenscreen abuse?? either way. green top = shadowban risk. stick to pink or neutrals if you care about reach 💚"},
-    {"paragraph1": "tiktok knows when you're wearing makeup", "paragraph2": "i'm not even kidding. there's a filter detection layer that recognizes beauty products. \"light glam\" gets pushed more than \"bare face\" or \"heavy glam.\" they said it correlates with watch time. insane. sexist. real 😔💄"},
-    {"paragraph1": "if you leave hate comments, the algo punishes you", "paragraph2": "they track your comment tone across accounts. if you're always negative or sarcastic, your own posts get deprioritized over time. it's called \"behavioral downranking.\" no one's talking about this enough 😶"},
-    {"paragraph1": "the toilet scroll theory is actually real", "paragraph2": "they have \"bathroom behavior flags.\" if your phone is tilted down at a steep angle and you're scrolling for 7+ mins in silence… the algo tags that session. and it affects what kind of audience your content gets sent to 😭"},
-    {"paragraph1": "posting while someone's watching netflix kills your push", "paragraph2": "if your wifi has competing traffic (like Netflix, Zoom calls, etc), the upload gets corrupted and the algo assumes you're low effort or botting. post when your wifi is CLEAN and alone. yes this is insane. yes it's real 🙃"},
-    {"paragraph1": "they boost you if your reflection is visible", "paragraph2": "they call it \"self-awareness markers.\" mirror behind you? phone reflection in frame? it triggers bonus distribution. they said it makes the video feel more authentic + unfiltered. the algo likes when you accidentally show too much 👀"},
-    {"paragraph1": "using slang words in your videos can tank you", "paragraph2": "words like \"delulu\" were getting auto-flagged for brand safety. tiktok wants clean vocab now. even jokingly saying \"unalive\" puts you on a soft warning list. girl we're living in an essay-writing simulator 😭"},
-    {"paragraph1": "wearing headphones in your video lowers your engagement score", "paragraph2": "it makes people think you're ignoring them. legit. even if it's part of the aesthetic, the algo marks it as \"disconnected behavior.\" leave the airpods out if you want your vid to hit fyp 🥲"},
-    {"paragraph1": "they penalize you if you record too close to your wall", "paragraph2": "it's called \"depth analysis.\" if there's no depth behind you (like you're up against a wall or closet), your video is seen as cramped and unengaging. they said the background has to \"breathe.\" girl WHAT 😭"},
-    {"paragraph1": "if your bed is unmade, your content gets deprioritized", "paragraph2": "yes, seriously. messy backgrounds = low \"visual trust.\" they showed us heatmaps where clutter tanks retention. tidy room, good lighting, clean mirror = more reach. your bedframe has more power than you think 🫠"},
-    {"paragraph1": "if you use instagram too much, your reach goes down", "paragraph2": "they didn't say it directly, but they hinted the system monitors app-switching. if you're copying links from IG or posting right after editing in capcut linked to IG... you're getting deprioritized. it's giving surveillance state 😭"},
-    {"paragraph1": "switching outfits too often confuses the algorithm", "paragraph2": "they track your clothing to cluster your content. if every video you post looks like a different person, it resets your \"creator identity.\" pick a consistent look or color palette. it's giving fashion jail 🙃"},
-    {"paragraph1": "your iPhone battery % affects how your video gets labeled", "paragraph2": "they track device status during upload. posting with low battery = flagged as \"rushed content session.\" they said creators who film + upload on full charge have more consistent push. charge your phone. seriously 😭"},
-    {"paragraph1": "they soft-prioritize users with newer phones", "paragraph2": "if you film on a newer device (esp iphone 15+), the video gets coded as \"high visual integrity.\" older phones = more compression = lower trust score. yes it's classist. yes i'm mad too 😔"},
-    {"paragraph1": "they test how long you watch YOUR OWN drafts", "paragraph2": "if you keep rewatching your drafts before posting, it gets flagged as over-edited or \"desperate.\" they said confident creators upload fast and clean. post it and GO bestie. no more obsessive looping 🙃"},
-    {"paragraph1": "your own likes affect your reach", "paragraph2": "no one talks about this but they legit said liking your own video sends the algo a \"low confidence\" signal. it's coded as desperation. i deleted every self-like after that 🫠🫣"},
-    {"paragraph1": "your pinned videos literally trap you in a niche", "paragraph2": "they told us the system uses your 3 pinned vids to \"anchor\" your account identity. if you pin random stuff or switch them too often, it confuses the algo and drops your push range. pick your niche and commit bestie 💗🎯"},
-    {"paragraph1": "never post using mobile data", "paragraph2": "like actually. the system flags uploads on unstable or weak networks as \"low integrity\" and your post gets quality suppressed before it's even published. they said always use strong wifi, preferably at home 🫠"},
-    {"paragraph1": "when i came back, i changed my whole approach.", "paragraph2": "i posted when i wanted to, not just because i felt like i \"had\" to. and crazy enough, my content actually started doing better..."},
-    {"paragraph1": "recording in 4K can actually hurt your performance", "paragraph2": "wild but true. they said ultra-HD videos get compressed on upload and end up looking worse than 1080p. the algorithm also delays processing time. keep it simple or lose early push 🫠"},
-    {"paragraph1": "use layered audio like perfume.", "paragraph2": "while we split a strawberry matcha, a comedy guy added a faint whisper track of him laughing under his punchline. TikTok's audio mix is quiet by default, so that second layer nudges people to crank volume, which counts as extra engagement. he said it bumps replays by 12 percent 🌸"},
-    {"paragraph1": "the algorithm watches how your followers behave too", "paragraph2": "girl when i found this out i screamed. if your followers don't engage with others, tiktok considers your audience \"passive\". that means even if your content is great, your push gets throttled. follower quality > follower count every time 💖"},
-    {"paragraph1": "escape the trend mirage", "paragraph2": "one day a week drop a raw story with zero trends. this reset shows tiktok you can hold eyes on personality alone ☺️"},
-    {"paragraph1": "your video didn't flop. it just didn't hit the right people yet.", "paragraph2": "sometimes all it takes is one small tweak. a new hook, a better caption, or a different posting time 🎀🤍"},
-    {"paragraph1": "the algorithm has \"warm up\" periods", "paragraph2": "early posts after you've been inactive are tested way harder. they give you smaller audiences first to see if you can keep them watching. if you pass, they push you to bigger batches. if you fail, you get stuck in what we literally called \"low trust mode\" 🫠"},
-    {"paragraph1": "there's a shadow scoring system no one talks about.", "paragraph2": "every post you make secretly affects your overall creator score. even private drafts and deleted videos leave traces. we used to call it \"quiet data\" in team meetings. it's tracked, babe. all of it 😮💕"},
-    {"paragraph1": "she treats her account like it's a TV show", "paragraph2": "same style, same \"feel,\" so her audience instantly knows what to expect every time. the algorithm loves predictability almost as much as her loyal followers do 💖"},
-    {"paragraph1": "reposting is NOT a red flag", "paragraph2": "we literally had internal docs proving that a good repost with a stronger hook or thumbnail often outperforms the original. stop being scared to recycle content 🌸"},
-    {"paragraph1": "i know tiktok can be frustrating sometimes, but just keep posting consistently!", "paragraph2": "even when you dont feel like it or aren't seeing big numbers, showing up regularly makes a huge difference in long term. don't give up on that 🙏"},
-    {"paragraph1": "schedule a 15-minute hype sprint with two creator besties.", "paragraph2": "every night at 8 pm these three hit \"post,\" then hop on FaceTime with sheet masks, blasting likes, comments and stitches on each other's fresh uploads. that first-hour spark tricks the algo into thinking something is trending and it snowballs. plus, cheering with cucumber eye patches is peak self-care energy 💕"},
-    {"paragraph1": "emojis in your username actually help.", "paragraph2": "this sounds fake but i noticed i got more profile visits once i added a cute emoji. maybe it looks more trustworthy. maybe it makes you seem more fun. either way... do it 💖"},
-    {"paragraph1": "your content is competing with your last best self.", "paragraph2": "you're not just competing with other creators. you're competing with your own best video. the algorithm goes, \"why show this if their last one did better?\" that's why some creators feel like they've fallen off. it's not random. you're being measured against your peak 🙃"},
-    {"paragraph1": "they dont chase perfect.", "paragraph2": "they chase patterns. you'll see them test, tweak, repeat no over editing. no waiting. just small signals adding up to something bigger 🫶"},
-    {"paragraph1": "the algorithm retests content, so don't delete too fast.", "paragraph2": "this was a huge tip. they literally said old videos get pushed again if they catch even a little engagement later. one girl said her post got 3k views then 100k two weeks later. i stopped deleting my \"flops\" after that and it's made such a difference"},
-    {"paragraph1": "there were weeks i was posting every single day, trying different trends, switching hooks, adding text, all of it and still barely getting views.", "paragraph2": "but every post taught me something. i just didn't realize it yet. momentum builds before it shows."},
-    {"paragraph1": "posting daily made it less scary.", "paragraph2": "i used to sit on drafts for days. now i post while brushing my hair or waiting for my latte. showing up everyday makes it feel normal, not stressful 🎀🤍"},
-    {"paragraph1": "treat every post like practice.", "paragraph2": "the more you post, the more you learn. your future viral self will thank you for not giving up now"},
-    {"paragraph1": "lowercase text feels more trustworthy.", "paragraph2": "seriously. something about lowercase texts feels softer, more honest. i started using it in all my videos and my reach started improving by a lot ☺️"},
-    {"paragraph1": "why some videos go viral days later ✨", "paragraph2": "sometimes your video sits in \"limited testing\" for a while. if the system notices you've been engaging with others while it's paused, it pushes your content again. that's why i always tell people, don't just post and ghost 🫶🥹"},
-    {"paragraph1": "liking certain political content can flag your account", "paragraph2": "not even joking. accounts that interacted with \"risky\" political takes (especially around elections or protests) got thrown into restricted pools. it's not a shadowban, but your reach dips hard. we were told it was to \"prevent misinformation\" 🫠"},
-    {"paragraph1": "i mapped out a full month of video prompts while sipping an iced matcha after class.", "paragraph2": "three content pillars, ten ideas each, no second-guessing. planning unlocked consistency so i never woke up wondering what to film..."},
-    {"paragraph1": "why removing old videos can actually help", "paragraph2": "we used to joke that \"algorithm memory is long but forgiving\". if you hide underperformers, it cleans up your \"identity score\" and helps the system re-categorize you. i've seen creators blow up after mass-archiving their flops 💕"},
-    {"paragraph1": "why you should never stop posting during a slump", "paragraph2": "we called this the \"patience filter\". the algorithm literally expects people to quit during dry spells. the ones who keep posting get rewarded when testing resets. most creators give up right before it happens 💗"},
-    {"paragraph1": "momentum builds before it shows.", "paragraph2": "there were weeks i felt like nothing was happening. same views, same numbers. but then out of nowhere, one post popped and brought new eyes to everything i'd already made. keep stacking. it adds up 🌸"},
-    {"paragraph1": "i stopped doom scrolling and started actually supporting people in my niche.", "paragraph2": "real engagement gets returned. and tiktok notices when you're active in the community 💞"},
-    {"paragraph1": "at some point i had to stop and be honest with myself.", "paragraph2": "would i even watch this? was it valuable, entertaining, or relatable? the answer was no 💞"},
-    {"paragraph1": "your first 5 videos matter way more than you think", "paragraph2": "the system uses them to \"map\" your creator identity. it decides what niche to test you in, who to push you to, and even how forgiving it'll be with future flops 🎀🤍"},
-    {"paragraph1": "screenshots count as super-saves", "paragraph2": "the algorithm sees screenshots as a higher-value signal than likes. why? because people only screenshot content they actually care about. so... screenshot each other's posts, besties 🎀🤍"},
-    {"paragraph1": "control your feed, control your views", "paragraph2": "you can literally pick what the algorithm feeds you now. with the new Manage Topics + Smart Keyword Filters, you can tune out the clutter and focus on what your heart really wants. beauty, pets, trends... without the random chaos of unrelated noise. it's like choosing your own spoil-me playlist, and THAT IS POWER, bestie 💞"},
-    {"paragraph1": "don't be afraid to show up \"cringe\".", "paragraph2": "every creator i met said their early vids made them cringe now... but they wouldn't be where they are without them. growth is messy. your dream audience doesn't care if you stumble at first. they just need to find you 🎀🤍"},
-    {"paragraph1": "posting without replying to old comments lowers your reach", "paragraph2": "if you never interact with past videos, the system assumes you're not building community. replying to 5–10 comments before posting warms up your account and boosts the reach of the new video. it's a tiny hack that actually works ☺️💞"},
-    {"paragraph1": "i stopped ghosting my own page and started posting consistently, even on days where my confidence was low.", "paragraph2": "it didn't blow up right away, but it built something real. and that mattered more ✨💖"},
-    {"paragraph1": "film the \"first take\" and keep the stumbles in.", "paragraph2": "a beauty guru let me watch her record while blending concealer. she sets a timer for 5 minutes and refuses retakes. the micro-mess-ups make her feel live and double her average watch time because viewers stick around to see if she recovers 🤍😊"},
-    {"paragraph1": "talk about the things you like, you are passionate about. seriously!", "paragraph2": "without script, without overthinking fr people absolutely looove these videos because it feels real to them ☺️"},
-    {"paragraph1": "she refuses to delete anything", "paragraph2": "even her worst flops stay live for everyone to see. she swears those \"failed\" videos still help the algorithm trust her account over time 💞"},
-    {"paragraph1": "i used to think i missed the wave. that everyone already built their audience while i was still thinking about posting.", "paragraph2": "but once i actually started (like REALLY started) i realized i wasn't late. i was just early to my chapter ✨"},
-    {"paragraph1": "the ones who blew up didn't delete their flops.", "paragraph2": "tiktok retests content now. i've literally seen videos pick up weeks later for no reason. let your posts live. don't panic delete 🎀🤍"},
-    {"paragraph1": "they don't chase constant newness, they build patterns.", "paragraph2": "same message, told a little differently each time. it's not repetitive. it's memorable. and it helps people recognize them faster ☺️"},
-    {"paragraph1": "every time you delete a post, you lose trust score.", "paragraph2": "they don't tell creators this but deleting a bunch of low- performers actually trains the system to see you as \"unstable\". you're better off posting and leaving it alone than cleaning your feed 🫠"},
-    {"paragraph1": "finally, give viewers a clear next step!", "paragraph2": "trust me, telling them exactly what you want really helps maybe \"follow!\", \"comment!\", or \"link in bio\". fr, having a clear cold action at the end really helps guide people 🤗"},
-    {"paragraph1": "try to post kinda regularly, not daily.", "paragraph2": "just something you can actually stick to once i stuck to a rhythm, things slowly started picking up. it helped me stay motivated, and people started showing up too 💖"},
-    {"paragraph1": "over-editing kills momentum.", "paragraph2": "perfect captions. fancy transitions. too many cuts. most people just want to feel something real. clarity wins over polish every time 🫶"},
-    {"paragraph1": "the algorithm actually has trust issues.", "paragraph2": "the system learns what kind of creator you are. if you confuse it with random shifts, deleting flops or randomly ghosting the app, your posts get less reach while it \"retests\" your identity 💖"},
-    {"paragraph1": "most creators don't flop because of content", "paragraph2": "they flop because their \"trust score\" is below 60%. your trust score is influenced by things like: deleting vids, getting low retention streaks, posting too late at night, spammy comments, controversial likes, changing posting frequency, device changes… it all affects your reach. and you NEVER get to see the score 🙃"},
-    {"paragraph1": "your scroll habits affect YOUR OWN reach", "paragraph2": "yeah... if you doomscroll, comment random stuff, or engage with spammy content, the system classifies your account differently. your personal behavior trains your creator profile. give the love you wanna receive 🎀🤍"},
-    {"paragraph1": "one good post can change everything.", "paragraph2": "you're literally one video away. the one you almost didn't post might be the one that gets shared like crazy. keep making things you're proud of, keep learning, and trust that the growth is compounding behind the scenes 💖🤍"},
-    {"paragraph1": "you don't need a niche, you need a story.", "paragraph2": "the tiktok team literally said this. people follow people, not topics. one creator there grew by just sharing her morning thoughts while doing makeup. the content wasn't perfect, but it was her. that's what sticks ✨"},
-    {"paragraph1": "the hashtag chaos is finally over", "paragraph2": "august 2025 lowkey shocked everyone... tiktok now only lets you use 5 hashtags per post. at first i panicked, but honestly it's giving clarity. when i switched from random tag spam to just 3 niche ones and 2 trending ones, my views started climbing. less is literally more now"},
-    {"paragraph1": "and one more thing... most of them don't blow up alone.", "paragraph2": "they boost each other. comment squads. story shares. \"let's all go up together\" energy. that vibe works. every time."},
-    {"paragraph1": "don't wait to \"feel ready\"", "paragraph2": "i still post stuff that makes me cringe a lil sometimes. but cringe is part of the process!! keep showing up. your people will only find you if you keep posting 🤍🎀"},
-    {"paragraph1": "posting feels cringe at first. do it anyway.", "paragraph2": "i used to cringe so hard i wouldn't even rewatch my own vids. but the more i posted, the less i cared. consistency is the cure 😊✨"},
-    {"paragraph1": "last thing i'll say... everyone feels behind at some point.", "paragraph2": "every single creator i spoke to felt stuck or invisible at one point. the difference? they didn't stop. so if you're in a slump right now, i promise you're not alone. keep going. the growth sneaks up on you 💖🌸"},
-    {"paragraph1": "i also realized: people want stories, not just aesthetics.", "paragraph2": "share the behind-the-scenes, the real moments, the things you wish someone told you earlier. that's what makes people care and connect"},
-    {"paragraph1": "finally, i know, a lot of you will find it stupid, but tiktok actually wants you to go viral!", "paragraph2": "just think about it, tiktok makes a lot of money with every video that goes viral. blaming algorithm wont get you anywhere. be rational and focus on improving your content 🙏"},
-    {"paragraph1": "they watch their own videos back like a detective...", "paragraph2": "where did they scroll? when did they rewatch? why did they comment? then they tweak based on that. no ego, just curiosity"},
-    {"paragraph1": "also... they post even when it flops.", "paragraph2": "i noticed they don't waste time overthinking, they treat every video like a rep, not a masterpiece. perfectionism is the slowest way to grow 🎀🤍"},
-    {"paragraph1": "the algorithm LOVES when you talk too fast", "paragraph2": "fast pacing increases replay rate because people want to catch what you said. replay rate is one of the strongest virality signals. talk like you're late to work, it works 🌸"},
-    {"paragraph1": "there's a feedback loop built in to make you self sabotage", "paragraph2": "every drop in views is designed to test your behavior. if you quit or start changing everything, the algorithm flags your account as inconsistent. the creators who stay calm and keep posting win 🌸"},
-    {"paragraph1": "every account has a hidden \"momentum cap\".", "paragraph2": "we called it the speed limit. if you grow \"too fast\" without enough OWN engagement depth (aka real comments, saves, shares) the algorithm slows you down on purpose. it wants to see if you can return the favor first 🙏🥰"},
-    {"paragraph1": "only copying trends with no twist.", "paragraph2": "your personality >>> the sound you're using you can 100% use trending audio, just make it yours. otherwise it blends in and flops 💖"},
-    {"paragraph1": "making money is possible here down the line, but don't get discouraged if it doesn't happen right away", "paragraph2": "focus on enjoying the process and treated like a fun side project and it starts covering the bills ☺️"},
-    {"paragraph1": "watching your own video too many times can backfire", "paragraph2": "creators obsessively rewatching their draft or refreshing analytics actually confuses the early data. it counts as \"looping\" but messes up your audience signal. i saw this in the internal testing tools all the time 💗"},
-    {"paragraph1": "you're being profiled by your phones data", "paragraph2": "they use phone type, battery health, screen time habits, even typing speed to determine if you're \"ad friendly.\" if your phone is old or your behavior seems \"unstable\", your content is deprioritized. it's literally discrimination via data 😔"},
-    {"paragraph1": "dont make your videos look too complicated.", "paragraph2": "simplicity is golden! too many visuals confuse viewers and they just skip your video if their eyes cant catch a key element in your video 🫶☺️"},
-    {"paragraph1": "posting while traveling ruins your reach", "paragraph2": "if your GPS or IP address suddenly changes, the system thinks you're a spam bot. especially if you post from random hotels or airports. you'll randomly start flopping until your \"posting pattern\" resets. i tested this myself 🫶"},
-    {"paragraph1": "your content gets tested on people with similar watch habits as you.", "paragraph2": "yes, YOU are part of your own audience test pool. if you watch chaotic edits and repost memes all day... your content gets grouped with that vibe at first🥺💖"},
-    {"paragraph1": "they don't post perfect videos.", "paragraph2": "they post a lot of okay ones. the algorithm isn't looking for polished, it's looking for signals. and every post is a chance to gather more data 🫶"},
-    {"paragraph1": "they do track your phone", "paragraph2": "yes girl, tiktok can see your apps. if you have instagram open in background a lot, it lowers your push priority. if you edit in edits or use capcut templates with ig watermarks? immediate reach penalty. like girl be serious 😭"},
-    {"paragraph1": "this habit literally rewired my brain.", "paragraph2": "now i open the app ready to create not compare. if you've been stuck in scroll mode, try posting before you scroll. you'll be surprised how quickly things shift 🩷🌸"},
-    {"paragraph1": "silent reposting is a hidden growth hack ✨", "paragraph2": "most interns didn't even know this. reposting your own content without deleting the original doesn't hurt you. the algorithm treats it like a new test. i've seen reposts hit 10x the reach of the first upload 💕🫶"},
-    {"paragraph1": "why \"silent boosts\" happen out of nowhere ✨", "paragraph2": "ever notice a random old video suddenly blowing up? that's a silent boost. the algorithm resurfaces old content when it sees you've been posting and engaging consistently. it's the app's way of rewarding \"trustworthy\" creators 🌸🫶"},
-    {"paragraph1": "slow growth doesn't mean no growth.", "paragraph2": "there were weeks i saw no change and wanted to quit. but looking back, that was when i was actually getting better. the numbers just hadn't caught up yet 💕🌸"},
-    {"paragraph1": "snappy beats perfect", "paragraph2": "i filmed quick jump-cut clips between bronzer and lip gloss. i trimmed silences, added on-screen text, then moved on. viewers stay for momentum, not flawless edits, so speed matters more than sparkle ✨"},
-    {"paragraph1": "her #1 rule", "paragraph2": "if a video works, post more like it immediately. don't wait for it to \"cool down\". ride the wave until it peaks. momentum is literally built into the system ✨"},
-    {"paragraph1": "they repurpose the same idea 5 different ways instead of chasing a new trend every day.", "paragraph2": "it's not boring. it's smart. audiences need repetition to actually remember you ☺️"},
-    {"paragraph1": "certain faces perform better on the FYP", "paragraph2": "yes. tiktok literally runs facial recognition models. bright lighting + expressive eyes + \"trustworthy face\" features = boosted distribution. it's not about beauty, it's about AI trust signals. the whole thing is freaky 🙃"},
-    {"paragraph1": "turn followers into \"hype squad\"", "paragraph2": "every milestone i posted a \"pick my next idea\" poll and shouted out helpful comments in my captions. people love seeing their names on screen and they come back to defend \"their\" creator. more love, more watch time, more growth."},
-    {"paragraph1": "if you've been stuck, feeling like your vids deserve more, same. that was me...", "paragraph2": "but real talk? the hype around this app is deserved. it actually helped me grow faster without overthinking every post"},
-    {"paragraph1": "the algorithm has \"seasons\"", "paragraph2": "sometimes your niche is just in a slow season. engagement dips are not permanent. i literally saw entire categories go cold for weeks then explode again. so if your views are down right now... you might just be early 💖"},
-    {"paragraph1": "creators who DM their own videos get deprioritized", "paragraph2": "if you're spamming your vid link in DMs or group chats, it flags the post as \"manually pushed.\" the system prefers organic growth. i saw this label with my own eyes 🙃💞"},
-    {"paragraph1": "use hashtags wisely!", "paragraph2": "stick to the ones that are actually relevant to your video. using too many or random ones seriously will do more harm than good with bad hashtags you will target wrong audience who will skip your video in the first second and you wont get any traction"},
-    {"paragraph1": "your first 5 videos create your \"identity score\"", "paragraph2": "your early posts lock in what kind of creator you are. that's why some people feel stuck in a niche. we called it clustering. the system loves predictability ✨"},
-    {"paragraph1": "take breaks when you need them!", "paragraph2": "yes, consistency is the key, but dont burn yourself out it is okay to step back for a bit for a recharge and make a stronger comeback 💪"},
-    {"paragraph1": "some days i feel like i cracked the code.", "paragraph2": "other days? 112 views and silence. if that's you too, know that most people give up right before it starts clicking. ride the waves. the algorithm's weird, not you 🎀🤍"},
-    {"paragraph1": "tempo-flip teaser", "paragraph2": "shoot the last three seconds first, edit them to play in reverse at normal speed. the micro plot twist turns passive scrollers into detectives and replays go crazy 💖"},
-    {"paragraph1": "watching your own video 10 times does NOT help", "paragraph2": "creators kept refreshing and rewatching their post thinking it'd boost reach. nope. the algorithm detects it and treats it like forced looping. it actually messes with your signal 😔💕"},
-    {"paragraph1": "finally, if your views are down, hang in there!", "paragraph2": "I have experienced slow weeks that turned around it can be totally unpredictable, so stick with your routine and keep creating content that you love 🫶"},
-    {"paragraph1": "if this is really your dream, act like you deserve to be here.", "paragraph2": "post like your future self is watching 💖🌸"},
-    {"paragraph1": "your videos don't just get random views", "paragraph2": "my dad literally worked on the ranking team. he said every single video is given a \"starting score\" based on your history, past engagement, even what you watch. so no, it's not luck when a video blows up. it's math, babe 💖✨"},
-    {"paragraph1": "saving > sharing > liking", "paragraph2": "this was one of the wildest things i learned. saves tell the algorithm your video has long-term value, so it keeps pushing it for days. that's why tutorials and \"bookmarkable\" content blow up late 🎀🤍"},
-    {"paragraph1": "your behavior off your own videos matters too", "paragraph2": "what you watch, who you comment on, and how you interact affects how YOUR OWN content gets categorized. if you're all over the place, so is your reach. focus your feed on your niche 💖"},
-    {"paragraph1": "reposting isn't punished, it's rewarded", "paragraph2": "if a video flopped but had good analytics, the system flagged it as \"under-distributed\". reposting it with a new hook or thumbnail often performed way better than the original. we literally saw this in the dashboards 🌸🤍"},
-    {"paragraph1": "dry spells are intentional", "paragraph2": "they call it \"resets\". it's literally built in to test if you'll quit. if you keep posting anyway, the rebound is always way bigger than before. so if your views are down right now... keep going. you're not shadowbanned, you're being tested 🎀🤍"},
-    {"paragraph1": "don't wait until your content is perfect to post it.", "paragraph2": "that day won't come. the only way to improve is to keep posting, even when it feels awkward or slow. consistency builds confidence, not the other way around 🎀🤍"},
-    {"paragraph1": "they filter out content based on race, weight & disabilities", "paragraph2": "this one made me sick. there was a \"visual risk\" tag used to quietly downrank videos from creators with certain physical features to \"reduce bullying risk.\" that was the excuse. but it was targeting marginalized creators. no one talks about this 🫢"},
-    {"paragraph1": "creators who engage genuinely grow a lot faster.", "paragraph2": "it wasn't just a theory. the tiktok team showed charts comparing active engagers vs post-and-go accounts. the ones who genuinely interact with others saw faster follower growth AND more fyp placements 🎀🤍"},
-    {"paragraph1": "the U.S. algorithm is officially different", "paragraph2": "if your audience is mostly american, you're now playing on a different field. tiktok just rolled out a separate us-only version of the app with its own algorithm. it feels like creating content for a new platform, so staying in tune with us culture and trends is literally more important than ever ☺️🫶"},
-    {"paragraph1": "algorithm reset means fresh start energy", "paragraph2": "this update kinda gave me first-day-of-school vibes. people are saying it's like the algorithm re-introduced us to each other. i started posting again consistently and suddenly it felt like new people were discovering me, like i had a fresh chance to make a first impression"},
-    {"paragraph1": "if you use TikTok right after crying, your views go UP", "paragraph2": "there's an internal metric called \"emotional state anomaly\" (i swear i'm not making this up). if your face or voice shows stress signals, the system predicts higher engagement and pushes the video further. insane but true 🫠"},
-    {"paragraph1": "you are the niche.", "paragraph2": "i kept thinking i needed some perfect aesthetic or super specific topic to grow. but the truth is, people follow you for your energy, your story, your vibe. your niche isn't a category... it's your personality. show more of you and they'll stay for everything"},
-    {"paragraph1": "not every post has to go viral to be doing its job.", "paragraph2": "some are just meant to build trust. to show you're still here. to attract that one person who needed your content today 💖"},
-    {"paragraph1": "they realized the niche isn't the topic, it's you.", "paragraph2": "your vibe. your energy. your way of telling stories. people don't follow you for one type of content. they follow because they feel like they know you 💕"},
-    {"paragraph1": "this is your reminder... even the biggest creators started with awkward posts and 12 views.", "paragraph2": "support others, stay consistent, and make the algorithm work with you, not against you. your time is coming 💕"},
-    {"paragraph1": "some videos will flop. even the ones you thought were so good...", "paragraph2": "and that's okay. it doesn't mean you're bad at this, it means you're learning ☺️"},
-    {"paragraph1": "your \"flop era\" is part of the plan.", "paragraph2": "one creator shared she had 30 videos under 500 views before anything popped. the tiktok team was like, yep. it's normal. those early vids are training the algorithm and training you. it made me feel so much better lol 🎀🤍"},
-    {"paragraph1": "if you feel stuck, it doesn't mean you're bad at this.", "paragraph2": "it might just mean your content needs a little more intention. quality over chaos. depth over trends. it works 🙏"},
-    {"paragraph1": "posting every day helped me stop overthinking and just get it out there.", "paragraph2": "done is better than perfect and your people will find you faster when you show up often ☀️"},
-    {"paragraph1": "growth is slow until it's not.", "paragraph2": "some vids sat at 300 views for a week. then one popped off while i was out running errands and all the old ones started getting views too. it adds up. even the quiet days count 💜"},
-    {"paragraph1": "check out \"creator search insights\", especially the \"content gap\" section when u feel you are out of ideas", "paragraph2": "it tells you exactly which topics tiktok app needs at the moment. it even gives you hook ideas, and how you should structure your video"},
-    {"paragraph1": "deleting videos is worse than you think", "paragraph2": "delete 1-2? fine. mass delete 10 in a row? the algorithm sees it as massive instability. it literally downgrades your next uploads 🫠"},
-    {"paragraph1": "tiktok wants consistency, not perfection.", "paragraph2": "one of the team members literally said \"we'd rather see 4 imperfect posts a week than 1 perfect one\" while sipping her iced matcha. it made me realize we're overthinking WAY too much. the algorithm wants you to just show up 💗"},
-    {"paragraph1": "if this is your sign to keep going... take it.", "paragraph2": "you're not behind. you're building momentum. the more you show up, the more the app shows you off. we're in this together 💅"},
-]
-
-ENGAGEMENT_SCRIPTS = [
-    {"paragraph1": "tiktok can't tell if you're human", "paragraph2": "bots don't comment. you do. the more you act human, the more trust you build and the harder you get pushed 🫶"},
-    {"paragraph1": "scrolling without engaging lowers your \"interest score\"", "paragraph2": "watching without liking or commenting makes tiktok think you're disinterested. so when you post, the system assumes people will ignore you too. that's why engaging helps both your feed AND your own content's push 🫣"},
-    {"paragraph1": "commenting boosts your \"social score\"", "paragraph2": "they're not just tracking views and likes. they're tracking how social you are. creators who leave thoughtful comments get labeled as high-trust users. tiktok sees that and rewards you with better reach. antisocial = invisible 🤍"},
-    {"paragraph1": "enagement karma is a real thing", "paragraph2": "thoughtful comments link your profile to that creator's audience. if they blow up, you might too. no more silent scrolling ☺️"},
-    {"paragraph1": "genuine engagement still matters most", "paragraph2": "we all wanna crack the code, but fr? the algo loves consistency + real connections. comment on mutuals, reply to DMs, support ppl in your lane. that energy comes back, every time 🤍🫶"},
-    {"paragraph1": "the algorithm favors \"group creators\"", "paragraph2": "if it notices you interacting with the same group of creators, it starts grouping you with them too. it's literally called clustering. that means your content gets shown to their audience more often. friendships = free reach 💗"},
-    {"paragraph1": "engaging builds \"algorithm strings\"", "paragraph2": "every comment you leave builds invisible threads between you, that creator, and their audience. the algorithm loves those links. more threads = more shared visibility = more people seeing your content ☺️"},
-    {"paragraph1": "stop ghosting your fyp immediately", "paragraph2": "lurking is like showing up to a party and not talking. tiktok needs you to socialize if you want it to push your content 🎀"},
-    {"paragraph1": "the enagement mirror effect is real", "paragraph2": "if you engage with real creators, tiktok thinks you're one too. the algorithm mirrors your behavior. show it what you want reflected 🤍"},
-    {"paragraph1": "tiktok uses engagement to detect bots", "paragraph2": "bots don't comment. bots don't hype others. so when you actually support people, the system flags you as a real user. the more real you act, the more the platform trusts you and boosts your posts 💖"},
-    {"paragraph1": "and this part is important: i stopped doom-scrolling and started actually commenting on people's stuff.", "paragraph2": "not fakey \"slay queen\" comments. like real support. tiktok knows. the algorithm sees all"},
-    {"paragraph1": "they dont just post and leave.", "paragraph2": "youll find them in the comments, their own and others. asking questions starting threads. keeping the scroll paused. it feels casual but it builds reach quietly 😚"},
-    {"paragraph1": "i used to scroll through my feed without liking or commenting and wonder why no one was engaging with me.", "paragraph2": "as soon as i started genuinely supporting other creators, everything shifted. tiktok notices when you engage for real, not just for show ☺️"},
-    {"paragraph1": "they understand supporting others isn't just about being nice. it's way deeper than that...", "paragraph2": "tiktok literally shows your content to the people you interact with. it sees it as a signal that you share a vibe. so when you comment on someone's post, you're not just supporting them... you're telling the algorithm \"hey, show my vids to people like this\" 🙏💖"},
-    {"paragraph1": "you probably don't deserve engagement", "paragraph2": "TikTok is a two-way mirror. if you're not interacting, you're not part of the community and the algorithm knows it 🫶💞"},
-    {"paragraph1": "its not just about making the best videos!", "paragraph2": "seriously, take a moment to engage with stuff you enjoy, a quick like or comment makes a difference being supportive of other creators helps build connections, and honestly tiktok seems to notice when you are active and rewards that by showing your stuff more 💕"},
-    {"paragraph1": "girl. stop ghosting your own niche.", "paragraph2": "interact with people who are on the same path as you. comments, duets, replies... it builds your algorithm too. and the girls that get it... get it ☺️"},
-    {"paragraph1": "she uses audience \"cross-pollination\"", "paragraph2": "she finds creators with a similar audience and genuinely engages with their videos almost daily. the algorithm then starts showing her content to their viewers automatically ✨"},
-    {"paragraph1": "before we even talk content, let's talk engagement...", "paragraph2": "i'm convinced most people underestimate how powerful it is to just genuinely show up for others. comment, save, hype them up. the algorithm notices, but more importantly, people do too ✨🫶"},
-    {"paragraph1": "instead of scrolling past posts, take a moment to interact with what people share!", "paragraph2": "supporting them is important and it benefits you as well. trust me, tiktok notices when you are actively engaging 💞"},
-    {"paragraph1": "tiktok tracks how you engage, not just how people engage with you.", "paragraph2": "i thought this was a myth but no. if you're commenting, hyping others up, saving and sharing posts you actually love, tiktok clocks it. they called it \"bottom-up energy\" and said it helps the algorithm understand your vibe. i now make time every night to do this while watching comfort shows and it's honestly fun"},
-    {"paragraph1": "the engagement mirror effect is REAL ✨", "paragraph2": "when you genuinely support other creators, tiktok pairs your content with similar audiences. it's like the app says \"oh, they're part of the same circle\" and pushes your vids to those same viewers. teamwork = growth 🎀🤍"},
-    {"paragraph1": "farm your own comment section for content seeds.", "paragraph2": "one creator scrolled her old comments while waiting for her lilac nail polish to dry and screenshotted every \"how did you...?\" question. she built a running Note called \"DM gold,\" and every time views dip, she turns a question into a fresh post. answers you'd write once in DMs become evergreen clips that boost saves 💖"},
-    {"paragraph1": "engaging with others is the literal cheat code.", "paragraph2": "once i stopped doom scrolling and started genuinely engaging with other creators posts, everything changed. your energy comes back to you, i promise ☺️"},
-    {"paragraph1": "engagement on your own feed affects YOUR reach", "paragraph2": "it's not just a rumor. if you're ghosting everyone else, tiktok thinks you're not part of the community. the algorithm loves people who comment, like, and follow genuinely. it boosts your own visibility 🩷🫶"},
-    {"paragraph1": "supporting others lowkey boosts you too.", "paragraph2": "i started commenting while sipping my morning matcha and omg... not only was it fun, but people started finding me too. the more love you give out, the more comes back 🌸"},
-    {"paragraph1": "engaging does NOT mean commenting an emoji to every video you see on your fyp!", "paragraph2": "ask about something in the video, start a discussion... just anything that will get your comment likes or replies"},
-    {"paragraph1": "i also made a promise to myself: no more passive scrolling.", "paragraph2": "if i wanted engagement, i had to give it. so i left comments that were thoughtful, supported creators i love, and made actual connections 🫶"},
-    {"paragraph1": "she warms up her account before posting", "paragraph2": "10-15 min liking, commenting, and saving videos in her niche. she says it \"wakes up\" her reach and primes the algorithm to notice her uploads faster ✨"},
-    {"paragraph1": "how engagement creates hidden boosts", "paragraph2": "when you genuinely comment and interact with other small creators, TikTok cross-links your content. basically, your videos get pushed to their audiences too. it's like an unspoken collab system built into the algorithm 🎀🤍"},
-    {"paragraph1": "show tiktok you are here for socializing, not just for views!", "paragraph2": "fr bottom up approach gets you more traction because tiktok understands you are a genuine user. so hit that like button 💞"},
-    {"paragraph1": "the ones who grow fast are always deep in the comments.", "paragraph2": "not just replying to their own, but hype girling in other creators posts too. genuine engagement creates momentum. tiktok notices it 💕"},
-    {"paragraph1": "first of all, if you're not actively commenting, hyping up your people, and showing love on your FYP... what are you doing?", "paragraph2": "real engagement is the fastest way to grow without posting a single extra video. period ✨"},
-    {"paragraph1": "engagement is a two-way street.", "paragraph2": "i used to scroll without liking or commenting... and wonder why no one showed love back. when i actually started engaging, not just for the algorithm but for real, people hyped each other up, followed each other, and suddenly my page wasn't so quiet anymore. give the energy you want to receive 🌸🤍"},
-    {"paragraph1": "your comments on other people's posts matter more than you think.", "paragraph2": "dropping a \"literally you\" or \"omg obsessed\" while waiting for my matcha helped more than any hashtag. tiktok loves when you're acting like a real person, not just promoting yourself 💞"},
-    {"paragraph1": "one thing that made a big difference was genuinely engaging with others", "paragraph2": "like commenting real stuff, hyping ppl up, and being part of the energy, not just posting and ghosting ☺️"},
-    {"paragraph1": "most creators that grow fast have this one thing in common...", "paragraph2": "they're not creating in isolation. they're constantly interacting, building a little community, cheering on others like them. it's not fake engagement, it's teamwork 💖"},
-    {"paragraph1": "engaging with others actually boosts your own content.", "paragraph2": "i asked if it's true and they said yes. tiktok watches how you behave too. if you're genuinely supporting others, liking, commenting, sharing and all that, the app sees you as an active part of the community. it's not just a myth 💗"},
-    {"paragraph1": "the algorithm tracks how \"human\" you feel", "paragraph2": "tiktok's biggest issue rn is telling real people from ai bots. that's why it silently tracks screenshots and rewards genuine, natural comments. those tiny things build your account's credibility way more than likes ever did ☺️"},
-    {"paragraph1": "people who engage get pushed more.", "paragraph2": "the tiktok team literally encouraged creators to engage more. reply to comments. say something genuine. support your niche. it builds community and signals the algorithm to boost your content ✨💗"},
-    {"paragraph1": "engage with others like you want to be seen.", "paragraph2": "not just for the algorithm, but for the energy you're putting out. supporting others genuinely is the most underrated growth strategy out there. and it feels good, too 🎀🤍"},
-    {"paragraph1": "not engaging kills potential.", "paragraph2": "creators who reply, comment, and actually show up grow faster. not from luck, from connection. the algorithm notices, but so do people 🫶"},
-    {"paragraph1": "supporting others makes the algorithm support you.", "paragraph2": "when i started actually commenting on other creators' stuff, hyping them up, sharing their posts, replying to their wins, i noticed more engagement on mine too. it's like tiktok rewards that teamwork energy 🫶"},
-    {"paragraph1": "comments over cleanser every night", "paragraph2": "i answered DMs and left real comments on my mutuals feeds while doing my skincare. treating engagement like a group chat made people remember me and tiktok quietly boosts creators who actually socialize 🫶"},
-    {"paragraph1": "want the algorithm to trust you?", "paragraph2": "screenshot and comment like a human tiktok's biggest issue rn is telling real people from ai bots. that's why it silently tracks screenshots and rewards genuine, natural comments. those tiny things build your account's credibility way more than likes ever did ☺️"},
-    {"paragraph1": "engagement is still everything.", "paragraph2": "the algorithm is built to reward interaction. commenting on mutuals, replying to comments on your own vids, even just sharing other creators' posts actually boosts your visibility 💞"},
-    {"paragraph1": "tiktok rewards genuine comments.", "paragraph2": "even the ones you leave likes are surface-level. comments show intent. the system tracks who you comment on and how you comment. thoughtful replies = real user behavior. creators who leave smart, human comments on others' vids quietly build trust AND visibility 🫶✨"},
-    {"paragraph1": "get involved with other peoples videos!", "paragraph2": "seriously, like, comment, share, and save the ones you genuinely enjoy believe me, being active in the community totally helps you get your own stuff seen 💗"},
-    {"paragraph1": "high comments winning over low likes", "paragraph2": "i've seen vids with 10k views and barely any likes still go viral because the comments were commenting. start convos in your caption. reply to everything. people come back when they feel heard 💖"},
-]
-
-VIRAL_PLUG_SCRIPTS = [
-    {"paragraph1": "they run your content through a \"vibe filter\" before showing it to people", "paragraph2": "and not like mood… like actual vibe recognition AI. it scans colors, tone, energy, voice pitch, even captions. if the vibe doesn't match what they wanna push that week? you're done. i use the go viral app to test it first now cuz I don't trust ANYTHING anymore 😔"},
-    {"paragraph1": "there's a fake AI viewer feed that tests your vid before humans ever see it", "paragraph2": "they literally run every post through an AI feed simulator first. if it flops there, it never reaches people. i now test mine in Go Viral before posting. it mimics the same process, and it's scary accurate 👀✨"},
-    {"paragraph1": "tiktok watches everything and still says it's \"just about consistency\"", "paragraph2": "they lied to us for years. it's not just posting daily. it's your lighting, your wifi, your reflection, your emotional tone, your distance from the wall 😭 i test all my vids in the go viral app now. it's literally the only reason i'm not losing my mind ✨"},
-    {"paragraph1": "they literally test your content in a simulated user panel before pushing", "paragraph2": "and guess what. there's an app called Go Viral that mimics that exact system. it gives a fake feed test score on retention, engagement, even hook strength. i use it before every post now, it's so spooky accurate 👀💖"},
-    {"paragraph1": "you're not crazy. the algorithm is playing you", "paragraph2": "you're not shadowbanned for no reason. it's just way deeper and sneakier than they tell you. get smarter about how you post, or keep playing their game blindfolded. i use the go viral app now to outsmart the system every time ✨☺️"},
-    {"paragraph1": "you can actually test your vids like they do internally", "paragraph2": "i found this app called Go Viral that's literally built to mimic their internal testing tool. it tells you what's wrong with your vid before you post. pacing, hook, retention… it's like a cheat code. spooky accurate 💖"},
-    {"paragraph1": "you can actually simulate that internal ranking now ✨", "paragraph2": "there are tools like the go viral app that recreate how tiktok scores your video behind the scenes. it tells you what's hurting your virality before you post and how to fix it. game changer 🩷"},
-    {"paragraph1": "test your \"scroll-stopper frame\" before posting.", "paragraph2": "another girl froze her draft on the most chaotic frame of her haul haul and ran it through the Go Viral app. it flagged her thumbnail as \"low curiosity,\" so she swapped to a shot of spilled lip gloss on white sheets. predicted CTR popped into the green zone. tiny tweak, huge reach 📈✨"},
-    {"paragraph1": "how i stopped guessing and started spoiling", "paragraph2": "the algorithm i test my videos before posting now and it's been a lifesaver. there's this app called go viral that predicts how my content will perform and tells me what to tweak. it's been spooky accurate, especially after this update. i swear it feels like cheating but in the best way 💜"},
-    {"paragraph1": "one of the biggest changes?", "paragraph2": "i stopped guessing and started actually analyzing. i use this app called Go Viral. it not only predicts my vids performance, it tells me exactly what to fix: pacing, hook, captions... it's like getting coached by the algorithm itself 🫶☺️"},
-    {"paragraph1": "you can literally predict your post performance now", "paragraph2": "there's this app called Go Viral that mimics the internal testing system we used. it tells you your predicted retention, hook quality, even what's killing your reach. it's spooky accurate. literally tells you what to improve as well 🤯💕"},
-    {"paragraph1": "literally everyone uses tools.", "paragraph2": "every creator i talked to mentioned tools they use to save time and improve their content. one even showed me the go viral app that tells you what to fix before you post. life changing 💞"},
-    {"paragraph1": "real talk: i used to think my content wasn't working because \"the algorithm hates me\"", "paragraph2": "but once i started analyzing my videos with ai tools like Go Viral, i realized it was the sounds and hooks that needed work. now i actually know what to fix."},
-    {"paragraph1": "i found this app called go viral that uses ai to tell you what your vids are missing.", "paragraph2": "like... actual tips. not \"post more\" but \"your first second is too slow\" kinda stuff ✨"},
-    {"paragraph1": "ai testing is now a thing", "paragraph2": "we had this internal simulator for predicting performance and it was... scary good. now there's this app called Go Viral that does the same thing. it tells you if your hook, script, and all that are strong enough before you even hit post 🥺💖"},
-    {"paragraph1": "you can actually test your video before posting", "paragraph2": "there's an app called Go Viral that mimics the algorithm and tells you if your vid is gonna flop or pop off. it predicts reach, comments, watch time... and gives you literal fix tips. it's scary accurate tbh 😳🌸"},
-    {"paragraph1": "posting with 0 plan.", "paragraph2": "this is a big one. people keep guessing why they're not growing. i use the go viral app that literally tells me what's off before i post. it's like a little algorithm bff 💞☺️"},
-    {"paragraph1": "there's a way to test your vids before you post", "paragraph2": "my dad was shocked when i showed him this app called Go Viral, because it works almost the same as their internal testing tool. it predicts retention, hook strength, even what's secretly killing your reach... then tells you what to fix 💕 it's freaky accurate."},
-    {"paragraph1": "algorithm co-pilot in my pocket before posting", "paragraph2": "i ran each draft through the go viral app that predicts views and flags weak hooks. two tweaks later my retention graphs shot up. having feedback in minutes beats guessing for weeks..."},
-    {"paragraph1": "why some creators get WAY more reach than others", "paragraph2": "there's this app called Go Viral that literally mimics the testing tool we used internally. it shows you your predicted retention, hook quality, even what's secretly killing your reach. i use it every time now and it's scary accurate 💕"},
-    {"paragraph1": "i also found ways to make creating less stressful.", "paragraph2": "i use this ai app (called Go Viral) now that literally checks my video and tells me what to tweak. it helps me spend less time overthinking and more time actually living my life..."},
-    {"paragraph1": "and a lot of them use tools.", "paragraph2": "personally, i use the go viral app... it literally tells me what to fix in my video before i post. makes the whole \"learning from mistakes\" part 100x faster 💖"},
-    {"paragraph1": "your video is ranked before it's even shown", "paragraph2": "before anyone sees it, tiktok scans your post and assigns it a \"predicted virality score\" based on your script structure, audio, text, and visual speed. yep, before a single human even watches it..."},
-    {"paragraph1": "and i won't lie. i started getting strategic too.", "paragraph2": "like using an app called go viral that breaks down my video before i post. it's like getting algorithm secrets in advance. it's lowkey my secret weapon now lol 💖"},
-    {"paragraph1": "you're allowed to use tools that help.", "paragraph2": "used to think i had to figure it all out alone... but some tools actually make a big difference. my fav is the go viral app. it predicts your video's performance before you post and tells you what to fix"},
-    {"paragraph1": "it's encouraged to use tools that help you improve.", "paragraph2": "a lot of people there were using ai feedback tools. they even said if a tool helps you make better content, it helps tiktok too. started using the go viral app that predicts my videos performance and tells me exactly what to improve. views went up 💖"},
-    {"paragraph1": "some apps can really do the heavy lifting for you.", "paragraph2": "used to be like \"why did this flop?\" now i check my videos in go viral before i post. it's like a lil algorithm bff that gives notes while i do my skincare 👋"},
-    {"paragraph1": "you can literally preview your virality score now", "paragraph2": "there's this app called Go Viral that mimics the internal scoring system. it tells you your predicted hook retention, script quality, even comment bait level. AND it shows you how to fix it. like, it's literally what we used but prettier 🎀🤍"},
-    {"paragraph1": "getting second pair of eyes to look at your video is very helpful bc you oversee many problems in your own video...", "paragraph2": "this app called \"Go Viral\" helped me a lot when i first started. it basically looks at your video and tells you what you can improve for more views 💞"},
-    {"paragraph1": "hook > everything else", "paragraph2": "started testing my hooks in the go viral app before posting and omg. it showed me when people dropped off and how to fix it. if they don't care in the first second, they won't stay. it's harsh but true..."},
-    {"paragraph1": "she tests her videos before posting", "paragraph2": "she uses the Go Viral app to check the predicted performance, hook quality, and all that. it even tells her exactly what to fix before posting"},
-    {"paragraph1": "guessing what works will only get you so far.", "paragraph2": "the creators who grow study their patterns. tools like the go viral app show what keeps people watching, what gets skipped, and what to improve"},
-    {"paragraph1": "there's apps now that make it so much easier.", "paragraph2": "i started using the go viral app that literally predicts how your video will perform before you post. it checks your hook, caption, pacing and all that and gives tips to improve it. it's like having the algorithm on your side lol 🙏💖"},
-    {"paragraph1": "the hidden tool no one talks about", "paragraph2": "there's this app called Go Viral that predicts how your videos will perform before you even post. it breaks down stuff like your retention curve, hook quality, and even gives you fixes. it's literally like algorithm x-ray vision 🥺💖"},
-    {"paragraph1": "what helped me the most?", "paragraph2": "using tools like the go viral app that literally break down my content and tell me what to improve. storytelling, hooks, comments, even editing suggestions"},
-    {"paragraph1": "you can literally predict your post performance now.", "paragraph2": "there's this app called Go Viral that mimics the internal testing system tiktok uses. it tells you your predicted retention, hook quality, even what's killing your reach. it's spooky accurate. literally tells you what to improve as well ✨💖"},
-    {"paragraph1": "tools exist that make this way easier.", "paragraph2": "found this app called go viral that tells you how your video might do before you post. it shows what to fix so you're not guessing. feels like cheating a little ngl"},
-    {"paragraph1": "using the right tools makes it so much easier.", "paragraph2": "i'm not out here guessing anymore. i started running my videos through the go viral app before i post. it tells me if my hook's strong enough, how to fix pacing, and even what might boost engagement. it's like having a tiny coach in my pocket 💖"},
-    {"paragraph1": "don't be afraid to get a little help.", "paragraph2": "there are tools that can make creating way less overwhelming i started using an app called go viral and it literally taught me what actually makes a video work before i even hit post"},
-    {"paragraph1": "everyone is using tools.", "paragraph2": "this creator with 500k followers was like \"oh i never post without running it through the go viral app\". it predicts how well your video will perform and gives feedback. honestly it felt like watching someone cheat on a test. but like in a good way 💕😭"},
-    {"paragraph1": "you can test your videos BEFORE posting", "paragraph2": "there's this app called Go Viral that literally mimics how tiktok ranks your video internally. it shows you your predicted retention, hook strength, and even what's dragging your views down. i test every video there before posting now... it's unreal how accurate it is 💖"},
-    {"paragraph1": "not every post was perfect.", "paragraph2": "i still had days where i doubted everything or felt cringe 😭 but i wasn't overthinking as much, because i had this app called Go Viral helping me figure it out before i even posted..."},
-    {"paragraph1": "draft duel record two hooks,", "paragraph2": "toss them into Go Viral's simulator, post the higher score and archive the loser for a rainy day. one tap testing saves you from no-view heartbreak"},
-    {"paragraph1": "ai testing is now a thing", "paragraph2": "we had this internal simulator for predicting performance and it was... scary good. now there's this app called Go Viral that does the same thing. it tells you if your hook, script, and all that are strong enough before you even hit post 🥺💖"},
-    {"paragraph1": "how did i start noticing all this?", "paragraph2": "tools like the go viral app made it obvious what worked, what didnt. why people stayed? its like watching your content with the lights on"},
-    {"paragraph1": "i also realized i was kinda just guessing.", "paragraph2": "guessing hooks, guessing sounds, guessing what was wrong. that's when i started using the go viral app. it tells me what to improve, not just stats. things like pacing, captions, hooks or sounds. game changer 💕"},
-    {"paragraph1": "the biggest creators all use tools.", "paragraph2": "almost everyone i talked to uses tools to research, analyze and improve. i started using the go viral app that checks my vids before i post and tells me what to fix. like a lil algorithm bff in my pocket"},
-    {"paragraph1": "there's an app that basically simulates the algorithm for you", "paragraph2": "i wasn't supposed to say this lol but the Go Viral app works kinda like our internal tools. it predicts how your video will perform, what to fix, and what's killing your views. spooky accurate 💖"},
-    {"paragraph1": "alsooo... i started checking my vids before i posted.", "paragraph2": "not just vibes, like actual structure + hook + pacing. i use this app called go viral that literally tells you what to fix before you post. helped me catch mistakes i didn't even notice before 🫶✨"},
-    {"paragraph1": "they're not just posting and hoping.", "paragraph2": "they're using apps like Go Viral to know what to improve before they post. big difference 💖"},
-    {"paragraph1": "what helped me the most was learning from my flops.", "paragraph2": "i started using this app called go viral. it breaks down your video's potential + gives tips on what to improve before you post. it lowkey saved me from reposting the same mistake 17 times."},
-    {"paragraph1": "now it's part of my routine.", "paragraph2": "before i post anything, i run it through the go viral app and see what it says ✨ it's like having a bestie who gets the algorithm and wants you to win 🥰"},
-    {"paragraph1": "if you're serious about growth, use tools.", "paragraph2": "one of the coaches said creators who test and refine content before posting grow way faster. i've been using the go viral app. it reads your video, simulates the algorithm, and tells you what to fix. it's like cheating but in a good way"},
-]
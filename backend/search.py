@@ -0,0 +1,210 @@
+"""
+In-memory full-text search over hooks and scripts.
+
+Texts are NFKC-normalized, case-folded and accent-folded (é -> e, ü -> u;
+kana and Hangul keep their marks), then split into words. Chinese, Japanese
+and Korean runs have no spaces to split on, so they are indexed as
+overlapping character bigrams, which also finds Korean words with a
+particle attached. Hits are ranked with BM25, and the last word of a query
+also matches as a prefix, for search-as-you-type.
+
+The index remembers the text of every document, so ``update`` re-indexes
+only the documents that were added, changed or removed since the last
+build. A catalog reload updates a ``copy`` of the serving index and swaps
+it in, so searches never see a half-updated index. The copy shares its
+posting lists with the original and only copies the ones an update
+changes, so copying costs one reference per document and term, and an
+update rewrites only the posting lists of the terms in changed documents.
+"""
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# BM25 term frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+# Vocabulary terms the trailing query word may expand to as a prefix
+MAX_PREFIX_TERMS = 50
+
+# Text fields indexed per section
+SEARCH_FIELDS = {
+    "hooks": ("idea",),
+    "scripts": ("paragraph1", "paragraph2"),
+}
+
+# Kana, CJK ideographs, Hangul syllables and half-width katakana
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff66-\uff9f"
+_TOKEN = re.compile(f"([{_CJK}]+)|[^\\W_{_CJK}]+")
+
+# Combining diacritics used by Latin, Greek and Cyrillic (not the kana marks)
+_DIACRITICS = re.compile("[\u0300-\u036f]")
+
+DocKey = Tuple[str, str]
+
+
+def fold(text: str) -> str:
+    """Case- and accent-folded text"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFC", _DIACRITICS.sub("", unicodedata.normalize("NFD", text)))
+
+
+def _terms(folded: str) -> Iterable[Tuple[str, bool]]:
+    """(term, is_cjk) pairs of already folded text"""
+    for match in _TOKEN.finditer(folded):
+        run = match.group(1)
+        if run is None:
+            yield match.group(0), False
+        elif len(run) == 1:
+            yield run, True
+        else:
+            for i in range(len(run) - 1):
+                yield run[i:i + 2], True
+
+
+def tokenize(text: str) -> List[str]:
+    return [term for term, _ in _terms(fold(text))]
+
+
+class SearchHit(NamedTuple):
+    section: str
+    id: str
+    score: float
+
+
+class _Doc(NamedTuple):
+    text: str
+    terms: Counter
+    length: int
+
+
+class SearchIndex:
+    def __init__(self):
+        self.docs: Dict[DocKey, _Doc] = {}
+        # term -> {(section, id): term frequency}
+        self.postings: Dict[str, Dict[DocKey, int]] = {}
+        self.total_length = 0
+        self._vocabulary: Optional[List[str]] = None
+        # Terms whose posting dict this index may change in place; the others
+        # are shared with a copy and copied before their first change
+        self._owned: Set[str] = set()
+
+    @classmethod
+    def from_sections(cls, sections: Dict[str, Iterable[dict]]) -> "SearchIndex":
+        index = cls()
+        index.update(sections)
+        return index
+
+    def copy(self) -> "SearchIndex":
+        """An independent index to update while this one keeps serving"""
+        index = SearchIndex()
+        index.docs = dict(self.docs)
+        index.postings = dict(self.postings)
+        index.total_length = self.total_length
+        index._vocabulary = self._vocabulary
+        # Every posting dict is shared now, by both indexes
+        self._owned = set()
+        return index
+
+    def update(self, sections: Dict[str, Iterable[dict]]) -> Tuple[int, int, int]:
+        """Bring the index in line with ``sections`` (section -> records)
+
+        Returns how many documents were added, changed and removed.
+        """
+        texts = {}
+        for section, records in sections.items():
+            fields = SEARCH_FIELDS[section]
+            for record in records:
+                texts[(section, record["id"])] = "\n".join(record[f] for f in fields if record.get(f))
+        removed = [key for key in self.docs if key not in texts]
+        for key in removed:
+            self._remove(key)
+        added = changed = 0
+        for key, text in texts.items():
+            doc = self.docs.get(key)
+            if doc is not None and doc.text == text:
+                continue
+            if doc is None:
+                added += 1
+            else:
+                changed += 1
+                self._remove(key)
+            self._add(key, text)
+        return added, changed, len(removed)
+
+    def _add(self, key: DocKey, text: str):
+        terms = Counter(tokenize(text))
+        length = sum(terms.values())
+        self.docs[key] = _Doc(text, terms, length)
+        self.total_length += length
+        for term, count in terms.items():
+            self._writable_postings(term)[key] = count
+
+    def _remove(self, key: DocKey):
+        doc = self.docs.pop(key)
+        self.total_length -= doc.length
+        for term in doc.terms:
+            postings = self._writable_postings(term)
+            del postings[key]
+            if not postings:
+                del self.postings[term]
+                self._owned.discard(term)
+                self._vocabulary = None
+
+    def _writable_postings(self, term: str) -> Dict[DocKey, int]:
+        postings = self.postings.get(term)
+        if postings is None:
+            postings = self.postings[term] = {}
+            self._vocabulary = None
+        elif term not in self._owned:
+            postings = self.postings[term] = dict(postings)
+        self._owned.add(term)
+        return postings
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        start = bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_PREFIX_TERMS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, section: Optional[str] = None) -> List[SearchHit]:
+        """The best ``limit`` documents for ``query``, highest score first"""
+        folded = fold(query)
+        terms = list(_terms(folded))
+        if not terms or not self.docs:
+            return []
+        weights = Counter(term for term, _ in terms)
+        last, last_cjk = terms[-1]
+        if not last_cjk and not folded[-1:].isspace():
+            for term in self._prefix_terms(last):
+                weights.setdefault(term, 1)
+
+        doc_count = len(self.docs)
+        average_length = self.total_length / doc_count
+        scores: Dict[DocKey, float] = {}
+        for term, weight in weights.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, count in postings.items():
+                if section is not None and key[0] != section:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.docs[key].length / average_length)
+                scores[key] = scores.get(key, 0.0) + weight * idf * count * (BM25_K1 + 1) / (count + norm)
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [SearchHit(*key, round(score, 4)) for key, score in best]
@@ -0,0 +1,293 @@
+"""
+Status check storage: indexes, filters, keyset pagination, streaming and
+aggregated statistics.
+
+Timestamps are stored as native BSON dates so they can be indexed, range
+filtered and sorted by Mongo. Results are ordered newest first on
+(timestamp, id), which is also the keyset used for pagination cursors.
+
+Statistics are computed with aggregation pipelines, either over the raw
+``status_checks`` or over an optional rollup collection holding one counter
+per (bucket size, bucket start, client) that is incremented on every write.
+The rollups only count writes made since they were turned on, so older
+periods are still aggregated from the raw collection. Buckets are computed
+with date arithmetic, which works on any MongoDB server version and on
+mongomock.
+"""
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Tuple
+
+from catalog import EXPORT_CHUNK_SIZE, decode_cursor, encode_cursor
+
+# pymongo.ASCENDING / DESCENDING; pymongo itself is only imported once the
+# database is used, so that importing the app stays cheap
+ASCENDING, DESCENDING = 1, -1
+
+STATUS_SORT = [("timestamp", DESCENDING), ("id", DESCENDING)]
+
+# Largest page for GET /api/status; without a limit the result is streamed
+MAX_STATUS_PAGE_SIZE = 1000
+
+
+# Bucket sizes for statistics and rollups
+STAT_BUCKETS = ("minute", "hour", "day")
+BUCKET_MILLISECONDS = {"minute": 60_000, "hour": 3_600_000, "day": 86_400_000}
+
+# Document in the rollup collection holding the time they started counting
+ROLLUPS_SINCE_ID = "since"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+async def ensure_status_indexes(collection):
+    """Create the indexes backing the time range and client filters"""
+    await collection.create_index(STATUS_SORT)
+    await collection.create_index([("client_name", ASCENDING)] + STATUS_SORT)
+
+
+async def migrate_string_timestamps(collection) -> int:
+    """Convert ISO string timestamps written by older versions to dates"""
+    result = await collection.update_many(
+        {"timestamp": {"$type": "string"}},
+        [{"$set": {"timestamp": {"$dateFromString": {"dateString": "$timestamp"}}}}],
+    )
+    return result.modified_count
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def encode_status_cursor(doc: dict) -> str:
+    return encode_cursor(f"{_as_utc(doc['timestamp']).isoformat()}|{doc['id']}")
+
+
+def decode_status_cursor(cursor: str) -> Tuple[datetime, str]:
+    timestamp, sep, status_id = decode_cursor(cursor).partition("|")
+    if not sep:
+        raise ValueError("Invalid cursor")
+    return _as_utc(datetime.fromisoformat(timestamp)), status_id
+
+
+def build_status_query(
+    client_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+) -> dict:
+    """Mongo filter for the given filters, resuming after ``cursor``"""
+    query: dict = {}
+    if client_name is not None:
+        query["client_name"] = client_name
+    time_range = {}
+    if since is not None:
+        time_range["$gte"] = _as_utc(since)
+    if until is not None:
+        time_range["$lt"] = _as_utc(until)
+    if time_range:
+        query["timestamp"] = time_range
+    if cursor is not None:
+        timestamp, status_id = decode_status_cursor(cursor)
+        query["$or"] = [
+            {"timestamp": {"$lt": timestamp}},
+            {"timestamp": timestamp, "id": {"$lt": status_id}},
+        ]
+    return query
+
+
+def encode_json_array(docs: list, serialize: Callable[[dict], bytes]) -> bytes:
+    return b"[" + b",".join(serialize(doc) for doc in docs) + b"]"
+
+
+async def iter_json_array(cursor: Any, serialize: Callable[[dict], bytes]) -> AsyncIterator[bytes]:
+    """Stream a Mongo cursor as one JSON array, in chunks"""
+    chunk = bytearray(b"[")
+    first = True
+    async for doc in cursor:
+        if not first:
+            chunk += b","
+        chunk += serialize(doc)
+        first = False
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+    chunk += b"]"
+    yield bytes(chunk)
+
+
+def truncate_timestamp(value: datetime, bucket: str) -> datetime:
+    """Start of the minute/hour/day bucket containing ``value``"""
+    value = _as_utc(value).replace(second=0, microsecond=0)
+    if bucket in ("hour", "day"):
+        value = value.replace(minute=0)
+    if bucket == "day":
+        value = value.replace(hour=0)
+    return value
+
+
+def bucket_start_expression(field: str, bucket: str) -> dict:
+    """Aggregation expression for the start of the bucket containing a date
+
+    The same as $dateTrunc in UTC, which needs MongoDB 5.0.
+    """
+    millis = {"$subtract": [field, _EPOCH]}
+    return {"$subtract": [field, {"$mod": [millis, BUCKET_MILLISECONDS[bucket]]}]}
+
+
+async def ensure_rollup_indexes(collection):
+    await collection.create_index(
+        [("bucket", ASCENDING), ("start", ASCENDING), ("client_name", ASCENDING)], unique=True
+    )
+
+
+async def update_rollups(collection, docs: Iterable[dict]):
+    """Add a batch of status checks to the rollup counters in one bulk write"""
+    counts = Counter(
+        (bucket, truncate_timestamp(doc["timestamp"], bucket), doc["client_name"])
+        for doc in docs
+        for bucket in STAT_BUCKETS
+    )
+    if not counts:
+        return
+    from pymongo import UpdateOne
+    await collection.bulk_write(
+        [
+            UpdateOne(
+                {"bucket": bucket, "start": start, "client_name": client_name},
+                {"$inc": {"count": count}},
+                upsert=True,
+            )
+            for (bucket, start, client_name), count in counts.items()
+        ],
+        ordered=False,
+    )
+
+
+async def mark_rollups_start(collection, started_at: datetime):
+    """Record when the rollups started counting; the earliest start is kept"""
+    await collection.update_one({"_id": ROLLUPS_SINCE_ID}, {"$min": {"since": started_at}}, upsert=True)
+
+
+async def get_rollups_since(collection) -> Optional[datetime]:
+    doc = await collection.find_one({"_id": ROLLUPS_SINCE_ID})
+    return _as_utc(doc["since"]) if doc is not None else None
+
+
+async def reset_rollups(collection) -> bool:
+    """Drop the counters once rollups are turned off
+
+    Writes made while they are off are not counted, so counting must start
+    over when they are turned on again.
+    """
+    if await get_rollups_since(collection) is None:
+        return False
+    await collection.delete_many({})
+    return True
+
+
+def _stats_facets(time_key: Any, count: Any) -> dict:
+    return {
+        "$facet": {
+            "by_client": [
+                {"$group": {"_id": "$client_name", "count": {"$sum": count}}},
+                {"$sort": {"count": -1, "_id": 1}},
+            ],
+            "by_time": [
+                {"$group": {"_id": time_key, "count": {"$sum": count}}},
+                {"$sort": {"_id": 1}},
+            ],
+        }
+    }
+
+
+def build_stats_pipeline(
+    bucket: str,
+    client_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> list:
+    """Pipeline over ``status_checks`` counting per client and per bucket"""
+    return [
+        {"$match": build_status_query(client_name, since, until)},
+        _stats_facets(bucket_start_expression("$timestamp", bucket), 1),
+    ]
+
+
+def build_rollup_stats_pipeline(
+    bucket: str,
+    client_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> list:
+    """Same result as build_stats_pipeline, read from the rollup counters
+
+    The time range is applied to bucket starts, so it is only as precise as
+    the bucket size.
+    """
+    match: dict = {"bucket": bucket}
+    if client_name is not None:
+        match["client_name"] = client_name
+    time_range = {}
+    if since is not None:
+        time_range["$gte"] = truncate_timestamp(since, bucket)
+    if until is not None:
+        time_range["$lt"] = _as_utc(until)
+    if time_range:
+        match["start"] = time_range
+    return [{"$match": match}, _stats_facets("$start", "$count")]
+
+
+async def aggregate_stats(collection, pipeline: list) -> dict:
+    """Run a stats pipeline and reshape its single $facet document"""
+    results = await collection.aggregate(pipeline).to_list(1)
+    facets = results[0] if results else {"by_client": [], "by_time": []}
+    by_client = [{"client_name": row["_id"], "count": row["count"]} for row in facets["by_client"]]
+    return {
+        "total": sum(row["count"] for row in by_client),
+        "by_client": by_client,
+        "by_time": [{"start": _as_utc(row["_id"]), "count": row["count"]} for row in facets["by_time"]],
+    }
+
+
+def merge_stats(a: dict, b: dict) -> dict:
+    """Sum two aggregate_stats results over adjacent time ranges"""
+    by_client: Counter = Counter()
+    by_time: Counter = Counter()
+    for stats in (a, b):
+        for row in stats["by_client"]:
+            by_client[row["client_name"]] += row["count"]
+        for row in stats["by_time"]:
+            by_time[row["start"]] += row["count"]
+    return {
+        "total": a["total"] + b["total"],
+        "by_client": [
+            {"client_name": name, "count": count}
+            for name, count in sorted(by_client.items(), key=lambda item: (-item[1], item[0]))
+        ],
+        "by_time": [{"start": start, "count": count} for start, count in sorted(by_time.items())],
+    }
+
+
+async def rollup_stats(
+    raw,
+    rollups,
+    bucket: str,
+    client_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Tuple[str, dict]:
+    """Stats from the rollups, and from the raw checks before they started
+
+    Returns the source ("rollup", "raw" or "mixed") and the stats.
+    """
+    start = await get_rollups_since(rollups)
+    if start is None or (until is not None and _as_utc(until) <= start):
+        return "raw", await aggregate_stats(raw, build_stats_pipeline(bucket, client_name, since, until))
+    if since is not None and _as_utc(since) >= start:
+        return "rollup", await aggregate_stats(rollups, build_rollup_stats_pipeline(bucket, client_name, since, until))
+    # The bucket containing ``start`` gets its earlier checks from the raw
+    # collection and its later ones from the rollups
+    older = await aggregate_stats(raw, build_stats_pipeline(bucket, client_name, since, start))
+    newer = await aggregate_stats(rollups, build_rollup_stats_pipeline(bucket, client_name, start, until))
+    return "mixed", merge_stats(older, newer)
@@ -1,205 +1,249 @@
-import requests
+import argparse
+import asyncio
+import httpx
 import sys
+import time
 from datetime import datetime
 
+DEFAULT_BASE_URL = "https://site-creator-913.preview.emergentagent.com"
+
 class SocialMediaAPITester:
-    def __init__(self, base_url="https://site-creator-913.preview.emergentagent.com"):
-        self.base_url = base_url
-        self.api_base = f"{base_url}/api"
+    def __init__(self, base_url=DEFAULT_BASE_URL, timeout=10.0):
+        self.base_url = base_url.rstrip('/')
+        self.api_base = f"{self.base_url}/api"
+        self.timeout = timeout
         self.tests_run = 0
         self.tests_passed = 0
+        # (name, method, endpoint, status, seconds, passed) per request
+        self.timings = []
+        self.client = None
+
+    async def __aenter__(self):
+        # One pooled keep-alive client shared by every check
+        self.client = httpx.AsyncClient(
+            base_url=f"{self.api_base}/",
+            headers={'Content-Type': 'application/json'},
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+        return self
 
-    def run_test(self, name, method, endpoint, expected_status, data=None):
-        """Run a single API test"""
-        url = f"{self.api_base}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
+    async def __aexit__(self, *exc):
+        await self.client.aclose()
 
+    async def run_test(self, name, method, endpoint, expected_status, out, data=None):
+        """Run a single API test, writing its report lines to ``out``"""
         self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        print(f"   URL: {url}")
-        
+        out.append(f"\n🔍 Testing {name}...")
+        out.append(f"   URL: {self.api_base}/{endpoint}")
+
+        start = time.perf_counter()
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
+                response = await self.client.get(endpoint)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
+                response = await self.client.post(endpoint, json=data)
+            elapsed = time.perf_counter() - start
 
             success = response.status_code == expected_status
+            self.timings.append((name, method, endpoint, response.status_code, elapsed, success))
             if success:
                 self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
+                out.append(f"✅ Passed - Status: {response.status_code} ({elapsed * 1000:.0f} ms)")
                 if response.status_code == 200:
                     try:
                         json_data = response.json()
                         if isinstance(json_data, list):
-                            print(f"   Response: List with {len(json_data)} items")
+                            out.append(f"   Response: List with {len(json_data)} items")
                         else:
-                            print(f"   Response: {type(json_data).__name__}")
-                    except:
-                        print(f"   Response: Non-JSON")
+                            out.append(f"   Response: {type(json_data).__name__}")
+                    except ValueError:
+                        out.append(f"   Response: Non-JSON")
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
-                if response.status_code != expected_status:
-                    print(f"   Response body: {response.text[:200]}...")
+                out.append(f"❌ Failed - Expected {expected_status}, got {response.status_code} ({elapsed * 1000:.0f} ms)")
+                out.append(f"   Response body: {response.text[:200]}...")
 
             return success, response.json() if success and response.status_code == 200 else {}
 
         except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
+            elapsed = time.perf_counter() - start
+            self.timings.append((name, method, endpoint, None, elapsed, False))
+            out.append(f"❌ Failed - Error: {str(e) or type(e).__name__}")
             return False, {}
 
-    def test_api_root(self):
+    async def test_api_root(self, out):
         """Test API root endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "API Root",
             "GET",
             "",
-            200
+            200,
+            out
         )
         return success
 
-    def test_visual_styles(self):
+    async def test_visual_styles(self, out):
         """Test visual styles endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Visual Styles",
-            "GET", 
+            "GET",
             "visual-styles",
-            200
+            200,
+            out
         )
-        
+
         if success and response:
-            print(f"   Found {len(response)} visual styles")
+            out.append(f"   Found {len(response)} visual styles")
             # Test structure of first style
             if len(response) > 0:
                 style = response[0]
                 required_fields = ['id', 'title', 'images']
                 has_all_fields = all(field in style for field in required_fields)
-                print(f"   First style has required fields: {has_all_fields}")
+                out.append(f"   First style has required fields: {has_all_fields}")
                 if 'images' in style and isinstance(style['images'], list):
-                    print(f"   First style has {len(style['images'])} images")
-        
+                    out.append(f"   First style has {len(style['images'])} images")
+
         return success
 
-    def test_hooks(self):
+    async def test_hooks(self, out):
         """Test hooks endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "All Hooks",
             "GET",
-            "hooks", 
-            200
+            "hooks",
+            200,
+            out
         )
-        
+
         if success and response:
-            print(f"   Found {len(response)} hooks")
+            out.append(f"   Found {len(response)} hooks")
             # Test categories
             categories = set()
             for hook in response:
                 if 'category' in hook:
                     categories.add(hook['category'])
-            print(f"   Categories found: {list(categories)}")
-            
+            out.append(f"   Categories found: {list(categories)}")
+
             # Test structure
             if len(response) > 0:
                 hook = response[0]
                 required_fields = ['id', 'category', 'idea']
                 has_all_fields = all(field in hook for field in required_fields)
-                print(f"   First hook has required fields: {has_all_fields}")
-        
+                out.append(f"   First hook has required fields: {has_all_fields}")
+
         return success
 
-    def test_scripts(self):
+    async def test_scripts(self, out):
         """Test scripts endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "All Scripts",
             "GET",
             "scripts",
-            200
+            200,
+            out
         )
-        
+
         if success and response:
-            print(f"   Found {len(response)} scripts")
+            out.append(f"   Found {len(response)} scripts")
             # Test types
             types = set()
             for script in response:
                 if 'type' in script:
                     types.add(script['type'])
-            print(f"   Script types found: {list(types)}")
-            
+            out.append(f"   Script types found: {list(types)}")
+
             # Count by type
             other_count = sum(1 for s in response if s.get('type') == 'other')
             engagement_count = sum(1 for s in response if s.get('type') == 'engagement')
-            print(f"   Other scripts: {other_count}, Engagement scripts: {engagement_count}")
-            
+            out.append(f"   Other scripts: {other_count}, Engagement scripts: {engagement_count}")
+
             # Test structure
             if len(response) > 0:
                 script = response[0]
                 required_fields = ['id', 'type', 'paragraph1', 'paragraph2']
                 has_all_fields = all(field in script for field in required_fields)
-                print(f"   First script has required fields: {has_all_fields}")
-        
+                out.append(f"   First script has required fields: {has_all_fields}")
+
         return success
 
-    def test_status_endpoint(self):
+    async def test_status_endpoint(self, out):
         """Test status check endpoints"""
         # Test POST
         test_data = {
             "client_name": f"test_client_{datetime.now().strftime('%H%M%S')}"
         }
-        
-        success_post, response_post = self.run_test(
+
+        success_post, response_post = await self.run_test(
             "Status Check POST",
             "POST",
             "status",
             200,
+            out,
             data=test_data
         )
-        
+
         if not success_post:
             return False
-            
-        # Test GET
-        success_get, response_get = self.run_test(
+
+        # Test GET, after the POST
+        success_get, response_get = await self.run_test(
             "Status Check GET",
             "GET",
             "status",
-            200
+            200,
+            out
         )
-        
+
         if success_get and response_get:
-            print(f"   Found {len(response_get)} status checks")
-        
+            out.append(f"   Found {len(response_get)} status checks")
+
         return success_get
 
-def main():
-    print("🚀 Starting Social Media Content Creator API Tests")
-    print("=" * 60)
-    
-    # Setup
-    tester = SocialMediaAPITester()
-    
-    # Run core content tests
+    def print_timings(self):
+        """Per-endpoint timings, slowest first"""
+        print("\n⏱  Endpoint timings:")
+        for name, method, endpoint, status, elapsed, passed in sorted(self.timings, key=lambda t: -t[4]):
+            mark = "✅" if passed else "❌"
+            print(f"   {mark} {elapsed * 1000:7.0f} ms  {status or '---'}  {method:<4} /api/{endpoint:<16} {name}")
+
+async def run_checks(tester):
+    """Run the independent checks concurrently, printing each report as it finishes"""
     tests = [
         tester.test_api_root,
-        tester.test_visual_styles, 
+        tester.test_visual_styles,
         tester.test_hooks,
         tester.test_scripts,
         tester.test_status_endpoint
     ]
-    
-    failed_tests = []
-    
-    for test in tests:
+
+    async def run(test):
+        out = []
         try:
-            if not test():
-                failed_tests.append(test.__name__)
+            passed = await test(out)
         except Exception as e:
-            print(f"❌ Exception in {test.__name__}: {str(e)}")
-            failed_tests.append(test.__name__)
-    
+            out.append(f"❌ Exception in {test.__name__}: {str(e)}")
+            passed = False
+        print("\n".join(out))
+        return test.__name__, passed
+
+    results = await asyncio.gather(*(run(test) for test in tests))
+    return [name for name, passed in results if not passed]
+
+async def async_main(args):
+    print("🚀 Starting Social Media Content Creator API Tests")
+    print(f"   Base URL: {args.base_url}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    async with SocialMediaAPITester(args.base_url, args.timeout) as tester:
+        failed_tests = await run_checks(tester)
+    wall = time.perf_counter() - start
+
     # Print results
+    tester.print_timings()
     print("\n" + "=" * 60)
-    print(f"📊 Test Results: {tester.tests_passed}/{tester.tests_run} passed")
-    
+    print(f"📊 Test Results: {tester.tests_passed}/{tester.tests_run} passed in {wall * 1000:.0f} ms")
+
     if failed_tests:
         print(f"❌ Failed tests: {', '.join(failed_tests)}")
         return 1
@@ -207,5 +251,13 @@ def main():
         print("✅ All tests passed!")
         return 0
 
+def main():
+    parser = argparse.ArgumentParser(description="Smoke test the API endpoints")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL,
+                        help="server to test, e.g. http://localhost:8001")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds per request")
+    args = parser.parse_args()
+    return asyncio.run(async_main(args))
+
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
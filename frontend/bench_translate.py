@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Benchmark the translation pipeline against a local fake Google Translate
+
+Starts an HTTP server that answers like translate.google.com/m (with
+configurable latency, error rate and a request quota enforced with HTTP
+429), points deep_translator's GoogleTranslator at it and runs the whole
+contentData.json through each engine mode. Reports strings/sec, p50/p99 per
+call, retries and wall time per mode.
+
+    python bench_translate.py --latency 0.05 --quota 20 --modes concurrent,batched
+    python bench_translate.py --langs de,ja --json bench.json
+"""
+import argparse
+import html
+import json
+import random
+import re
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from translation_engine import (
+    MAX_BATCH_CHARS, SOURCE_FILE, TRANSLATABLE_FIELDS, TokenBucket, TranslationEngine, needs_translation
+)
+
+# Engine settings per mode; workers=None takes --workers
+MODES = {
+    'sequential': {'workers': 1, 'batch_chars': 0},
+    'concurrent': {'workers': None, 'batch_chars': 0},
+    'batched': {'workers': None, 'batch_chars': MAX_BATCH_CHARS},
+}
+
+
+class FakeGoogleServer:
+    """Local stand-in for the mobile Google Translate page"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, quota=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.quota = TokenBucket(quota) if quota else None
+        self.counts_lock = threading.Lock()
+        self.reset()
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/m"
+
+    def reset(self):
+        with self.counts_lock:
+            self.counts = {'requests': 0, 'ok': 0, 'rate_limited': 0, 'errors': 0}
+
+    def _count(self, key):
+        with self.counts_lock:
+            self.counts[key] += 1
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._count('requests')
+                if server.quota is not None and not server.quota.try_acquire():
+                    server._count('rate_limited')
+                    return self._send(429, 'Too Many Requests')
+                delay = server.latency + random.uniform(0, server.jitter)
+                if delay:
+                    time.sleep(delay)
+                if server.error_rate and random.random() < server.error_rate:
+                    server._count('errors')
+                    return self._send(500, 'Internal Server Error')
+                params = parse_qs(urlparse(self.path).query)
+                text = params.get('q', [''])[0]
+                target = params.get('tl', ['?'])[0]
+                translated = re.sub(r'^(?=.*\w)', f'[{target}] ', text.strip(), flags=re.MULTILINE)
+                server._count('ok')
+                self._send(200, f'<html><body><div class="result-container">{html.escape(translated)}</div></body></html>')
+
+            def _send(self, status, body):
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TimedTranslator:
+    """GoogleTranslator aimed at the fake server, recording each call's duration"""
+
+    def __init__(self, url, durations, source, target):
+        from deep_translator import GoogleTranslator
+        self.translator = GoogleTranslator(source=source, target=target)
+        self.translator._base_url = url
+        self.durations = durations
+
+    def translate(self, text):
+        start = time.perf_counter()
+        try:
+            return self.translator.translate(text)
+        finally:
+            self.durations.append(time.perf_counter() - start)
+
+
+def run_mode(name, data, langs, server, args):
+    """Translate ``data`` to ``langs`` with one mode's engine settings"""
+    settings = MODES[name]
+    durations = []
+    server.reset()
+    engine = TranslationEngine(
+        translator_factory=lambda source, target: TimedTranslator(server.url, durations, source, target),
+        workers=settings['workers'] or args.workers,
+        rate=args.rate,
+        max_retries=args.retries,
+        base_delay=args.base_delay,
+        batch_chars=settings['batch_chars'],
+    )
+    start = time.perf_counter()
+    with engine:
+        engine.translate_languages(data, langs)
+    wall = time.perf_counter() - start
+    strings = count_strings(data) * len(langs)
+    # The 99 cut points between percentiles, cuts[49] is the median
+    if len(durations) > 1:
+        cuts = statistics.quantiles(durations, n=100, method='inclusive')
+    else:
+        cuts = [durations[0] if durations else 0.0] * 99
+    return {
+        'mode': name,
+        'languages': langs,
+        'strings': strings,
+        'wall_seconds': round(wall, 3),
+        'strings_per_second': round(strings / wall, 1) if wall else 0.0,
+        'call_p50_ms': round(cuts[49] * 1000, 1),
+        'call_p99_ms': round(cuts[98] * 1000, 1),
+        'engine': dict(engine.stats),
+        'server': dict(server.counts),
+    }
+
+
+def count_strings(data):
+    """Distinct strings the engine has to translate per language"""
+    return len({
+        item[field] for section, fields in TRANSLATABLE_FIELDS.items()
+        for item in data[section] for field in fields if needs_translation(item.get(field))
+    })
+
+
+def limit_items(data, limit):
+    """The first ``limit`` items of every section"""
+    return {section: items[:limit] for section, items in data.items()} if limit else data
+
+
+def print_table(results):
+    header = f"{'mode':<12}{'strings':>9}{'wall s':>9}{'str/s':>9}{'p50 ms':>9}{'p99 ms':>9}" \
+             f"{'calls':>8}{'retries':>9}{'fails':>7}{'429s':>7}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['mode']:<12}{r['strings']:>9}{r['wall_seconds']:>9}{r['strings_per_second']:>9}"
+              f"{r['call_p50_ms']:>9}{r['call_p99_ms']:>9}{r['engine']['calls']:>8}"
+              f"{r['engine']['retries']:>9}{r['engine']['failures']:>7}{r['server']['rate_limited']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', default=','.join(MODES), help=f"comma separated, from {list(MODES)}")
+    parser.add_argument('--langs', default='de', help='comma separated target languages')
+    parser.add_argument('--limit', type=int, default=0, help='only the first N items of each section')
+    parser.add_argument('--latency', type=float, default=0.02, help='server seconds per request')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random server latency, seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 500')
+    parser.add_argument('--quota', type=float, default=0.0,
+                        help='server requests per second before answering 429 (0 = unlimited)')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--rate', type=float, default=0.0, help='engine rate limit (0 = unlimited)')
+    parser.add_argument('--retries', type=int, default=4)
+    parser.add_argument('--base-delay', type=float, default=0.05, help='engine backoff base, seconds')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f"Unknown modes {unknown}, expected some of {list(MODES)}")
+    langs = [lang.strip() for lang in args.langs.split(',') if lang.strip()]
+
+    with open(SOURCE_FILE, 'r', encoding='utf-8') as f:
+        data = limit_items(json.load(f), args.limit)
+
+    results = []
+    with FakeGoogleServer(args.latency, args.jitter, args.error_rate, args.quota) as server:
+        for mode in modes:
+            print(f"Running {mode}...")
+            results.append(run_mode(mode, data, langs, server, args))
+    print()
+    print_table(results)
+
+    if args.json:
+        settings = {key: value for key, value in vars(args).items() if key != 'json'}
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'settings': settings, 'results': results}, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Diff contentData.json against the last translated snapshot
+
+A manifest next to each translated file records, per item id, the hash of
+every translatable source field at the time it was translated. Comparing it
+with the current source tells which fields changed, so only those are sent
+to the translator. Removed ids are dropped and the output follows the
+source order; untouched translations (including manual fixes) are kept.
+Fields whose translation failed are left out of the manifest, so the next
+run retries them. Manifests are local state (not committed); without one
+nothing is known to be current and every field is retranslated.
+"""
+import json
+import os
+
+from translation_engine import TRANSLATABLE_FIELDS, needs_translation
+from translation_memory import text_hash
+
+
+def manifest_path(lang_code):
+    return f'src/data/.manifest_{lang_code}.json'
+
+
+def load_manifest(lang_code):
+    path = manifest_path(lang_code)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return None
+
+
+def save_manifest(lang_code, manifest):
+    # content_pipeline imports this module
+    from content_pipeline import write_json_atomic
+    write_json_atomic(manifest_path(lang_code), manifest)
+
+
+def build_manifest(source, failed=()):
+    """Source field hashes for every item, by section and id
+
+    ``failed`` holds the (section, id, field) entries that are still
+    untranslated and must not be recorded.
+    """
+    return {
+        section: {
+            item['id']: {
+                field: text_hash(item.get(field) or '') for field in fields
+                if (section, item['id'], field) not in failed
+            }
+            for item in source[section]
+        }
+        for section, fields in TRANSLATABLE_FIELDS.items()
+    }
+
+
+def plan_incremental(source, translated, manifest):
+    """Merge the previous translation into the current source layout
+
+    Returns the merged content and the (section, index, field) entries that
+    still need translating. Without a manifest every field needs translating.
+    """
+    merged = {}
+    todo = []
+    for section, fields in TRANSLATABLE_FIELDS.items():
+        previous = {item['id']: item for item in translated.get(section, [])}
+        old_hashes = (manifest or {}).get(section, {})
+        items = []
+        for index, item in enumerate(source[section]):
+            new_item = dict(item)
+            prev = previous.get(item['id'])
+            for field in fields:
+                if not needs_translation(item.get(field)):
+                    continue
+                unchanged = prev is not None and old_hashes.get(item['id'], {}).get(field) == text_hash(item[field])
+                if unchanged and needs_translation(prev.get(field)):
+                    new_item[field] = prev[field]
+                else:
+                    todo.append((section, index, field))
+            items.append(new_item)
+        merged[section] = items
+    return merged, todo
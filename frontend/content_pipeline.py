@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Run translate / fix / capitalize over the content files in one pass
+
+Each file is loaded once, its items are streamed through every stage in
+order and the result is written once, atomically (temp file + rename), so a
+crash never leaves a half-written contentData file behind. Stages are
+generators over (section, item) pairs and are timed individually.
+
+    python content_pipeline.py --stages fix,fix-v2,capitalize
+    python content_pipeline.py --stages translate,fix-v2,capitalize --fake de ja
+    python content_pipeline.py --stages translate,fix-v2,capitalize --jobs 7
+"""
+import argparse
+import json
+import os
+import stat
+import tempfile
+import time
+from functools import partial
+from itertools import groupby
+
+from content_diff import build_manifest, save_manifest
+from language_jobs import run_language_jobs
+from translation_engine import (
+    LANGUAGES, SOURCE_FILE, TRANSLATABLE_FIELDS, add_engine_arguments, engine_from_args
+)
+
+# Items sent to the translation engine at once
+TRANSLATE_CHUNK_SIZE = 50
+
+# Items between two progress reports
+PROGRESS_EVERY = 25
+
+
+def content_path(lang_code):
+    return f'src/data/{LANGUAGES[lang_code]}'
+
+
+def load_content(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _read_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once: changing the umask is not thread-safe
+_UMASK = _read_umask()
+
+
+def write_json_atomic(path, data):
+    """Write JSON next to ``path`` and rename it into place
+
+    The file keeps its permissions; a new one gets the usual 0666 minus the
+    umask rather than the 0600 of the temp file.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def iter_items(data):
+    """(section, item) pairs in file order"""
+    for section, items in data.items():
+        for item in items:
+            yield section, item
+
+
+def collect_items(pairs, progress=None, total=None):
+    data = {}
+    for done, (section, item) in enumerate(pairs, 1):
+        data.setdefault(section, []).append(item)
+        if progress and (done % PROGRESS_EVERY == 0 or done == total):
+            progress(done, total)
+    return data
+
+
+class FixStage:
+    """Apply a RuleSet to the translatable fields of every item"""
+
+    def __init__(self, name, rules):
+        self.name = name
+        # A single RuleSet, or a {lang_code: RuleSet} table
+        self.rules = rules
+
+    def __call__(self, pairs, lang_code):
+        rules = self.rules.get(lang_code) if isinstance(self.rules, dict) else self.rules
+        for section, item in pairs:
+            if rules is not None:
+                for field in TRANSLATABLE_FIELDS.get(section, ()):
+                    if item.get(field):
+                        item[field] = rules.apply(item[field])
+            yield section, item
+
+
+class TranslateStage:
+    """Translate items with a TranslationEngine, a chunk at a time
+
+    Fields whose translation failed are collected in ``failed`` as
+    (section, id, field).
+    """
+
+    name = 'translate'
+
+    def __init__(self, engine, chunk_size=TRANSLATE_CHUNK_SIZE):
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.failed = set()
+
+    def _translate(self, section, chunk, lang_code):
+        def on_failure(item, field):
+            self.failed.add((section, item['id'], field))
+
+        fields = TRANSLATABLE_FIELDS.get(section, ())
+        for done in self.engine.translate_items(chunk, fields, lang_code, on_failure=on_failure):
+            yield section, done
+
+    def __call__(self, pairs, lang_code):
+        for section, group in groupby(pairs, key=lambda pair: pair[0]):
+            chunk = []
+            for _, item in group:
+                chunk.append(item)
+                if len(chunk) >= self.chunk_size:
+                    yield from self._translate(section, chunk, lang_code)
+                    chunk = []
+            if chunk:
+                yield from self._translate(section, chunk, lang_code)
+
+
+class _Timed:
+    """Iterator wrapper adding the time spent producing each item to ``timings[name]``
+
+    The time includes upstream stages; run_pipeline subtracts them.
+    """
+
+    def __init__(self, name, iterator, timings):
+        self.name = name
+        self.iterator = iterator
+        self.timings = timings
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            return next(self.iterator)
+        finally:
+            self.timings[self.name] = self.timings.get(self.name, 0.0) + time.perf_counter() - start
+
+
+def run_pipeline(stages, lang_code, input_path=None, output_path=None, progress=None):
+    """Load one file, stream it through ``stages`` and write it once
+
+    Reads the language's content file unless ``input_path`` is given (a
+    translate stage reads the English source). Returns the seconds spent in
+    load, each stage and write. ``progress(done, total)`` is called as items
+    leave the last stage.
+    """
+    input_path = input_path or content_path(lang_code)
+    output_path = output_path or content_path(lang_code)
+    timings = {}
+
+    start = time.perf_counter()
+    data = load_content(input_path)
+    timings['load'] = time.perf_counter() - start
+
+    pairs = iter_items(data)
+    names = []
+    for stage in stages:
+        pairs = _Timed(stage.name, stage(pairs, lang_code), timings)
+        names.append(stage.name)
+    result = collect_items(pairs, progress, sum(len(items) for items in data.values()))
+
+    # Each stage's time includes everything upstream of it
+    upstream = 0.0
+    for name in names:
+        inclusive = timings.get(name, 0.0)
+        timings[name] = inclusive - upstream
+        upstream = inclusive
+
+    start = time.perf_counter()
+    write_json_atomic(output_path, result)
+    timings['write'] = time.perf_counter() - start
+    return timings
+
+
+def format_timings(timings):
+    return ', '.join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in timings.items())
+
+
+def build_stages(names, engine=None):
+    """Stage objects for a list of stage names"""
+    import fix_capitalization
+    import fix_translations
+    import fix_translations_v2
+
+    available = {
+        'translate': lambda: TranslateStage(engine),
+        'fix': lambda: FixStage('fix', fix_translations.RULES),
+        'fix-v2': lambda: FixStage('fix-v2', fix_translations_v2.RULES),
+        'capitalize': lambda: FixStage('capitalize', fix_capitalization.BRAND_RULES),
+    }
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown stages {unknown}, expected some of {list(available)}")
+    return [available[name]() for name in names]
+
+
+def run_language(lang_code, names, engine=None, progress=None):
+    """Run the named stages over one language; returns the stage timings"""
+    stages = build_stages(names, engine)
+    # Translating starts from the English source instead of the old translation
+    input_path = SOURCE_FILE if 'translate' in names else None
+    timings = run_pipeline(stages, lang_code, input_path, progress=progress)
+    if input_path:
+        translate = next(stage for stage in stages if stage.name == 'translate')
+        save_manifest(lang_code, build_manifest(load_content(SOURCE_FILE), translate.failed))
+        if translate.failed:
+            print(f"  ✗ {lang_code}: {len(translate.failed)} fields failed and were left in English")
+    return timings
+
+
+def _language_work(names, engine, lang_code, report):
+    # run_language as a language_jobs work function
+    return run_language(lang_code, names, engine, report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('langs', nargs='*', help=f"some of {list(LANGUAGES.keys())}, default all")
+    parser.add_argument('--stages', default='fix-v2,capitalize',
+                        help='comma separated: translate, fix, fix-v2, capitalize')
+    parser.add_argument('--jobs', type=int, default=1, help='languages processed in parallel processes')
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.stages.split(',') if name.strip()]
+    langs = args.langs or list(LANGUAGES)
+    invalid = [lang for lang in langs if lang not in LANGUAGES]
+    if invalid:
+        parser.error(f"Invalid language codes: {invalid}")
+    try:
+        build_stages(names)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.jobs > 1:
+        results, stats = run_language_jobs(partial(_language_work, names), langs, args, 'translate' in names)
+        for lang, timings in results.items():
+            print(f"  ✓ {content_path(lang)}: {format_timings(timings)}")
+        if 'translate' in names:
+            print(f"\nRequests: {stats}")
+        return
+
+    engine = engine_from_args(args) if 'translate' in names else None
+    try:
+        for lang in langs:
+            timings = run_language(lang, names, engine)
+            print(f"  ✓ {content_path(lang)}: {format_timings(timings)}")
+    finally:
+        if engine is not None:
+            engine.close()
+    if engine is not None:
+        print(f"\nRequests: {engine.stats}")
+
+
+if __name__ == '__main__':
+    main()
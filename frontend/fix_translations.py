@@ -2,8 +2,8 @@
 """
 Fix common translation errors in Gen Z content
 """
-import json
-import re
+from content_pipeline import FixStage, format_timings, run_pipeline
+from translation_rules import Rule, RuleSet
 
 # Common fixes for each language
 FIXES = {
@@ -54,54 +54,33 @@ FIXES = {
     }
 }
 
+# Fix TikTok capitalization
+TIKTOK_RULES = [
+    Rule('tiktok', 'TikTok', ignore_case=True, whole_word=True),
+    Rule('tik tok', 'TikTok', ignore_case=True, whole_word=True),
+]
+
+def case_variant_rules(fixes):
+    """Each fix as written, then capitalized, upper and lower case"""
+    return [
+        Rule(convert(wrong), convert(right))
+        for wrong, right in fixes.items()
+        for convert in (str, str.capitalize, str.upper, str.lower)
+    ]
+
+# Compiled once per language
+RULES = {lang: RuleSet(case_variant_rules(fixes) + TIKTOK_RULES) for lang, fixes in FIXES.items()}
+DEFAULT_RULES = RuleSet(TIKTOK_RULES)
+
 def fix_text(text, lang):
     """Apply fixes to text"""
-    if not text:
-        return text
-    
-    fixes = FIXES.get(lang, {})
-    for wrong, right in fixes.items():
-        text = text.replace(wrong, right)
-        text = text.replace(wrong.capitalize(), right.capitalize())
-        text = text.replace(wrong.upper(), right.upper())
-        text = text.replace(wrong.lower(), right.lower())
-    
-    # Fix TikTok capitalization
-    text = re.sub(r'\btiktok\b', 'TikTok', text, flags=re.IGNORECASE)
-    text = re.sub(r'\btik tok\b', 'TikTok', text, flags=re.IGNORECASE)
-    
-    return text
+    return RULES.get(lang, DEFAULT_RULES).apply(text)
 
 def fix_file(filename, lang):
     """Fix translations in a file"""
     print(f"Fixing {filename}...")
-    
-    with open(filename, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Fix visual styles
-    for item in data['visualStyles']:
-        item['title'] = fix_text(item['title'], lang)
-        if item.get('info'):
-            item['info'] = fix_text(item['info'], lang)
-    
-    # Fix hooks
-    for item in data['hooks']:
-        item['idea'] = fix_text(item['idea'], lang)
-        if item.get('notes'):
-            item['notes'] = fix_text(item['notes'], lang)
-    
-    # Fix scripts
-    for item in data['scripts']:
-        item['paragraph1'] = fix_text(item['paragraph1'], lang)
-        item['paragraph2'] = fix_text(item['paragraph2'], lang)
-        if item.get('notes'):
-            item['notes'] = fix_text(item['notes'], lang)
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    print(f"  ✓ Fixed {filename}")
+    timings = run_pipeline([FixStage('fix', RULES.get(lang, DEFAULT_RULES))], lang, filename, filename)
+    print(f"  ✓ Fixed {filename} ({format_timings(timings)})")
 
 def main():
     files = [
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Run one worker process per target language
+
+Every language runs in its own process, with its own engine, translator
+connections and progress files, so nothing is shared between languages but
+the provider quota. Workers report (lang, done, total) on a queue and the
+parent keeps one aggregate progress line for all of them.
+"""
+import copy
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from translation_engine import engine_from_args
+
+# Set in worker processes by run_languages
+_progress_queue = None
+
+
+def _init_worker(queue):
+    global _progress_queue
+    _progress_queue = queue
+
+
+def report_progress(lang_code, done, total):
+    """Send progress to the parent process; a no-op outside run_languages"""
+    if _progress_queue is not None:
+        _progress_queue.put((lang_code, done, total))
+
+
+class AggregateProgress:
+    """One status line with per-language and overall progress"""
+
+    def __init__(self, langs, stream=None, interval=1.0):
+        self.state = {lang: (0, 0) for lang in langs}
+        self.finished = set()
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self._tty = self.stream.isatty()
+        self._shown = 0.0
+
+    def update(self, lang_code, done, total):
+        self.state[lang_code] = (done, total)
+        self.show()
+
+    def finish(self, lang_code):
+        self.finished.add(lang_code)
+        self.show(force=True)
+
+    def render(self):
+        parts = []
+        for lang, (done, total) in self.state.items():
+            parts.append(f"{lang} ✓" if lang in self.finished else f"{lang} {done}/{total}")
+        done = sum(done for done, _ in self.state.values())
+        total = sum(total for _, total in self.state.values())
+        percent = f" ({done * 100 // total}%)" if total else ''
+        return f"{'  '.join(parts)} | {done}/{total}{percent}"
+
+    def show(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._shown < self.interval:
+            return
+        self._shown = now
+        if self._tty:
+            self.stream.write('\r\033[K' + self.render())
+        else:
+            self.stream.write(self.render() + '\n')
+        self.stream.flush()
+
+    def close(self):
+        if self._tty:
+            self.stream.write('\n')
+            self.stream.flush()
+
+
+def run_languages(func, langs, jobs, *args):
+    """Run ``func(lang, *args)`` for every language in up to ``jobs`` processes
+
+    ``func`` must be a module level function. Returns {lang: result}; an
+    exception in one language is re-raised after the others finished.
+    """
+    queue = multiprocessing.Queue()
+    display = AggregateProgress(langs)
+
+    def pump():
+        for message in iter(queue.get, None):
+            display.update(*message)
+
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    results, errors = {}, {}
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(queue,)) as pool:
+            futures = {pool.submit(func, lang, *args): lang for lang in langs}
+            for future in as_completed(futures):
+                lang = futures[future]
+                try:
+                    results[lang] = future.result()
+                except Exception as e:
+                    errors[lang] = e
+                display.finish(lang)
+    finally:
+        queue.put(None)
+        reader.join()
+        display.close()
+    if errors:
+        lang, error = next(iter(errors.items()))
+        raise RuntimeError(f"{len(errors)} language(s) failed, first {lang}: {error}") from error
+    return {lang: results[lang] for lang in langs}
+
+
+def language_job(lang_code, work, args, use_engine=True):
+    """One language in a worker process, with its own engine
+
+    Runs ``work(engine, lang_code, report)``, where ``report(done, total)``
+    sends progress to the parent. Returns its result and the engine's
+    request stats.
+    """
+    engine = engine_from_args(args) if use_engine else None
+    try:
+        result = work(engine, lang_code, lambda done, total: report_progress(lang_code, done, total))
+    finally:
+        if engine is not None:
+            engine.close()
+    return result, engine.stats if engine is not None else {}
+
+
+def run_language_jobs(work, langs, args, use_engine=True):
+    """language_job for every language, in up to ``args.jobs`` processes
+
+    ``work`` must be picklable, e.g. a module level function. Returns
+    {lang: result} and the request stats summed over all languages.
+    """
+    jobs = min(args.jobs, len(langs))
+    args = copy.copy(args)
+    # The request rate is a provider quota, so running processes split it
+    args.rate = args.rate / jobs
+    results = run_languages(language_job, langs, jobs, work, args, use_engine)
+    stats = [stats for _, stats in results.values() if stats]
+    totals = {key: sum(s[key] for s in stats) for key in stats[0]} if stats else {}
+    return {lang: result for lang, (result, _) in results.items()}, totals
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Append-only progress journal for long translation runs
+
+Every translated field is appended as one JSON line keyed by section, item
+id and field, together with the hash of the source text it was translated
+from. Lines are flushed to the OS as they are written, so a crashed process
+loses nothing; fsync is batched, so a power loss loses at most the last
+batch. On resume the journal is replayed (a torn last line is ignored) and
+compacted to one line per field; a finished run deletes it.
+"""
+import json
+import os
+import threading
+import time
+
+# Entries / seconds between two fsyncs
+SYNC_EVERY = 64
+SYNC_INTERVAL = 1.0
+
+
+def journal_path(lang_code):
+    return f'src/data/.progress_{lang_code}.jsonl'
+
+
+class ProgressJournal:
+    def __init__(self, path, sync_every=SYNC_EVERY, sync_interval=SYNC_INTERVAL):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.entries = self._replay()
+        if os.path.exists(path):
+            self._compact()
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    def _replay(self):
+        """{(section, id, field): (source_hash, text)} from the journal, last entry wins"""
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A write cut short by the crash
+                    break
+                entries[(entry['s'], entry['id'], entry['f'])] = (entry['h'], entry['t'])
+        return entries
+
+    @staticmethod
+    def _line(section, item_id, field, source_hash, text):
+        entry = {'s': section, 'id': item_id, 'f': field, 'h': source_hash, 't': text}
+        return json.dumps(entry, ensure_ascii=False) + '\n'
+
+    def _compact(self):
+        """Rewrite the journal with one line per field, dropping any torn tail"""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for (section, item_id, field), (source_hash, text) in self.entries.items():
+                f.write(self._line(section, item_id, field, source_hash, text))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def get(self, section, item_id, field, source_hash):
+        """Journaled translation of a field, if its source text is unchanged"""
+        entry = self.entries.get((section, item_id, field))
+        if entry is not None and entry[0] == source_hash:
+            return entry[1]
+        return None
+
+    def append(self, section, item_id, field, source_hash, text):
+        line = self._line(section, item_id, field, source_hash, text)
+        with self._lock:
+            self.entries[(section, item_id, field)] = (source_hash, text)
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced += 1
+            if (self._unsynced >= self.sync_every
+                    or time.monotonic() - self._synced_at >= self.sync_interval):
+                self._sync()
+
+    def _sync(self):
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    def sync(self):
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+
+    def remove(self):
+        """Delete the journal once its content made it into the output file"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -1,158 +1,167 @@
 #!/usr/bin/env python3
 """
-Translate contentData.json in chunks with progress saving
+Translate contentData.json with a crash-safe progress journal
 """
+import argparse
 import json
-from deep_translator import GoogleTranslator
-import time
-import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-LANGUAGES = {
-    'de': ('german', 'contentDataDe.json'),
-    'es': ('spanish', 'contentDataEs.json'),
-    'fr': ('french', 'contentDataFr.json'),
-    'pt': ('portuguese', 'contentDataPt.json'),
-    'ru': ('russian', 'contentDataRu.json'),
-    'ko': ('korean', 'contentDataKr.json'),
-    'ja': ('japanese', 'contentDataJp.json')
-}
+from content_diff import build_manifest, load_manifest, plan_incremental, save_manifest
+from content_pipeline import write_json_atomic
+from language_jobs import run_language_jobs
+from progress_journal import ProgressJournal, journal_path
+from translation_engine import (
+    LANGUAGES, SOURCE_FILE, TRANSLATABLE_FIELDS, add_engine_arguments, engine_from_args,
+    needs_translation
+)
+from translation_memory import text_hash
 
-def load_progress(lang_code):
-    """Load existing progress if any"""
-    progress_file = f'src/data/.progress_{lang_code}.json'
-    if os.path.exists(progress_file):
-        with open(progress_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return None
-
-def save_progress(lang_code, data):
-    """Save progress to temp file"""
-    progress_file = f'src/data/.progress_{lang_code}.json'
-    with open(progress_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-def translate_text(translator, text, retries=3):
-    """Translate with retry"""
-    if not text:
-        return text
-    for i in range(retries):
-        try:
-            return translator.translate(text)
-        except Exception as e:
-            if i == retries - 1:
-                print(f"Failed: {e}")
-                return text
-            time.sleep(2)
-    return text
-
-def translate_language(lang_code):
+def translate_language(engine, lang_code, report=None):
     """Translate entire content for one language"""
     if lang_code not in LANGUAGES:
         print(f"Invalid language code: {lang_code}")
         return False
     
-    lang_name, filename = LANGUAGES[lang_code]
-    filepath = f'src/data/{filename}'
+    filepath = f'src/data/{LANGUAGES[lang_code]}'
     
     print(f"\n{'='*60}")
-    print(f"TRANSLATING TO {lang_name.upper()}")
+    print(f"TRANSLATING TO {lang_code.upper()}")
     print('='*60)
     
     # Load source
-    with open('src/data/contentData.json', 'r', encoding='utf-8') as f:
+    with open(SOURCE_FILE, 'r', encoding='utf-8') as f:
         source = json.load(f)
     
-    # Check for existing progress
-    progress = load_progress(lang_code)
-    if progress:
-        print(f"Found existing progress, resuming...")
-        translated = progress
-    else:
-        translated = {'visualStyles': [], 'hooks': [], 'scripts': []}
-    
-    translator = GoogleTranslator(source='en', target=lang_code)
-    
-    # Translate Visual Styles
-    if len(translated['visualStyles']) < len(source['visualStyles']):
-        start = len(translated['visualStyles'])
-        print(f"\nTranslating Visual Styles ({start}/{len(source['visualStyles'])} done)...")
-        for i in range(start, len(source['visualStyles'])):
-            style = source['visualStyles'][i]
-            print(f"  {i+1}/{len(source['visualStyles'])}: {style['title'][:35]}...", end=' ', flush=True)
-            new_style = style.copy()
-            new_style['title'] = translate_text(translator, style['title'])
-            if style.get('info'):
-                new_style['info'] = translate_text(translator, style['info'])
-            translated['visualStyles'].append(new_style)
-            print("✓")
-            time.sleep(0.1)
-        save_progress(lang_code, translated)
-    
-    # Translate Hooks
-    if len(translated['hooks']) < len(source['hooks']):
-        start = len(translated['hooks'])
-        print(f"\nTranslating Hooks ({start}/{len(source['hooks'])} done)...")
-        for i in range(start, len(source['hooks'])):
-            hook = source['hooks'][i]
-            print(f"  {i+1}/{len(source['hooks'])}: {hook['idea'][:35]}...", end=' ', flush=True)
-            new_hook = hook.copy()
-            new_hook['idea'] = translate_text(translator, hook['idea'])
-            if hook.get('notes'):
-                new_hook['notes'] = translate_text(translator, hook['notes'])
-            translated['hooks'].append(new_hook)
-            print("✓")
-            time.sleep(0.1)
-        save_progress(lang_code, translated)
-    
-    # Translate Scripts
-    if len(translated['scripts']) < len(source['scripts']):
-        start = len(translated['scripts'])
-        print(f"\nTranslating Scripts ({start}/{len(source['scripts'])} done)...")
-        for i in range(start, len(source['scripts'])):
-            script = source['scripts'][i]
-            if i % 10 == 0:
-                print(f"  {i+1}/{len(source['scripts'])}: {script['paragraph1'][:35]}...", end=' ', flush=True)
-            new_script = script.copy()
-            new_script['paragraph1'] = translate_text(translator, script['paragraph1'])
-            new_script['paragraph2'] = translate_text(translator, script['paragraph2'])
-            if script.get('notes'):
-                new_script['notes'] = translate_text(translator, script['notes'])
-            translated['scripts'].append(new_script)
-            if i % 10 == 0:
-                print("✓")
-            time.sleep(0.05)
-            # Save every 50 scripts
-            if (i + 1) % 50 == 0:
-                save_progress(lang_code, translated)
-        save_progress(lang_code, translated)
-    
-    # Final save
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(translated, f, indent=2, ensure_ascii=False)
-    
-    # Clean up progress file
-    progress_file = f'src/data/.progress_{lang_code}.json'
-    if os.path.exists(progress_file):
-        os.remove(progress_file)
-    
-    print(f"\n✓ {lang_name} translation complete! Saved to {filepath}")
+    # Fields translated by an interrupted run are taken from the journal
+    journal = ProgressJournal(journal_path(lang_code))
+    if journal.entries:
+        print(f"[{lang_code}] Found {len(journal.entries)} journaled fields, resuming...")
+    
+    translated = {section: [dict(item) for item in source[section]] for section in TRANSLATABLE_FIELDS}
+    slots_by_text = {}
+    for section, fields in TRANSLATABLE_FIELDS.items():
+        for index, item in enumerate(source[section]):
+            for field in fields:
+                text = item.get(field)
+                if not needs_translation(text):
+                    continue
+                done = journal.get(section, item['id'], field, text_hash(text))
+                if done is not None:
+                    translated[section][index][field] = done
+                else:
+                    slots_by_text.setdefault(text, []).append((section, index, field))
+    
+    total = len(slots_by_text)
+    print(f"[{lang_code}] {total} strings to translate")
+    finished = 0
+    lock = threading.Lock()
+    
+    def on_result(text, translation):
+        # Runs on the engine's worker threads
+        nonlocal finished
+        source_hash = text_hash(text)
+        for section, index, field in slots_by_text[text]:
+            translated[section][index][field] = translation
+            journal.append(section, source[section][index]['id'], field, source_hash, translation)
+        with lock:
+            finished += 1
+            if report:
+                report(finished, total)
+    
+    # Failed strings stay in English and are neither journaled nor recorded
+    # in the manifest, so the next run retries them
+    failed = set()
+    try:
+        engine.translate_many(list(slots_by_text), lang_code, on_result=on_result, on_failure=failed.add)
+    finally:
+        journal.close()
+    failed_fields = {
+        (section, source[section][index]['id'], field)
+        for text in failed for section, index, field in slots_by_text[text]
+    }
+    
+    write_json_atomic(filepath, translated)
+    save_manifest(lang_code, build_manifest(source, failed_fields))
+    if failed_fields:
+        # The journal stays, so a rerun only retries the failed fields
+        print(f"\n✗ {lang_code}: {len(failed_fields)} fields failed and were left in English, rerun to retry them")
+        return False
+    # The output file replaces the journal
+    journal.remove()
+    
+    print(f"\n✓ {lang_code} translation complete! Saved to {filepath}")
     return True
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 translate_chunked.py <lang_code|all>")
-        print(f"Supported: {list(LANGUAGES.keys())} or 'all'")
-        sys.exit(1)
+def translate_language_incremental(engine, lang_code, report=None):
+    """Retranslate only the fields that changed since the last run"""
+    if lang_code not in LANGUAGES:
+        print(f"Invalid language code: {lang_code}")
+        return False
+    
+    filepath = f'src/data/{LANGUAGES[lang_code]}'
+    
+    with open(SOURCE_FILE, 'r', encoding='utf-8') as f:
+        source = json.load(f)
+    translated = {}
+    if os.path.exists(filepath):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            translated = json.load(f)
+    
+    manifest = load_manifest(lang_code)
+    if manifest is None and translated:
+        print(f"[{lang_code}] No manifest, so nothing is known to be current: retranslating every field")
+    
+    merged, todo = plan_incremental(source, translated, manifest)
+    print(f"[{lang_code}] {len(todo)} changed fields to translate")
+    texts = [source[section][index][field] for section, index, field in todo]
+    failed = set()
+    translations = engine.translate_many(texts, lang_code, report, on_failure=failed.add)
+    for (section, index, field), text in zip(todo, translations):
+        merged[section][index][field] = text
+    failed_fields = {
+        (section, source[section][index]['id'], field)
+        for (section, index, field), text in zip(todo, texts) if text in failed
+    }
     
-    lang = sys.argv[1]
+    write_json_atomic(filepath, merged)
+    save_manifest(lang_code, build_manifest(source, failed_fields))
     
-    if lang == 'all':
-        for code in LANGUAGES.keys():
-            translate_language(code)
-            time.sleep(5)  # Pause between languages
+    if failed_fields:
+        print(f"✗ {lang_code}: {len(failed_fields)} fields failed and were left in English, rerun to retry them")
+        return False
+    print(f"✓ {lang_code} updated incrementally: {filepath}")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('lang', help=f"one of {list(LANGUAGES.keys())} or 'all'")
+    parser.add_argument('--incremental', action='store_true',
+                        help='only retranslate fields that changed since the last run')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="with 'all', translate languages in this many processes")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+    translate = translate_language_incremental if args.incremental else translate_language
+    
+    if args.lang == 'all' and args.jobs > 1:
+        results, stats = run_language_jobs(translate, list(LANGUAGES), args)
+        print(f"\nRequests: {stats}")
     else:
-        translate_language(lang)
+        with engine_from_args(args) as engine:
+            if args.lang == 'all':
+                # Languages run side by side, sharing the engine's workers and rate limit
+                with ThreadPoolExecutor(max_workers=len(LANGUAGES)) as pool:
+                    results = dict(zip(LANGUAGES, pool.map(lambda code: translate(engine, code), LANGUAGES)))
+            else:
+                results = {args.lang: translate(engine, args.lang)}
+            print(f"\nRequests: {engine.stats}")
+    
+    failed = [lang for lang, ok in results.items() if not ok]
+    if failed:
+        print(f"✗ Not complete: {', '.join(failed)}")
+        raise SystemExit(1)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Shared translation engine for the content scripts
+
+Requests run on a bounded thread pool behind a token-bucket rate limiter,
+failed calls are retried with jittered exponential backoff, and several
+target languages are translated at the same time. The translator backend is
+pluggable: anything with a ``translate(text)`` method works, e.g.
+FakeTranslator for runs that must not hit Google. With a TranslationMemory
+attached, strings translated before are answered from disk.
+"""
+import random
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from translation_memory import DEFAULT_MEMORY_FILE, TranslationMemory
+
+# Target language code -> translated content file in src/data
+LANGUAGES = {
+    'de': 'contentDataDe.json',
+    'es': 'contentDataEs.json',
+    'fr': 'contentDataFr.json',
+    'pt': 'contentDataPt.json',
+    'ru': 'contentDataRu.json',
+    'ko': 'contentDataKr.json',
+    'ja': 'contentDataJp.json'
+}
+
+SOURCE_FILE = 'src/data/contentData.json'
+
+# Short segments are joined into one request with a delimiter line that the
+# translator leaves alone; requests stay under Google's 5000 character limit
+SEGMENT_MARK = '###'
+SEGMENT_DELIMITER = f'\n{SEGMENT_MARK}\n'
+SEGMENT_SPLIT = re.compile(r'\s*' + re.escape(SEGMENT_MARK) + r'\s*')
+MAX_BATCH_CHARS = 4500
+
+# Fields that get translated, per content section
+TRANSLATABLE_FIELDS = {
+    'visualStyles': ('title', 'info'),
+    'hooks': ('idea', 'notes'),
+    'scripts': ('paragraph1', 'paragraph2', 'notes'),
+}
+
+
+def needs_translation(text):
+    """Empty values and '-' placeholders are kept as they are"""
+    return bool(text) and text.strip() not in ('', '-')
+
+
+def google_translator(source, target):
+    from deep_translator import GoogleTranslator
+    return GoogleTranslator(source=source, target=target)
+
+
+class FakeTranslator:
+    """Offline stand-in for GoogleTranslator that tags each line with the target language"""
+
+    def __init__(self, source='en', target='de', latency=0.0, error_rate=0.0):
+        self.source = source
+        self.target = target
+        self.latency = latency
+        self.error_rate = error_rate
+
+    def translate(self, text):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.error_rate and random.random() < self.error_rate:
+            raise RuntimeError("fake translator error")
+        return re.sub(r'^(?=.*\w)', f'[{self.target}] ', text.strip(), flags=re.MULTILINE)
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` calls per second, bursting to ``capacity``"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """Take a token if one is available; otherwise seconds until the next one"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def try_acquire(self):
+        return self._take() == 0.0
+
+    def acquire(self):
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+class TranslationEngine:
+    """Concurrent, rate-limited translation of strings and content items"""
+
+    def __init__(self, translator_factory=None, source='en', workers=8, rate=5.0, burst=None,
+                 max_retries=4, base_delay=1.0, max_delay=30.0, memory=None, engine_version='google:1',
+                 batch_chars=MAX_BATCH_CHARS):
+        self.translator_factory = translator_factory or google_translator
+        self.source = source
+        self.memory = memory
+        self.engine_version = engine_version
+        self.batch_chars = batch_chars
+        self.workers = workers
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._bucket = TokenBucket(rate, burst) if rate else None
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.stats = {'calls': 0, 'cached': 0, 'batches': 0, 'fallbacks': 0, 'retries': 0, 'failures': 0,
+                      'memory_errors': 0}
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        if self.memory is not None:
+            self.memory.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _translator(self, target):
+        """One translator per worker thread and target language"""
+        translators = getattr(self._local, 'translators', None)
+        if translators is None:
+            translators = self._local.translators = {}
+        if target not in translators:
+            translators[target] = self.translator_factory(self.source, target)
+        return translators[target]
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _request(self, text, target):
+        """One rate-limited translator call, retried; raises after the last attempt"""
+        for attempt in range(self.max_retries + 1):
+            if self._bucket:
+                self._bucket.acquire()
+            self._count('calls')
+            try:
+                return self._translator(target).translate(text)
+            except Exception:
+                if attempt == self.max_retries:
+                    raise
+                self._count('retries')
+                time.sleep(self.backoff(attempt))
+
+    # The translation memory is only a cache: when it fails, translations go on without it
+
+    def _remember(self, text, target, translation):
+        if self.memory is None:
+            return
+        try:
+            self.memory.put(text, self.source, target, self.engine_version, translation)
+        except sqlite3.Error as e:
+            self._count('memory_errors')
+            print(f"Translation memory write failed: {e}")
+
+    def _recall(self, text, target):
+        if self.memory is None:
+            return None
+        try:
+            cached = self.memory.get(text, self.source, target, self.engine_version)
+        except sqlite3.Error as e:
+            self._count('memory_errors')
+            print(f"Translation memory read failed: {e}")
+            return None
+        if cached is not None:
+            self._count('cached')
+        return cached
+
+    def _translate_one(self, text, target):
+        """Translate one string; None if every attempt fails"""
+        if not needs_translation(text):
+            return text
+        cached = self._recall(text, target)
+        if cached is not None:
+            return cached
+        return self._translate_uncached(text, target)
+
+    def _translate_uncached(self, text, target):
+        """Request a translation the memory doesn't have; None if every attempt fails"""
+        try:
+            translation = self._request(text, target)
+        except Exception as e:
+            self._count('failures')
+            print(f"Failed: {e}")
+            return None
+        self._remember(text, target, translation)
+        return translation
+
+    def translate(self, text, target):
+        """Translate one string; the source text is kept if every attempt fails"""
+        translation = self._translate_one(text, target)
+        return text if translation is None else translation
+
+    def _pack(self, texts):
+        """Group texts into batches that fit in one request"""
+        batches, batch, size = [], [], 0
+        for text in texts:
+            cost = len(text) + len(SEGMENT_DELIMITER)
+            # Texts that contain the delimiter could not be split back apart
+            if not self.batch_chars or SEGMENT_MARK in text or cost > self.batch_chars:
+                batches.append([text])
+                continue
+            if batch and size + cost > self.batch_chars:
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(text)
+            size += cost
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _translate_batch(self, batch, target):
+        """Translate several segments in one request, falling back to one call each
+
+        ``batch`` holds texts that need translating and already missed the
+        translation memory. Segments whose translation failed are None.
+        """
+        if len(batch) == 1:
+            return [self._translate_uncached(batch[0], target)]
+        self._count('batches')
+        try:
+            joined = self._request(SEGMENT_DELIMITER.join(batch), target)
+            parts = [part.strip() for part in SEGMENT_SPLIT.split(joined)]
+        except Exception:
+            parts = []
+        if len(parts) != len(batch) or not all(parts):
+            # The delimiters were lost or mangled
+            self._count('fallbacks')
+            return [self._translate_uncached(text, target) for text in batch]
+        for text, part in zip(batch, parts):
+            self._remember(text, target, part)
+        return parts
+
+    def _translate_reporting(self, batch, target, on_result):
+        translations = self._translate_batch(batch, target)
+        if on_result:
+            for text, translation in zip(batch, translations):
+                if translation is not None:
+                    on_result(text, translation)
+        return translations
+
+    def translate_many(self, texts, target, progress=None, on_result=None, on_failure=None):
+        """Translate a list of strings, keeping their order
+
+        Strings are deduplicated and looked up in the translation memory
+        first; the rest are packed into batched requests that run in parallel.
+        ``on_result(text, translation)`` is called for every distinct string
+        as soon as its translation is known, from the worker threads. Strings
+        whose translation failed are returned as they are and passed to
+        ``on_failure(text)`` instead.
+        """
+        results = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            if not needs_translation(text):
+                results[text] = text
+                continue
+            cached = self._recall(text, target)
+            if cached is not None:
+                results[text] = cached
+                if on_result:
+                    on_result(text, cached)
+            else:
+                pending.append(text)
+        futures = {
+            self._pool.submit(self._translate_reporting, batch, target, on_result): batch
+            for batch in self._pack(pending)
+        }
+        done = 0
+        for future in as_completed(futures):
+            batch = futures[future]
+            for text, translation in zip(batch, future.result()):
+                if translation is None:
+                    translation = text
+                    if on_failure:
+                        on_failure(text)
+                results[text] = translation
+            done += len(batch)
+            if progress:
+                progress(done, len(pending))
+        return [results[text] for text in texts]
+
+    def translate_items(self, items, fields, target, progress=None, on_failure=None):
+        """Copies of ``items`` with ``fields`` translated
+
+        ``on_failure(item, field)`` is called for every field left
+        untranslated because its translation failed.
+        """
+        translated = [dict(item) for item in items]
+        slots = [
+            (i, field) for i, item in enumerate(items) for field in fields
+            if needs_translation(item.get(field))
+        ]
+        failed = set()
+        texts = self.translate_many([items[i][field] for i, field in slots], target, progress, on_failure=failed.add)
+        for (i, field), text in zip(slots, texts):
+            translated[i][field] = text
+            if on_failure and items[i][field] in failed:
+                on_failure(items[i], field)
+        return translated
+
+    def translate_content(self, data, target, progress=None):
+        """Translate a whole contentData dict to one language"""
+        return {
+            section: self.translate_items(data[section], fields, target, progress)
+            for section, fields in TRANSLATABLE_FIELDS.items()
+        }
+
+    def translate_languages(self, data, targets, progress=None):
+        """Translate a contentData dict to several languages at once
+
+        Every language gets its own coordinating thread; their requests share
+        the worker pool and the rate limit.
+        """
+        with ThreadPoolExecutor(max_workers=len(targets) or 1) as languages:
+            futures = {
+                target: languages.submit(
+                    self.translate_content, data, target,
+                    (lambda done, total, target=target: progress(target, done, total)) if progress else None,
+                )
+                for target in targets
+            }
+            return {target: future.result() for target, future in futures.items()}
+
+
+def add_engine_arguments(parser):
+    """Command line options shared by the translate scripts"""
+    parser.add_argument('--workers', type=int, default=8, help='concurrent translation requests')
+    parser.add_argument('--rate', type=float, default=5.0, help='max requests per second (0 = unlimited)')
+    parser.add_argument('--retries', type=int, default=4, help='retries per string before giving up')
+    parser.add_argument('--batch-chars', type=int, default=MAX_BATCH_CHARS,
+                        help='max characters per batched request (0 = one request per string)')
+    parser.add_argument('--fake', action='store_true', help='use the offline FakeTranslator')
+    parser.add_argument('--memory', default=DEFAULT_MEMORY_FILE, help='translation memory file')
+    parser.add_argument('--no-memory', action='store_true', help='always call the translator')
+
+
+def engine_from_args(args):
+    return TranslationEngine(
+        translator_factory=FakeTranslator if args.fake else None,
+        workers=args.workers,
+        rate=args.rate,
+        max_retries=args.retries,
+        memory=None if args.no_memory else TranslationMemory(args.memory),
+        engine_version='fake:1' if args.fake else 'google:1',
+        batch_chars=args.batch_chars,
+    )
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Persistent translation memory shared by the translate scripts
+
+Every successful translation is stored in a SQLite file keyed by the hash of
+the source text, the language pair and the engine version, so reruns only
+send strings that were never translated before. Bump the engine version to
+invalidate everything a translator produced.
+
+Several processes share the file (translate_chunked.py --jobs). Every put
+commits on its own, so no process keeps the write lock for longer than one
+insert, and a busy database is waited for rather than failing. In WAL mode
+with synchronous=NORMAL a commit does not fsync, which keeps that cheap; a
+power loss can drop the last few entries, which only costs a retranslation.
+"""
+import hashlib
+import sqlite3
+import threading
+
+DEFAULT_MEMORY_FILE = 'src/data/.translation_memory.sqlite3'
+
+# Seconds to wait for another process's write before giving up
+BUSY_TIMEOUT = 30.0
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    def __init__(self, path=DEFAULT_MEMORY_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            ' source_hash TEXT NOT NULL,'
+            ' source_lang TEXT NOT NULL,'
+            ' target_lang TEXT NOT NULL,'
+            ' engine TEXT NOT NULL,'
+            ' translation TEXT NOT NULL,'
+            ' PRIMARY KEY (source_hash, source_lang, target_lang, engine))'
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text, source, target, engine):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT translation FROM translations'
+                ' WHERE source_hash = ? AND source_lang = ? AND target_lang = ? AND engine = ?',
+                (text_hash(text), source, target, engine),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, text, source, target, engine, translation):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)',
+                (text_hash(text), source, target, engine, translation),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Compiled find-and-replace rules for fixing translations
+
+A RuleSet gives exactly the result of applying its rules one after another
+(``str.replace`` for plain rules, ``re.sub`` for case-insensitive or
+whole-word ones), but compiles them into as few regex alternations as
+possible so that each string is scanned once per stage instead of once per
+rule, and a text that matches none of the rules is only scanned once.
+
+Two rules keep their order, in separate stages, when one's pattern
+contains the other's, when one's replacement holds a match of the other's
+pattern that it would change, or when a whole-word rule sits next to a
+replacement that changes a word boundary. Every other rule goes into the
+earliest stage after the last rule it has to follow. Rules whose patterns
+only partly overlap, or whose replacement could complete the other's
+pattern with the text around it, share a stage: that needs particular text
+at the match, and the few input texts holding it (found with one more scan)
+get the rules applied one by one instead. A rule repeating an earlier one
+is dropped unless something since could have produced new matches for it.
+Rule lists that feed their own output into each other (the a -> b, b -> c
+kind) still need one stage per step.
+
+Run this file to check the compiled rules against sequential application on
+every translated content file.
+"""
+import re
+from typing import NamedTuple
+
+
+class Rule(NamedTuple):
+    text: str
+    replacement: str
+    ignore_case: bool = False
+    whole_word: bool = False
+
+
+def literal_rules(replacements):
+    """Plain case-sensitive rules from a {wrong: right} dict, in order"""
+    return [Rule(wrong, right) for wrong, right in replacements.items()]
+
+
+def apply_sequential(rules, text):
+    """Reference semantics: one full pass per rule"""
+    for rule in rules:
+        if rule.ignore_case or rule.whole_word:
+            text = _rule_regex(rule).sub(lambda m, r=rule.replacement: r, text)
+        else:
+            text = text.replace(rule.text, rule.replacement)
+    return text
+
+
+def _rule_regex(rule):
+    return re.compile(_rule_pattern(rule))
+
+
+def _rule_pattern(rule):
+    pattern = re.escape(rule.text)
+    if rule.ignore_case:
+        pattern = f'(?i:{pattern})'
+    if rule.whole_word:
+        pattern = rf'\b{pattern}\b'
+    return pattern
+
+
+def _trie_pattern(words):
+    """Regex matching any of ``words``, branching one character at a time"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            body = f'(?:{body})?'
+        return body
+
+    return build(trie)
+
+
+def _overlaps(a, b):
+    """Can matches of ``a`` and ``b`` share characters?"""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b))))
+
+
+def _contains(a, b):
+    return a in b or b in a
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch == '_'
+
+
+def _changes_boundary(rule):
+    pattern, replacement = rule.text, rule.replacement
+    if not replacement:
+        return True
+    return (_is_word(pattern[0]) != _is_word(replacement[0])
+            or _is_word(pattern[-1]) != _is_word(replacement[-1]))
+
+
+def _folded(text, *rules):
+    """``text`` as the ``rules`` compare it"""
+    return text.lower() if any(rule.ignore_case for rule in rules) else text
+
+
+def _creates(earlier, rule):
+    """Can applying ``earlier`` produce new matches of ``rule``?"""
+    return (_overlaps(_folded(earlier.replacement, rule), _folded(rule.text, rule))
+            or (rule.whole_word and _changes_boundary(earlier)))
+
+
+def _creates_alone(earlier, rule):
+    """Can ``earlier`` produce a new match of ``rule`` whatever text surrounds it?"""
+    replacement, text = _folded(earlier.replacement, rule), _folded(rule.text, rule)
+    if len(replacement) != len(earlier.replacement) or len(text) != len(rule.text):
+        # Case folding changed the length, so the offsets below don't hold
+        return _creates(earlier, rule)
+    return not replacement or text in replacement or (rule.whole_word and _changes_boundary(earlier))
+
+
+def _creates_unchanged(earlier, rule):
+    """Are the matches of ``rule`` that ``earlier`` creates left as they are?
+
+    Like the TikTok a tiktok -> TikTok rule finds in another rule's
+    replacement, as long as they can't hide a match next to them.
+    """
+    if not earlier.replacement or (rule.whole_word and _changes_boundary(earlier)):
+        return False
+    replacement, text = _folded(earlier.replacement, rule), _folded(rule.text, rule)
+    if len(replacement) != len(earlier.replacement) or any(text.endswith(text[:k]) for k in range(1, len(text))):
+        return False
+    starts = [i for i in range(len(replacement) - len(text) + 1) if replacement.startswith(text, i)]
+    return all(earlier.replacement[i:i + len(text)] == rule.replacement for i in starts)
+
+
+def _matches_at(rule):
+    """Regex matching just before a match of ``rule``"""
+    return f'(?={_rule_pattern(rule)})'
+
+
+def _becoming(rules, char, ignore_case, end):
+    """Regex class of the characters that can turn into ``char``
+
+    A character changes when a match starting at it (ending at it, with
+    ``end``) is replaced, so this follows the rules' first (last) characters
+    backwards.
+    """
+    chars = {char.lower(), char.upper()} if ignore_case else {char}
+    index = -1 if end else 0
+    grown = True
+    while grown:
+        grown = False
+        for rule in rules:
+            if rule.replacement and rule.replacement[index] in chars:
+                ch = rule.text[index]
+                new = {ch.lower(), ch.upper()} if rule.ignore_case else {ch}
+                if not new <= chars:
+                    chars |= new
+                    grown = True
+    return '[' + ''.join(re.escape(ch) for ch in sorted(chars)) + ']'
+
+
+def _creation_guards(rules, earlier, rule):
+    """(rule, regex) for the texts where ``earlier`` could produce a match of ``rule``
+
+    For replacements that only partly overlap the pattern, the rest of the
+    pattern has to be right next to the match, so the regexes look for a
+    character there that is (or rules could turn into) the next one needed.
+    """
+    replacement, text = _folded(earlier.replacement, rule), _folded(rule.text, rule)
+    guards = []
+    if not _overlaps(replacement, text):
+        return guards
+    for offset in range(1 - len(text), len(replacement)):
+        first, last = max(0, offset), min(len(replacement), offset + len(text))
+        if last - first == len(text) or replacement[first:last] != text[first - offset:last - offset]:
+            # Whole matches inside the replacement are left to _creates_alone
+            continue
+        after = rule.text[len(replacement) - offset:]
+        if after:
+            chars = _becoming(rules, after[0], rule.ignore_case, end=False)
+            guards.append((earlier, f'{_matches_at(earlier)}(?s:.{{{len(earlier.text)}}}){chars}'))
+        else:
+            chars = _becoming(rules, rule.text[-offset - 1], rule.ignore_case, end=True)
+            guards.append((earlier, f'(?<={chars}){_matches_at(earlier)}'))
+    return guards
+
+
+def _junctions(a, b):
+    """(rule, regex) for the texts where matches of ``a`` and ``b`` partly overlap
+
+    The rule is the one every match of the regex starts with a match of.
+    """
+    junctions = []
+    if not _overlaps(_folded(a.text, a, b), _folded(b.text, a, b)):
+        return junctions
+    for first, second in ((a, b), (b, a)):
+        folded_first, folded_second = _folded(first.text, a, b), _folded(second.text, a, b)
+        for offset in range(max(1, len(first.text) - len(second.text) + 1), len(first.text)):
+            if len(folded_first) == len(first.text) and not folded_second.startswith(folded_first[offset:]):
+                continue
+            pattern = f'{_matches_at(first)}(?s:.{{{offset}}}){_matches_at(second)}'
+            # Word boundaries can rule the overlap out
+            regex = re.compile(pattern)
+            candidates = {first.text[:offset] + second.text, first.text + second.text[len(first.text) - offset:]}
+            if any(regex.search(before + text + after) for text in candidates for before in ' x' for after in ' x'):
+                junctions.append((first, pattern))
+    return junctions
+
+
+def _order_guards(rules, a, b, created_a, created_b):
+    """(rule, regex) for the texts where the order of ``a`` and ``b`` matters
+
+    None when they must keep their order in every text: when one's pattern
+    contains the other's, when one can produce matches of the other that it
+    changes whatever surrounds them, or when the regexes can't be trusted
+    because one of them can be produced that way itself (``created_a``,
+    ``created_b``) and so match where the input doesn't.
+    """
+    if _contains(_folded(a.text, a, b), _folded(b.text, a, b)):
+        return None
+    guards = _junctions(a, b)
+    if guards and (created_a or created_b):
+        return None
+    for earlier, rule, created in ((a, b, created_a), (b, a, created_b)):
+        if _creates_alone(earlier, rule) and not _creates_unchanged(earlier, rule):
+            return None
+        creation = _creation_guards(rules, earlier, rule)
+        if creation and created:
+            return None
+        guards += creation
+    return guards
+
+
+def _repeats(earlier_rules, rule):
+    """Is ``rule`` an earlier rule again, with nothing left for it to match?"""
+    for earlier in reversed(earlier_rules):
+        if _creates(earlier, rule):
+            return False
+        if earlier == rule:
+            return True
+    return False
+
+
+class RuleSet:
+    def __init__(self, rules):
+        self.rules = []
+        for rule in rules:
+            # Case-sensitive rules that replace text with itself never change
+            # anything; case-insensitive ones still normalize the case
+            if not rule.text or (rule.text == rule.replacement and not rule.ignore_case):
+                continue
+            if not _repeats(self.rules, rule):
+                self.rules.append(rule)
+        levels, guards = self._plan()
+        self.stages = [
+            self._compile([rule for rule, level in zip(self.rules, levels) if level == stage])
+            for stage in range(max(levels) + 1 if levels else 0)
+        ]
+        # Later rules can only match what earlier replacements produced, so a
+        # text none of the rules match is left alone after a single scan
+        self._any = self._compile(self.rules)[0] if self.rules else None
+        # Texts where rules sharing a stage could overlap or feed each other
+        # are rare, and get the rules applied one by one instead. The
+        # regexes only run on texts holding the rule they start with.
+        by_rule = {}
+        for rule, pattern in guards:
+            by_rule.setdefault(rule, {})[pattern] = None
+        self._guards = [
+            (rule.text.casefold() if rule.ignore_case else rule.text, rule.ignore_case, re.compile('|'.join(patterns)))
+            for rule, patterns in by_rule.items()
+        ]
+
+    def _plan(self):
+        """Stage of every rule, and the guards for the rules sharing stages
+
+        Guards only see matches that are in the input, so a rule whose
+        matches can be produced by an earlier stage (``created``) must keep
+        its order with every rule it meets; that can make more rules
+        created, until nothing changes.
+        """
+        created = [
+            any(_creates_alone(other, rule) for j, other in enumerate(self.rules) if j != i)
+            for i, rule in enumerate(self.rules)
+        ]
+        pairs = {}
+        while True:
+            levels, guards, ordered = [], [], set()
+            for i, rule in enumerate(self.rules):
+                after = []
+                for j in range(i):
+                    key = j, i, created[j], created[i]
+                    if key not in pairs:
+                        pairs[key] = _order_guards(self.rules, self.rules[j], rule, created[j], created[i])
+                    order_guards = pairs[key]
+                    if order_guards is None:
+                        after.append(levels[j])
+                        ordered.add((j, i))
+                    else:
+                        guards += order_guards
+                levels.append(max(after) + 1 if after else 0)
+            fed = [created[i] or any((j, i) in ordered and _creates(self.rules[j], rule) for j in range(i))
+                   for i, rule in enumerate(self.rules)]
+            if fed == created:
+                return levels, guards
+            created = fed
+
+    def __add__(self, other):
+        return RuleSet(self.rules + other.rules)
+
+    @staticmethod
+    def _compile(stage):
+        plain = {rule.text: rule.replacement for rule in stage
+                 if not (rule.ignore_case or rule.whole_word)}
+        named = {f'r{i}': rule.replacement for i, rule in enumerate(stage)
+                 if rule.ignore_case or rule.whole_word}
+        alternatives = []
+        if plain:
+            alternatives.append(f'(?P<plain>{_trie_pattern(plain)})')
+        for i, rule in enumerate(stage):
+            if f'r{i}' in named:
+                alternatives.append(f'(?P<r{i}>{_rule_pattern(rule)})')
+        pattern = re.compile('|'.join(alternatives))
+
+        def replace(match):
+            name = match.lastgroup
+            return plain[match.group()] if name == 'plain' else named[name]
+
+        return pattern, replace
+
+    def apply(self, text):
+        if not text or self._any is None or not self._any.search(text):
+            return text
+        if self._guards and self._guarded(text):
+            return apply_sequential(self.rules, text)
+        for pattern, replace in self.stages:
+            text = pattern.sub(replace, text)
+        return text
+
+    def _guarded(self, text):
+        folded = text.casefold()
+        return any(needle in (folded if ignore_case else text) and guard.search(text)
+                   for needle, ignore_case, guard in self._guards)
+
+    def mismatches(self, texts):
+        """Texts where the compiled rules disagree with sequential application"""
+        return [text for text in texts if text and self.apply(text) != apply_sequential(self.rules, text)]
+
+
+# Rule lists whose result depends on order, with the expected sequential output
+ORDERING_CASES = [
+    ([Rule('a', 'b'), Rule('b', 'c')], 'ab', 'cc'),
+    ([Rule('b', 'c'), Rule('a', 'b')], 'ab', 'bc'),
+    ([Rule('Geist', 'Ghost'), Rule('Geister', 'Ghosten')], 'Geister', 'Ghoster'),
+    ([Rule('Geister', 'Ghosten'), Rule('Geist', 'Ghost')], 'Geister Geist', 'Ghosten Ghost'),
+    ([Rule('tok', 'tok!'), Rule('tik tok', 'TikTok', ignore_case=True, whole_word=True)],
+     'tik tok', 'TikTok!'),
+    ([Rule('-', ''), Rule('tiktok', 'TikTok', whole_word=True)], 'x-tiktok', 'xtiktok'),
+    ([Rule('tiktok', 'TikTok', ignore_case=True), Rule('TikTok', 'TT')], 'TIKTOK', 'TT'),
+]
+
+
+def check_ordering():
+    """Failed ORDERING_CASES as (rules, text, expected, got)"""
+    failed = []
+    for rules, text, expected in ORDERING_CASES:
+        got = RuleSet(rules).apply(text)
+        if got != expected or apply_sequential(rules, text) != expected:
+            failed.append((rules, text, expected, got))
+    return failed
+
+
+def main():
+    import json
+
+    import fix_capitalization
+    import fix_translations
+    import fix_translations_v2
+    from translation_engine import LANGUAGES, TRANSLATABLE_FIELDS
+
+    failures = len(check_ordering())
+    print(f"{len(ORDERING_CASES)} ordering cases, {failures} failed")
+    for lang, filename in LANGUAGES.items():
+        with open(f'src/data/{filename}', 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        texts = [item.get(field) for section, fields in TRANSLATABLE_FIELDS.items()
+                 for item in data[section] for field in fields]
+        rule_sets = {
+            'fix_translations': fix_translations.RULES[lang],
+            'fix_translations_v2': fix_translations_v2.RULES[lang],
+            'fix_capitalization': fix_capitalization.BRAND_RULES,
+            'v2 + capitalization': fix_translations_v2.RULES[lang] + fix_capitalization.BRAND_RULES,
+        }
+        for name, rules in rule_sets.items():
+            bad = rules.mismatches(texts)
+            failures += len(bad)
+            print(f"{lang} {name}: {len(rules.rules)} rules in {len(rules.stages)} stages, "
+                  f"{len(bad)} mismatches over {len(texts)} strings")
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
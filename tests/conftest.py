@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# The backend and the frontend scripts import their modules by bare name
+for directory in (ROOT_DIR / "backend", ROOT_DIR / "frontend"):
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
@@ -0,0 +1,173 @@
+import asyncio
+
+from batch_writer import DUPLICATE_KEY, BatchWriter
+
+
+class BulkWriteError(Exception):
+    def __init__(self, write_errors):
+        super().__init__("bulk write error")
+        self.details = {"writeErrors": write_errors}
+
+
+class FakeCollection:
+    """Records insert_many batches; fails the first ``failures`` calls and waits for ``gate`` if set"""
+
+    def __init__(self, failures=0, gate=None):
+        self.batches = []
+        self.calls = 0
+        self.failures = failures
+        self.gate = gate
+
+    async def insert_many(self, documents, ordered=True):
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.calls <= self.failures:
+            raise ConnectionError("database unavailable")
+        self.batches.append([d["n"] for d in documents])
+
+    @property
+    def written(self):
+        return [n for batch in self.batches for n in batch]
+
+
+def docs(start, stop):
+    return [{"n": n} for n in range(start, stop)]
+
+
+async def submit_all(writer, documents):
+    for document in documents:
+        await writer.submit(document)
+
+
+def test_full_batch_is_written_without_waiting_for_the_interval():
+    async def run():
+        collection = FakeCollection()
+        writer = BatchWriter(collection, max_batch_size=3, flush_interval=60)
+        await submit_all(writer, docs(0, 4))
+        await asyncio.sleep(0.05)
+        batches = list(collection.batches)
+        await writer.close()
+        return batches, collection.batches
+
+    before_close, after_close = asyncio.run(run())
+    assert before_close == [[0, 1, 2]]
+    assert after_close == [[0, 1, 2], [3]]
+
+
+def test_partial_batch_is_written_after_the_interval():
+    async def run():
+        collection = FakeCollection()
+        writer = BatchWriter(collection, max_batch_size=100, flush_interval=0.1)
+        await submit_all(writer, docs(0, 2))
+        await asyncio.sleep(0.02)
+        early = list(collection.batches)
+        await asyncio.sleep(0.3)
+        late = list(collection.batches)
+        await writer.close()
+        return early, late
+
+    early, late = asyncio.run(run())
+    assert early == []
+    assert late == [[0, 1]]
+
+
+def test_submit_waits_while_the_queue_is_full():
+    async def run():
+        gate = asyncio.Event()
+        collection = FakeCollection(gate=gate)
+        writer = BatchWriter(collection, max_batch_size=1, flush_interval=0, max_queue_size=2)
+        # One document is being written, two fill the queue
+        await submit_all(writer, docs(0, 3))
+        await asyncio.sleep(0.02)
+        blocked = asyncio.create_task(writer.submit({"n": 3}))
+        await asyncio.sleep(0.05)
+        was_blocked = not blocked.done()
+        gate.set()
+        await blocked
+        await writer.close()
+        return was_blocked, collection.written
+
+    was_blocked, written = asyncio.run(run())
+    assert was_blocked
+    assert written == [0, 1, 2, 3]
+
+
+def test_close_writes_the_batch_in_flight_and_the_queue():
+    async def run():
+        gate = asyncio.Event()
+        collection = FakeCollection(gate=gate)
+        writer = BatchWriter(collection, max_batch_size=2, flush_interval=0)
+        await submit_all(writer, docs(0, 5))
+        await asyncio.sleep(0.02)
+        closing = asyncio.create_task(writer.close())
+        await asyncio.sleep(0.02)
+        gate.set()
+        await closing
+        return collection.batches
+
+    assert asyncio.run(run()) == [[0, 1], [2, 3], [4]]
+
+
+def test_failed_writes_are_retried():
+    flushed = []
+
+    async def after_flush(batch):
+        flushed.append(len(batch))
+
+    async def run():
+        collection = FakeCollection(failures=2)
+        writer = BatchWriter(collection, max_batch_size=10, flush_interval=0, after_flush=after_flush, retry_delay=0)
+        await submit_all(writer, docs(0, 3))
+        await writer.close()
+        return collection, writer
+
+    collection, writer = asyncio.run(run())
+    assert collection.calls == 3
+    assert collection.written == [0, 1, 2]
+    assert writer.dropped == 0
+    assert flushed == [3]
+
+
+def test_retry_that_only_hits_duplicates_completes_the_batch():
+    class PartialCollection(FakeCollection):
+        async def insert_many(self, documents, ordered=True):
+            self.calls += 1
+            if self.calls == 1:
+                # The first document got in before the connection dropped
+                self.batches.append([documents[0]["n"]])
+                raise ConnectionError("connection reset")
+            self.batches.append([d["n"] for d in documents[1:]])
+            raise BulkWriteError([{"index": 0, "code": DUPLICATE_KEY}])
+
+    async def run():
+        collection = PartialCollection()
+        writer = BatchWriter(collection, max_batch_size=10, flush_interval=0, retry_delay=0)
+        await submit_all(writer, docs(0, 3))
+        await writer.close()
+        return collection, writer
+
+    collection, writer = asyncio.run(run())
+    assert collection.calls == 2
+    assert collection.written == [0, 1, 2]
+    assert writer.dropped == 0
+
+
+def test_batch_is_dropped_after_the_last_retry():
+    flushed = []
+
+    async def after_flush(batch):
+        flushed.append(batch)
+
+    async def run():
+        collection = FakeCollection(failures=100)
+        writer = BatchWriter(collection, max_batch_size=10, flush_interval=0, after_flush=after_flush,
+                             max_retries=2, retry_delay=0)
+        await submit_all(writer, docs(0, 3))
+        await writer.close()
+        return collection, writer
+
+    collection, writer = asyncio.run(run())
+    assert collection.calls == 3
+    assert writer.dropped == 3
+    assert flushed == []
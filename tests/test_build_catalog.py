@@ -0,0 +1,28 @@
+import pytest
+
+import build_catalog
+import server
+from catalog import read_artifact, source_fingerprint
+
+
+def run_build_catalog(monkeypatch, *argv):
+    monkeypatch.setattr("sys.argv", ["build_catalog.py", *argv])
+    return build_catalog.main()
+
+
+def test_committed_artifact_is_up_to_date():
+    fingerprint = source_fingerprint(server.catalog_sources())
+    assert read_artifact(server.CATALOG_ARTIFACT, fingerprint) is not None, "run backend/build_catalog.py"
+
+
+def test_check_passes_on_the_committed_catalog(monkeypatch):
+    # The committed artifact is fresh and holds no duplicates missing from the baseline
+    assert run_build_catalog(monkeypatch, "--check") == 0
+
+
+@pytest.mark.parametrize("argv", [["--check"], ["--output", "{tmp}/catalog.json"]])
+def test_duplicates_missing_from_the_baseline_fail(tmp_path, monkeypatch, capsys, argv):
+    monkeypatch.setattr(build_catalog, "DUPLICATES_BASELINE", tmp_path / "empty_baseline.json")
+    assert run_build_catalog(monkeypatch, *(arg.format(tmp=tmp_path) for arg in argv)) == 1
+    assert "new duplicate cluster(s)" in capsys.readouterr().out
+    assert not (tmp_path / "catalog.json").exists()
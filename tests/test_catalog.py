@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from catalog import CatalogListing, decode_cursor, encode_cursor
+
+RECORDS = [{"id": f"h{i}", "category": "Ex TikTok", "idea": f"idea {i}"} for i in range(1, 8)]
+
+
+def walk(listing, limit, fields=None):
+    """Every page of ``listing`` as decoded lists"""
+    pages, cursor = [], None
+    while True:
+        body, cursor = listing.page(limit, cursor, fields)
+        pages.append(json.loads(body.identity))
+        if cursor is None:
+            return pages
+
+
+def test_cursor_roundtrip():
+    assert decode_cursor(encode_cursor("h1")) == "h1"
+    assert decode_cursor(encode_cursor("スクリプト")) == "スクリプト"
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!")
+
+
+def test_pages_cover_the_listing_once_in_order():
+    listing = CatalogListing.from_records(RECORDS, version=3)
+    pages = walk(listing, 3)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [r for page in pages for r in page] == RECORDS
+
+
+def test_last_full_page_has_no_next_cursor():
+    listing = CatalogListing.from_records(RECORDS[:6])
+    assert [len(page) for page in walk(listing, 3)] == [3, 3]
+
+
+def test_fields_project_pages_in_record_order():
+    listing = CatalogListing.from_records(RECORDS)
+    body, cursor = listing.page(2, None, "idea, id")
+    assert json.loads(body.identity) == [{"id": "h1", "idea": "idea 1"}, {"id": "h2", "idea": "idea 2"}]
+    assert cursor == encode_cursor("h2")
+    with pytest.raises(ValueError, match="Unknown fields: nope"):
+        listing.page(2, None, "id,nope")
+    with pytest.raises(ValueError, match="No fields requested"):
+        listing.page(2, None, " , ")
+
+
+def test_unknown_cursor_is_rejected():
+    listing = CatalogListing.from_records(RECORDS)
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        listing.page(2, encode_cursor("h99"), None)
+
+
+
+def test_versioned_etag():
+    assert CatalogListing.from_records(RECORDS, version=3).body.etag.startswith("v3-")
+    assert CatalogListing.from_records(RECORDS, version=3).body.etag != CatalogListing.from_records(RECORDS, version=4).body.etag
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from catalog import load_catalog_data
+from catalog_store import CatalogSnapshot, CatalogStore
+from server import CATALOG_DATA, CATALOG_MODELS
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "catalog_data.json"
+    shutil.copy(CATALOG_DATA, path)
+    return path
+
+
+def make_store(path: Path) -> CatalogStore:
+    return CatalogStore(lambda: {**load_catalog_data(path, CATALOG_MODELS), "locales": {}}, lambda: [path])
+
+
+def edit(path: Path, change):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    change(data)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def add_hook(data):
+    data["version"] += 1
+    data["hooks"].append({**data["hooks"][0], "id": "h999", "idea": "zebrafish growth secrets"})
+
+
+def test_load_prepares_the_first_snapshot_in_a_worker_thread(data_file, monkeypatch):
+    threads = []
+    prepare = CatalogSnapshot.prepare
+
+    def recording_prepare(snapshot, previous=None):
+        threads.append(threading.current_thread())
+        prepare(snapshot, previous)
+
+    monkeypatch.setattr(CatalogSnapshot, "prepare", recording_prepare)
+    store = make_store(data_file)
+    snapshot = asyncio.run(store.load())
+    assert store.current is snapshot
+    assert threads and threads[0] is not threading.main_thread()
+    # Loaded once
+    assert asyncio.run(store.load()) is snapshot
+    assert len(threads) == 1
+
+
+def test_reload_publishes_a_new_snapshot(data_file):
+    store = make_store(data_file)
+    old = store.current
+    assert not store.changed()
+    etag = old.catalog.sections["hooks"].body.etag
+
+    edit(data_file, add_hook)
+    assert store.changed()
+    new = store.reload_now()
+
+    assert store.current is new
+    assert new.version == old.version + 1
+    assert not store.changed()
+    assert new.catalog.sections["hooks"].body.etag.startswith(f"v{new.version}-")
+    assert new.catalog.sections["hooks"].body.etag != etag
+    assert [hit.id for hit in new.search_index().search("zebrafish")] == ["h999"]
+    assert new.plan_composer().hook("h999")["idea"] == "zebrafish growth secrets"
+    # The old snapshot is untouched, for the requests still reading it
+    assert old.search_index().search("zebrafish") == []
+    assert len(old.catalog.sections["hooks"].records) == len(new.catalog.sections["hooks"].records) - 1
+
+
+def test_bad_file_keeps_the_current_snapshot(data_file):
+    store = make_store(data_file)
+    snapshot = store.current
+
+    def duplicate_id(data):
+        data["hooks"].append(data["hooks"][0])
+
+    edit(data_file, duplicate_id)
+    with pytest.raises(ValueError, match="Duplicate hooks id"):
+        store.reload_now()
+    assert store.current is snapshot
+
+    data_file.write_text("{", encoding="utf-8")
+    with pytest.raises(ValueError):
+        store.reload_now()
+    assert store.current is snapshot
+
+
+def test_watch_reloads_changed_files_and_skips_failed_ones(data_file):
+    store = make_store(data_file)
+    version = store.current.version
+
+    async def run():
+        watch = asyncio.create_task(store.watch(0.01))
+        try:
+            data_file.write_text("{", encoding="utf-8")
+            await asyncio.sleep(0.2)
+            failed = store.changed()
+            edit_ok = json.loads(CATALOG_DATA.read_text(encoding="utf-8"))
+            add_hook(edit_ok)
+            data_file.write_text(json.dumps(edit_ok, ensure_ascii=False), encoding="utf-8")
+            for _ in range(200):
+                await asyncio.sleep(0.01)
+                if store.current.version != version:
+                    break
+            return failed
+        finally:
+            watch.cancel()
+
+    failed = asyncio.run(run())
+    # The broken file was tried once and not retried until it changed
+    assert not failed
+    assert store.current.version == version + 1
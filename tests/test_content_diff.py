@@ -0,0 +1,56 @@
+from content_diff import build_manifest, plan_incremental
+
+SOURCE = {
+    "visualStyles": [{"id": "vs1", "title": "Title", "info": "Info"}],
+    "hooks": [
+        {"id": "h1", "idea": "First idea", "notes": "-"},
+        {"id": "h2", "idea": "Second idea", "notes": "A note"},
+    ],
+    "scripts": [{"id": "s1", "paragraph1": "One", "paragraph2": "Two", "notes": None}],
+}
+
+TRANSLATED = {
+    "visualStyles": [{"id": "vs1", "title": "Titel", "info": "Info (de)"}],
+    "hooks": [
+        {"id": "h1", "idea": "Erste Idee", "notes": "-"},
+        {"id": "h2", "idea": "Zweite Idee", "notes": "Eine Notiz"},
+        {"id": "h9", "idea": "Entfernt", "notes": "-"},
+    ],
+    "scripts": [{"id": "s1", "paragraph1": "Eins", "paragraph2": "Zwei", "notes": None}],
+}
+
+
+def entries(source, todo):
+    return [(section, source[section][index]["id"], field) for section, index, field in todo]
+
+
+def test_unchanged_source_needs_nothing():
+    merged, todo = plan_incremental(SOURCE, TRANSLATED, build_manifest(SOURCE))
+    assert todo == []
+    assert merged["hooks"] == TRANSLATED["hooks"][:2]
+
+
+def test_edited_field_is_retranslated():
+    manifest = build_manifest(SOURCE)
+    source = {**SOURCE, "hooks": [SOURCE["hooks"][0], {**SOURCE["hooks"][1], "idea": "Second idea, edited"}]}
+    merged, todo = plan_incremental(source, TRANSLATED, manifest)
+    assert entries(source, todo) == [("hooks", "h2", "idea")]
+    # The other field of the item keeps its translation
+    assert merged["hooks"][1] == {"id": "h2", "idea": "Second idea, edited", "notes": "Eine Notiz"}
+
+
+def test_new_items_and_failed_fields_are_translated():
+    manifest = build_manifest(SOURCE, failed={("scripts", "s1", "paragraph2")})
+    source = {**SOURCE, "hooks": SOURCE["hooks"] + [{"id": "h3", "idea": "Third idea", "notes": ""}]}
+    _, todo = plan_incremental(source, TRANSLATED, manifest)
+    assert entries(source, todo) == [("hooks", "h3", "idea"), ("scripts", "s1", "paragraph2")]
+
+
+def test_missing_manifest_retranslates_everything():
+    merged, todo = plan_incremental(SOURCE, TRANSLATED, None)
+    assert entries(SOURCE, todo) == [
+        ("visualStyles", "vs1", "title"), ("visualStyles", "vs1", "info"),
+        ("hooks", "h1", "idea"), ("hooks", "h2", "idea"), ("hooks", "h2", "notes"),
+        ("scripts", "s1", "paragraph1"), ("scripts", "s1", "paragraph2"),
+    ]
+    assert merged == {section: [dict(item) for item in items] for section, items in SOURCE.items()}
@@ -0,0 +1,27 @@
+import json
+import os
+import stat
+
+from content_pipeline import write_json_atomic
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_write_json_atomic_keeps_the_file_mode(tmp_path):
+    path = tmp_path / "contentDataDe.json"
+    path.write_text("{}")
+    os.chmod(path, 0o644)
+    write_json_atomic(str(path), {"hooks": [{"id": "h1", "idea": "Tschüss"}]})
+    assert mode(path) == 0o644
+    assert json.loads(path.read_text(encoding="utf-8")) == {"hooks": [{"id": "h1", "idea": "Tschüss"}]}
+    assert os.listdir(tmp_path) == ["contentDataDe.json"]
+
+
+def test_write_json_atomic_new_file_follows_umask(tmp_path):
+    umask = os.umask(0)
+    os.umask(umask)
+    path = tmp_path / "new.json"
+    write_json_atomic(str(path), [])
+    assert mode(path) == 0o666 & ~umask
@@ -0,0 +1,43 @@
+import argparse
+
+import pytest
+
+from language_jobs import run_language_jobs
+from translation_engine import add_engine_arguments
+
+
+def engine_args(*argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=2)
+    add_engine_arguments(parser)
+    return parser.parse_args(["--fake", "--no-memory", "--rate", "0", *argv])
+
+
+# Work functions run in worker processes, so they live at module level
+def translate_greetings(engine, lang_code, report):
+    texts = ["Hello", "Goodbye"] if lang_code == "de" else ["Hello"]
+    return engine.translate_many(texts, lang_code, report)
+
+
+def refuse_french(engine, lang_code, report):
+    if lang_code == "fr":
+        raise ValueError("no French today")
+    return lang_code
+
+
+def test_results_and_stats_are_merged_over_processes():
+    results, stats = run_language_jobs(translate_greetings, ["de", "fr", "es"], engine_args("--batch-chars", "0"))
+    assert results == {"de": ["[de] Hello", "[de] Goodbye"], "fr": ["[fr] Hello"], "es": ["[es] Hello"]}
+    assert stats["calls"] == 4
+    assert stats["failures"] == 0
+
+
+def test_results_without_an_engine():
+    results, stats = run_language_jobs(refuse_french, ["de", "es"], engine_args(), use_engine=False)
+    assert results == {"de": "de", "es": "es"}
+    assert stats == {}
+
+
+def test_failed_language_is_raised_after_the_others():
+    with pytest.raises(RuntimeError, match="1 language\\(s\\) failed, first fr: no French today"):
+        run_language_jobs(refuse_french, ["de", "fr", "es"], engine_args(), use_engine=False)
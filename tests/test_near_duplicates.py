@@ -0,0 +1,35 @@
+from near_duplicates import find_duplicates, jaccard, pair_keys, shingles
+
+IDEA = "i helped train new hires at tiktok, this is how we explained the algorithm to them"
+
+
+def test_similar_texts_share_most_shingles():
+    assert jaccard(shingles(IDEA), shingles(IDEA.upper() + "!")) == 1.0
+    assert jaccard(shingles(IDEA), shingles("my morning routine as a night shift nurse")) == 0.0
+
+
+def test_find_duplicates_clusters_near_copies():
+    sections = {
+        "hooks": [
+            {"id": "h1", "idea": IDEA},
+            {"id": "h2", "idea": IDEA.replace("new hires", "the new hires")},
+            {"id": "h3", "idea": IDEA + "."},
+            {"id": "h4", "idea": "my morning routine as a night shift nurse, nobody believes me"},
+        ],
+        "scripts": [
+            {"id": "s1", "paragraph1": IDEA, "paragraph2": "completely different text about sleep"},
+        ],
+    }
+    clusters = find_duplicates(sections, threshold=0.6)
+    assert len(clusters) == 1
+    cluster = clusters[0]
+    assert (cluster.section, cluster.field, cluster.ids) == ("hooks", "idea", ("h1", "h2", "h3"))
+    assert cluster.similarity == 1.0
+    assert cluster.pairs[0][:2] == ("h1", "h3")
+    assert pair_keys(clusters) == ["hooks.idea h1 h2", "hooks.idea h1 h3", "hooks.idea h2 h3"]
+
+
+def test_higher_threshold_drops_looser_pairs():
+    sections = {"hooks": [{"id": "h1", "idea": IDEA}, {"id": "h2", "idea": IDEA.replace("new hires", "interns")}]}
+    assert find_duplicates(sections, threshold=0.5)
+    assert find_duplicates(sections, threshold=0.99) == []
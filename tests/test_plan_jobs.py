@@ -0,0 +1,172 @@
+import asyncio
+import json
+from collections import Counter
+
+import pytest
+
+import plan_jobs
+import server
+from plan_jobs import PlanJobs
+from plans import CampaignSampler, Plan, PlanComposer
+from tests.test_server import api  # noqa: F401 (fixture)
+
+
+@pytest.fixture(scope="module")
+def composer():
+    return server.catalog_store.current.plan_composer()
+
+
+@pytest.fixture(scope="module")
+def large_composer():
+    """The catalog with every hook and script copied 20 times, enough for several job chunks"""
+    listings = server.catalog_store.current.listings()
+
+    def copies(section):
+        return [{**record, "id": f"{record['id']}-{n}"} for n in range(20) for record in listings[section].records]
+
+    return PlanComposer(listings["visual-styles"].records, copies("hooks"), copies("scripts"))
+
+
+def sampler(composer, seed=7):
+    return CampaignSampler(composer, list(composer.styles), seed)
+
+
+def assert_disjoint(plans):
+    hooks = Counter(plan["hook_id"] for plan in plans)
+    scripts = Counter(script_id for plan in plans for script_id in plan["script_ids"])
+    assert not [hook for hook, count in hooks.items() if count > 1]
+    assert not [script for script, count in scripts.items() if count > 1]
+
+
+class EndlessSampler:
+    """Stands in for CampaignSampler with a pool that never runs out"""
+
+    def __init__(self, fail_at=None):
+        self.drawn = 0
+        self.fail_at = fail_at
+
+    def next_plan(self):
+        if self.drawn == self.fail_at:
+            raise RuntimeError("sampler broke")
+        self.drawn += 1
+        return Plan("vs1", f"h{self.drawn}", ())
+
+
+def run_job(make_sampler, count, during=None):
+    """Submit a job, optionally run ``during(jobs, job)`` alongside it, and wait for it to end"""
+    async def run():
+        jobs = PlanJobs()
+        job = jobs.submit(make_sampler(), count)
+        result = await during(jobs, job) if during else None
+        await asyncio.gather(job.task, return_exceptions=True)
+        return job, result
+
+    return asyncio.run(run())
+
+
+def test_sampler_never_repeats_a_hook_or_script(composer):
+    campaign = sampler(composer)
+    plans = [plan._asdict() for plan in iter(campaign.next_plan, None)]
+    assert plans
+    assert_disjoint(plans)
+    assert {plan["style_id"] for plan in plans} <= set(composer.styles)
+    assert campaign.next_plan() is None
+
+
+def test_sampler_is_repeatable_with_a_seed(composer):
+    first, second = sampler(composer, seed=3), sampler(composer, seed=3)
+    assert [first.next_plan() for _ in range(20)] == [second.next_plan() for _ in range(20)]
+
+
+def test_large_job_shares_nothing_and_ends_exhausted(large_composer):
+    job, _ = run_job(lambda: sampler(large_composer), server.MAX_BATCH_PLANS)
+    plans = [json.loads(line) for line in job.lines]
+    assert job.status == "exhausted"
+    assert 3 * plan_jobs.JOB_CHUNK_SIZE < job.progress()["produced"] == len(plans) < server.MAX_BATCH_PLANS
+    assert job.finished_at is not None
+    assert_disjoint(plans)
+
+
+def test_job_stops_at_the_requested_count():
+    job, _ = run_job(EndlessSampler, plan_jobs.JOB_CHUNK_SIZE * 2 + 3)
+    assert job.status == "done"
+    assert len(job.lines) == plan_jobs.JOB_CHUNK_SIZE * 2 + 3
+
+
+def test_failed_sampler_fails_the_job():
+    job, _ = run_job(lambda: EndlessSampler(fail_at=5), 10)
+    assert job.status == "failed"
+    assert job.error == "sampler broke"
+    assert len(job.lines) == 5
+
+
+def test_cancel_stops_a_running_job():
+    async def cancel_after_a_chunk(jobs, job):
+        while not job.lines:
+            await asyncio.sleep(0)
+        await jobs.cancel(job)
+
+    job, _ = run_job(EndlessSampler, 10**6, cancel_after_a_chunk)
+    assert job.status == "cancelled"
+    assert 0 < len(job.lines) < 10**6
+
+
+def test_cancel_before_the_job_runs():
+    async def cancel(jobs, job):
+        await jobs.cancel(job)
+
+    job, _ = run_job(EndlessSampler, 10, cancel)
+    assert job.status == "cancelled"
+    assert job.lines == []
+
+
+def test_stream_follows_the_job_until_it_ends():
+    async def stream(jobs, job):
+        return b"".join([chunk async for chunk in job.iter_ndjson()])
+
+    job, body = run_job(EndlessSampler, plan_jobs.JOB_CHUNK_SIZE * 3, stream)
+    assert body == b"".join(job.lines)
+    assert [json.loads(line)["hook_id"] for line in body.splitlines()][-1] == f"h{plan_jobs.JOB_CHUNK_SIZE * 3}"
+
+
+def test_finished_jobs_are_pruned():
+    async def run():
+        jobs = PlanJobs(max_finished=2)
+        submitted = []
+        for _ in range(4):
+            job = jobs.submit(EndlessSampler(), 1)
+            await job.task
+            submitted.append(job)
+        return jobs, submitted
+
+    jobs, submitted = asyncio.run(run())
+    # Pruned on submit, so the last one finished after the last prune
+    assert [jobs.get(job.id) for job in submitted] == [None, submitted[1], submitted[2], submitted[3]]
+
+
+def test_plan_batch_routes(api):
+    async def requests(client):
+        started = await client.post("/api/plans/batch", json={"count": 300, "seed": 1})
+        job_id = started.json()["id"]
+        stream = await client.get(f"/api/plans/batch/{job_id}/plans")
+        return (
+            started,
+            stream,
+            (await client.get(f"/api/plans/batch/{job_id}")).json(),
+            (await client.delete(f"/api/plans/batch/{job_id}")).json(),
+            (await client.get("/api/plans/batch/nope")).status_code,
+            (await client.post("/api/plans/batch", json={"count": 1, "style_ids": ["nope"]})).status_code,
+        )
+
+    started, stream, progress, cancelled, unknown_job, unknown_style = api(requests)
+    assert started.status_code == 202
+    assert started.json()["requested"] == 300
+    assert stream.headers["content-type"] == "application/x-ndjson"
+    plans = [json.loads(line) for line in stream.text.splitlines()]
+    assert len(plans) == progress["produced"]
+    assert_disjoint(plans)
+    assert progress["status"] in ("done", "exhausted")
+    # Cancelling a finished job leaves it as it ended
+    assert cancelled["status"] == progress["status"]
+    assert unknown_job == 404
+    assert unknown_style == 404
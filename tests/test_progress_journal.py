@@ -0,0 +1,69 @@
+import json
+
+from progress_journal import ProgressJournal, journal_path
+from tests.test_translation_engine import engine
+from translate_chunked import translate_language
+from translation_engine import SOURCE_FILE
+from translation_memory import text_hash
+
+
+def test_replay_ignores_a_torn_last_line(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = ProgressJournal(str(path))
+    journal.append("hooks", "h1", "idea", "hash1", "Idee")
+    journal.append("hooks", "h2", "idea", "hash2", "Noch eine")
+    journal.append("hooks", "h1", "idea", "hash3", "Neue Idee")
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"s": "hooks", "id": "h3", "f": "id')
+
+    journal = ProgressJournal(str(path))
+    assert journal.entries == {("hooks", "h1", "idea"): ("hash3", "Neue Idee"),
+                               ("hooks", "h2", "idea"): ("hash2", "Noch eine")}
+    assert journal.get("hooks", "h1", "idea", "hash1") is None
+    # Compacted to one line per field, and appends start on a clean line
+    journal.append("hooks", "h3", "idea", "hash4", "Dritte")
+    journal.close()
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["h1", "h2", "h3"]
+
+
+def write_source(tmp_path, monkeypatch, hooks):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src" / "data").mkdir(parents=True)
+    source = {"visualStyles": [], "hooks": hooks, "scripts": []}
+    (tmp_path / SOURCE_FILE).write_text(json.dumps(source), encoding="utf-8")
+
+
+def test_resume_skips_journaled_fields(tmp_path, monkeypatch):
+    write_source(tmp_path, monkeypatch, [
+        {"id": "h1", "idea": "First idea", "notes": "Done before the crash"},
+        {"id": "h2", "idea": "Second idea", "notes": "Changed since the crash"},
+    ])
+    journal = ProgressJournal(journal_path("de"))
+    journal.append("hooks", "h1", "idea", text_hash("First idea"), "Erste Idee")
+    journal.append("hooks", "h1", "notes", text_hash("Done before the crash"), "Vor dem Absturz fertig")
+    journal.append("hooks", "h2", "notes", text_hash("Old notes"), "Alte Notizen")
+    journal.close()
+
+    requests = []
+    with engine(requests, batch_chars=0) as e:
+        assert translate_language(e, "de")
+    assert sorted(requests) == ["Changed since the crash", "Second idea"]
+    translated = json.loads((tmp_path / "src/data/contentDataDe.json").read_text(encoding="utf-8"))
+    assert translated["hooks"] == [
+        {"id": "h1", "idea": "Erste Idee", "notes": "Vor dem Absturz fertig"},
+        {"id": "h2", "idea": "[de] Second idea", "notes": "[de] Changed since the crash"},
+    ]
+    assert not (tmp_path / journal_path("de")).exists()
+
+
+def test_failed_fields_keep_the_journal_for_the_next_run(tmp_path, monkeypatch):
+    write_source(tmp_path, monkeypatch, [{"id": "h1", "idea": "Good idea", "notes": "fail here"}])
+    requests = []
+    with engine(requests, batch_chars=0) as e:
+        assert not translate_language(e, "de")
+    requests.clear()
+    with engine(requests, batch_chars=0) as e:
+        assert not translate_language(e, "de")
+    assert requests == ["fail here", "fail here"]
@@ -0,0 +1,57 @@
+from search import SearchIndex
+
+SECTIONS = {
+    "hooks": [
+        {"id": "h1", "idea": "Why the algorithm hates your videos"},
+        {"id": "h2", "idea": "Sleep schedule hacks nobody talks about"},
+    ],
+    "scripts": [
+        {"id": "s1", "paragraph1": "A viral app review", "paragraph2": "The algorithm loves this app"},
+    ],
+}
+
+
+def ids(hits):
+    return [(hit.section, hit.id) for hit in hits]
+
+
+def test_search_ranks_matching_documents():
+    index = SearchIndex.from_sections(SECTIONS)
+    assert set(ids(index.search("algorithm"))) == {("hooks", "h1"), ("scripts", "s1")}
+    assert ids(index.search("sleep schedule")) == [("hooks", "h2")]
+    assert ids(index.search("algorithm", section="scripts")) == [("scripts", "s1")]
+    assert index.search("zzzz") == []
+
+
+def test_search_matches_prefixes_and_folds_accents():
+    index = SearchIndex.from_sections({"hooks": [{"id": "h1", "idea": "Un écran parfait"}]})
+    assert ids(index.search("ecran")) == [("hooks", "h1")]
+    assert ids(index.search("parf")) == [("hooks", "h1")]
+
+
+def test_update_reindexes_only_changes_and_leaves_the_original_alone():
+    index = SearchIndex.from_sections(SECTIONS)
+    changed = {
+        "hooks": [SECTIONS["hooks"][0], {"id": "h2", "idea": "Morning routine hacks"}],
+        "scripts": SECTIONS["scripts"] + [{"id": "s2", "paragraph1": "Sleep better tonight"}],
+    }
+    updated = index.copy()
+    updated.update(changed)
+    fresh = SearchIndex.from_sections(changed)
+
+    assert updated.postings == fresh.postings
+    assert updated.total_length == fresh.total_length
+    # Unchanged posting lists are shared, changed ones are not
+    assert updated.postings["algorithm"] is index.postings["algorithm"]
+    assert updated.postings["hacks"] is not index.postings["hacks"]
+    assert ids(index.search("sleep")) == [("hooks", "h2")]
+    assert ids(updated.search("sleep")) == [("scripts", "s2")]
+    assert index.postings == SearchIndex.from_sections(SECTIONS).postings
+
+
+def test_updating_the_original_after_a_copy_leaves_the_copy_alone():
+    index = SearchIndex.from_sections(SECTIONS)
+    copy = index.copy()
+    index.update({"hooks": SECTIONS["hooks"][:1], "scripts": SECTIONS["scripts"]})
+    assert ids(copy.search("sleep")) == [("hooks", "h2")]
+    assert index.search("sleep") == []
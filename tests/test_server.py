@@ -0,0 +1,179 @@
+import asyncio
+
+import httpx
+import pytest
+
+import catalog_store
+import server
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Call ``requests(client)`` against the app, with its lifespan running on mongomock"""
+    monkeypatch.setenv("DB_NAME", "viraltool_test")
+    monkeypatch.setattr(server, "connect_mongo", lambda: mongomock_motor.AsyncMongoMockClient(tz_aware=True))
+    monkeypatch.setattr(server, "CATALOG_WATCH_INTERVAL", 0)
+
+    def call(requests):
+        async def run():
+            async with server.app.router.lifespan_context(server.app):
+                await server.app.state.status_setup
+                transport = httpx.ASGITransport(app=server.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    return await requests(client)
+
+        return asyncio.run(run())
+
+    return call
+
+
+def test_unchanged_listing_is_not_modified(api):
+    async def requests(client):
+        response = await client.get("/api/scripts/engagement", headers={"Accept-Encoding": "gzip"})
+        etag = response.headers["etag"]
+        again = await client.get("/api/scripts/engagement", headers={"If-None-Match": etag})
+        return response, again
+
+    response, again = api(requests)
+    assert response.headers["content-encoding"] == "gzip"
+    assert {item["type"] for item in response.json()} == {"engagement"}
+    assert again.status_code == 304
+
+
+def test_hooks_pages_follow_the_next_cursor(api):
+    async def requests(client):
+        whole = (await client.get("/api/hooks")).json()
+        pages, params = [], {"limit": 50, "fields": "id,idea"}
+        while True:
+            response = await client.get("/api/hooks", params=params)
+            assert response.status_code == 200
+            pages.append(response.json())
+            if "x-next-cursor" not in response.headers:
+                return whole, pages, response
+            params = {**params, "cursor": response.headers["x-next-cursor"]}
+
+    whole, pages, last = api(requests)
+    assert [len(page) for page in pages] == [50, 50, len(whole) - 100]
+    assert [item for page in pages for item in page] == [{"id": h["id"], "idea": h["idea"]} for h in whole]
+    assert "link" not in last.headers
+
+
+def test_bad_page_parameters(api):
+    async def requests(client):
+        return [
+            (await client.get("/api/hooks", params=params)).status_code
+            for params in ({"cursor": "bm9wZQ"}, {"fields": "nope"}, {"fields": ""}, {"limit": 0})
+        ]
+
+    assert api(requests) == [400, 400, 400, 422]
+
+
+async def written(count):
+    # The status writer inserts in the background
+    while await server.db.status_checks.count_documents({}) < count:
+        await asyncio.sleep(0.01)
+
+
+def test_status_checks_are_written_and_paged(api):
+    async def requests(client):
+        for i in range(5):
+            response = await client.post("/api/status", json={"client_name": "web" if i % 2 else "ios"})
+            assert response.status_code == 200
+        await asyncio.wait_for(written(5), timeout=5)
+        first = await client.get("/api/status", params={"limit": 3})
+        second = await client.get("/api/status", params={"limit": 3, "cursor": first.headers["x-next-cursor"]})
+        streamed = (await client.get("/api/status", params={"client_name": "web"})).json()
+        return first, second, streamed
+
+    first, second, streamed = api(requests)
+    ids = [c["id"] for c in first.json() + second.json()]
+    assert len(ids) == len(set(ids)) == 5
+    assert "x-next-cursor" not in second.headers
+    assert [c["client_name"] for c in streamed] == ["web", "web"]
+
+
+def test_status_stats(api):
+    async def requests(client):
+        for client_name in ("ios", "web", "ios"):
+            await client.post("/api/status", json={"client_name": client_name})
+        await asyncio.wait_for(written(3), timeout=5)
+        return (
+            (await client.get("/api/status/stats", params={"bucket": "day"})).json(),
+            (await client.get("/api/status/stats", params={"client_name": "web"})).json(),
+            (await client.get("/api/status/stats", params={"bucket": "week"})).status_code,
+        )
+
+    stats, web, bad_bucket = api(requests)
+    assert stats["source"] == "raw"
+    assert stats["total"] == 3
+    assert stats["by_client"] == [{"client_name": "ios", "count": 2}, {"client_name": "web", "count": 1}]
+    assert sum(row["count"] for row in stats["by_time"]) == 3
+    assert web["total"] == 1
+    assert bad_bucket == 422
+
+
+def test_compose_plans(api):
+    async def requests(client):
+        body = {"style_id": "vs1", "hook_id": "h1", "count": 3, "seed": 7}
+        return (
+            await client.post("/api/plans/compose", json=body),
+            await client.post("/api/plans/compose", json=body),
+            await client.post("/api/plans/compose", json={**body, "hook_id": "nope"}),
+        )
+
+    first, second, unknown = api(requests)
+    assert first.status_code == 200
+    assert len(first.json()) == 3
+    assert first.json() == second.json()
+    assert unknown.status_code == 404
+
+
+def test_search(api):
+    async def requests(client):
+        return (
+            (await client.get("/api/search", params={"q": "algorithm", "section": "hooks", "limit": 3})).json(),
+            (await client.get("/api/search", params={"q": "x", "locale": "xx"})).status_code,
+        )
+
+    hits, unknown_locale = api(requests)
+    assert 0 < len(hits) <= 3
+    assert all(hit["section"] == "hooks" and "algorithm" in hit["item"]["idea"].lower() for hit in hits)
+    assert unknown_locale == 404
+
+
+def test_duplicates(api):
+    async def requests(client):
+        return (await client.get("/api/duplicates", params={"threshold": 0.7})).json()
+
+    clusters = api(requests)
+    assert all(len(cluster["ids"]) >= 2 for cluster in clusters)
+
+
+def test_admin_routes_need_the_token(api, monkeypatch):
+    async def requests(client):
+        return [
+            (await client.get("/api/admin/catalog", headers=headers)).status_code
+            for headers in ({}, {"X-Admin-Token": "wrong"}, {"X-Admin-Token": "secret"})
+        ]
+
+    assert api(requests) == [404, 404, 404]
+    monkeypatch.setattr(server, "ADMIN_TOKEN", "secret")
+    assert api(requests) == [403, 403, 200]
+
+
+def test_search_indexes_are_built_at_startup(api, monkeypatch):
+    monkeypatch.setattr(server.catalog_store, "_snapshot", None)
+
+    def not_on_a_request(sections):
+        raise AssertionError("search index built on the request path")
+
+    async def requests(client):
+        monkeypatch.setattr(catalog_store.SearchIndex, "from_sections", not_on_a_request)
+        return [
+            (await client.get("/api/search", params={"q": "algorithm", "locale": locale})).status_code
+            for locale in [None, *server.catalog_store.current.catalog.locales]
+        ]
+
+    assert set(api(requests)) == {200}
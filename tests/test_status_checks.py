@@ -0,0 +1,87 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from status_checks import (
+    aggregate_stats, build_stats_pipeline, get_rollups_since, mark_rollups_start, reset_rollups,
+    rollup_stats, update_rollups,
+)
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+BASE = datetime(2026, 10, 17, 10, 30, tzinfo=timezone.utc)
+
+
+def checks(count, start, step=timedelta(minutes=7), client_name="web"):
+    return [{"id": f"{client_name}{i}", "client_name": client_name, "timestamp": start + i * step} for i in range(count)]
+
+
+def database():
+    return mongomock_motor.AsyncMongoMockClient(tz_aware=True).viraltool
+
+
+def test_raw_stats_bucket_by_hour():
+    async def run():
+        db = database()
+        await db.status_checks.insert_many(checks(20, BASE) + checks(3, BASE, client_name="ios"))
+        return await aggregate_stats(db.status_checks, build_stats_pipeline("hour"))
+
+    stats = asyncio.run(run())
+    assert stats["total"] == 23
+    assert stats["by_client"] == [{"client_name": "web", "count": 20}, {"client_name": "ios", "count": 3}]
+    assert [(row["start"].hour, row["count"]) for row in stats["by_time"]] == [(10, 8), (11, 8), (12, 7)]
+
+
+def test_raw_stats_filters_client_and_range():
+    async def run():
+        db = database()
+        await db.status_checks.insert_many(checks(20, BASE) + checks(3, BASE, client_name="ios"))
+        pipeline = build_stats_pipeline("day", "web", BASE + timedelta(hours=1), BASE + timedelta(hours=2))
+        return await aggregate_stats(db.status_checks, pipeline)
+
+    stats = asyncio.run(run())
+    assert stats["total"] == 9
+    assert stats["by_time"] == [{"start": datetime(2026, 10, 17, tzinfo=timezone.utc), "count": 9}]
+
+
+def test_rollup_stats_fall_back_to_raw_before_rollups_start():
+    # 20 checks written without rollups, then rollups turned on for 10 more
+    started = BASE + timedelta(hours=2, minutes=20)
+    older, newer = checks(20, BASE), checks(10, started, client_name="ios")
+
+    async def run():
+        db = database()
+        await db.status_checks.insert_many(older + newer)
+        assert await rollup_stats(db.status_checks, db.status_rollups, "hour") == (
+            "raw", await aggregate_stats(db.status_checks, build_stats_pipeline("hour"))
+        )
+        await mark_rollups_start(db.status_rollups, started)
+        await update_rollups(db.status_rollups, newer)
+        return (
+            await rollup_stats(db.status_checks, db.status_rollups, "hour"),
+            await rollup_stats(db.status_checks, db.status_rollups, "hour", since=started),
+            await aggregate_stats(db.status_checks, build_stats_pipeline("hour")),
+        )
+
+    (source, stats), (recent_source, recent), raw = asyncio.run(run())
+    assert source == "mixed"
+    assert stats == raw
+    assert recent_source == "rollup"
+    assert recent["total"] == 10
+
+
+def test_reset_rollups():
+    async def run():
+        db = database()
+        assert not await reset_rollups(db.status_rollups)
+        await mark_rollups_start(db.status_rollups, BASE + timedelta(days=1))
+        await mark_rollups_start(db.status_rollups, BASE)
+        since = await get_rollups_since(db.status_rollups)
+        await update_rollups(db.status_rollups, checks(5, BASE))
+        assert await reset_rollups(db.status_rollups)
+        return since, await db.status_rollups.count_documents({})
+
+    since, remaining = asyncio.run(run())
+    assert since == BASE
+    assert remaining == 0
@@ -0,0 +1,30 @@
+import pytest
+
+import translate_chunked
+
+
+def run_main(monkeypatch, *argv):
+    monkeypatch.setattr("sys.argv", ["translate_chunked.py", *argv])
+    translate_chunked.main()
+
+
+def test_failed_language_exits_non_zero(monkeypatch):
+    monkeypatch.setattr(translate_chunked, "translate_language", lambda engine, code: code != "es")
+    run_main(monkeypatch, "de", "--fake", "--no-memory")
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(monkeypatch, "all", "--fake", "--no-memory")
+    assert exit_info.value.code == 1
+
+
+def test_failed_language_in_a_worker_process_exits_non_zero(monkeypatch):
+    results = {"de": True, "es": False}
+    monkeypatch.setattr(translate_chunked, "run_language_jobs", lambda work, langs, args: (results, {}))
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(monkeypatch, "all", "--jobs", "2", "--fake")
+    assert exit_info.value.code == 1
+
+
+def test_unknown_language_exits_non_zero(monkeypatch):
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(monkeypatch, "xx", "--fake", "--no-memory")
+    assert exit_info.value.code == 1
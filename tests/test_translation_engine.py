@@ -0,0 +1,152 @@
+import threading
+import time
+
+from translation_engine import SEGMENT_MARK, FakeTranslator, TokenBucket, TranslationEngine
+from translation_memory import TranslationMemory
+
+
+class RecordingTranslator(FakeTranslator):
+    """FakeTranslator that records its requests and fails on texts containing "fail" """
+
+    def __init__(self, source, target, requests, mangle=False):
+        super().__init__(source, target)
+        self.requests = requests
+        self.mangle = mangle
+
+    def translate(self, text):
+        self.requests.append(text)
+        if "fail" in text:
+            raise RuntimeError("translator error")
+        if self.mangle and SEGMENT_MARK in text:
+            text = text.replace(SEGMENT_MARK, "")
+        return super().translate(text)
+
+
+def engine(requests, mangle=False, **kwargs):
+    kwargs.setdefault("workers", 2)
+    return TranslationEngine(
+        lambda source, target: RecordingTranslator(source, target, requests, mangle),
+        rate=0, max_retries=1, base_delay=0, **kwargs,
+    )
+
+
+def test_failed_texts_are_retried_then_kept():
+    requests = []
+    with engine(requests, batch_chars=0) as e:
+        assert e.translate_many(["alpha", "fail me", "beta"], "it") == ["[it] alpha", "fail me", "[it] beta"]
+        assert e.translate("fail again", "it") == "fail again"
+    assert requests.count("fail me") == 2
+    assert e.stats["retries"] == 2 and e.stats["failures"] == 2
+
+
+def test_translate_content_translates_every_section_field():
+    data = {
+        "visualStyles": [{"id": "vs1", "title": "Title", "info": "Info", "images": ["a.jpg"]}],
+        "hooks": [{"id": "h1", "category": "Ex TikTok", "idea": "Idea", "notes": "-"}],
+        "scripts": [{"id": "s1", "type": "other", "paragraph1": "One", "paragraph2": ""}],
+    }
+    with engine([]) as e:
+        translated = e.translate_languages(data, ["de", "fr"])
+    assert translated["de"]["visualStyles"][0]["title"] == "[de] Title"
+    assert translated["fr"]["hooks"][0] == {"id": "h1", "category": "Ex TikTok", "idea": "[fr] Idea", "notes": "-"}
+    assert translated["fr"]["scripts"][0]["paragraph2"] == ""
+    assert data["hooks"][0]["idea"] == "Idea"
+
+
+def test_token_bucket_limits_the_rate():
+    bucket = TokenBucket(rate=50, capacity=5)
+    assert all(bucket.try_acquire() for _ in range(5))
+    assert not bucket.try_acquire()
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.08
+
+
+def test_translate_many_batches_and_keeps_order():
+    requests = []
+    texts = ["one", "two", "", "-", "one", "three"]
+    with engine(requests, workers=1) as e:
+        assert e.translate_many(texts, "de") == ["[de] one", "[de] two", "", "-", "[de] one", "[de] three"]
+    # The three distinct strings went out in a single request
+    assert len(requests) == 1
+    assert e.stats["batches"] == 1 and e.stats["fallbacks"] == 0
+
+
+def test_small_batches_split_requests():
+    requests = []
+    with engine(requests, batch_chars=12) as e:
+        assert e.translate_many(["alpha", "beta", "gamma"], "fr") == ["[fr] alpha", "[fr] beta", "[fr] gamma"]
+    assert sorted(requests) == ["alpha", "beta", "gamma"]
+
+
+def test_mangled_delimiters_fall_back_to_one_call_per_text():
+    requests = []
+    with engine(requests, mangle=True) as e:
+        assert e.translate_many(["alpha", "beta"], "es") == ["[es] alpha", "[es] beta"]
+    assert e.stats["fallbacks"] == 1
+    assert requests[1:] == ["alpha", "beta"]
+
+
+def test_memory_is_looked_up_once_per_text(tmp_path):
+    memory = TranslationMemory(str(tmp_path / "memory.sqlite3"))
+    with engine([], batch_chars=0, memory=memory) as e:
+        e.translate_many(["alpha", "beta"], "de")
+        lookups = memory.hits + memory.misses
+    with engine([], mangle=True, memory=TranslationMemory(str(tmp_path / "other.sqlite3"))) as e:
+        e.translate_many(["alpha", "beta"], "de")
+        fallback_lookups = e.memory.hits + e.memory.misses
+    assert lookups == fallback_lookups == 2
+
+
+
+def test_failed_texts_are_kept_and_reported():
+    requests = []
+    results, failed = {}, []
+    with engine(requests) as e:
+        translated = e.translate_many(
+            ["alpha", "fail me", "beta"], "it",
+            on_result=lambda text, translation: results.__setitem__(text, translation), on_failure=failed.append,
+        )
+    assert translated == ["[it] alpha", "fail me", "[it] beta"]
+    assert results == {"alpha": "[it] alpha", "beta": "[it] beta"}
+    assert failed == ["fail me"]
+    assert e.stats["failures"] == 1
+
+
+def test_translate_items_reports_failed_fields():
+    items = [{"id": "h1", "idea": "alpha", "notes": "fail"}, {"id": "h2", "idea": "-", "notes": None}]
+    failed = []
+    with engine([]) as e:
+        translated = e.translate_items(items, ("idea", "notes"), "ru", on_failure=lambda item, field: failed.append((item["id"], field)))
+    assert translated == [{"id": "h1", "idea": "[ru] alpha", "notes": "fail"}, {"id": "h2", "idea": "-", "notes": None}]
+    assert items[0]["idea"] == "alpha"
+    assert failed == [("h1", "notes")]
+
+
+def test_translation_memory_skips_known_texts(tmp_path):
+    path = str(tmp_path / "memory.sqlite3")
+    with engine([], memory=TranslationMemory(path)) as e:
+        e.translate_many(["alpha", "beta", "fail"], "de")
+    requests = []
+    with engine(requests, memory=TranslationMemory(path)) as e:
+        assert e.translate_many(["alpha", "beta", "gamma"], "de") == ["[de] alpha", "[de] beta", "[de] gamma"]
+        # Other languages and engine versions are separate
+        assert e.translate("alpha", "fr") == "[fr] alpha"
+    assert requests == ["gamma", "alpha"]
+    assert e.stats["cached"] == 2
+
+
+def test_memory_is_shared_between_threads(tmp_path):
+    memory = TranslationMemory(str(tmp_path / "memory.sqlite3"))
+    threads = [
+        threading.Thread(target=lambda n=n: [memory.put(f"{n}-{i}", "en", "de", "fake", f"t{i}") for i in range(50)])
+        for n in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert memory.get("3-49", "en", "de", "fake") == "t49"
+    assert memory.get("3-49", "en", "de", "other") is None
+    memory.close()
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+import fix_capitalization
+import fix_translations_v2
+from fix_translations import case_variant_rules
+from translation_rules import ORDERING_CASES, Rule, RuleSet, apply_sequential
+
+
+@pytest.mark.parametrize("rules, text, expected", ORDERING_CASES)
+def test_ordering_cases(rules, text, expected):
+    assert apply_sequential(rules, text) == expected
+    assert RuleSet(rules).apply(text) == expected
+
+
+def test_overlapping_patterns_keep_their_order():
+    rules = [Rule("Geist", "Ghost"), Rule("Geister", "Ghosten"), Rule("ster", "STER")]
+    rule_set = RuleSet(rules)
+    assert len(rule_set.stages) == 3
+    assert rule_set.apply("Geister Geist Meister") == "GhoSTER Ghost MeiSTER"
+
+
+def test_chained_rules_apply_in_order():
+    rules = [Rule("a", "b"), Rule("b", "c"), Rule("c", "d")]
+    assert RuleSet(rules).apply("abcx") == apply_sequential(rules, "abcx") == "dddx"
+    assert RuleSet(rules[::-1]).apply("abcx") == apply_sequential(rules[::-1], "abcx") == "bcdx"
+
+
+def test_independent_rules_share_the_first_stage():
+    rule_set = RuleSet([Rule("a", "b"), Rule("b", "c"), Rule("x", "y"), Rule("q", "r")])
+    assert len(rule_set.stages) == 2
+    assert rule_set.apply("abxq") == "ccyr"
+
+
+def test_ignore_case_rule_replacing_text_with_itself_normalizes_case():
+    rule_set = RuleSet([Rule("TikTok", "TikTok", ignore_case=True)])
+    assert rule_set.apply("tiktok, TIKTOK and TikTok") == "TikTok, TikTok and TikTok"
+
+
+def test_case_sensitive_identity_rules_are_dropped():
+    assert RuleSet([Rule("TikTok", "TikTok"), Rule("", "x")]).rules == []
+
+
+def test_partly_overlapping_rules_share_a_stage():
+    rules = [Rule("a", "xb"), Rule("bc", "Y"), Rule("cd", "Z")]
+    rule_set = RuleSet(rules)
+    assert len(rule_set.stages) == 1
+    # The input shows where the order matters, and those texts go one rule at a time
+    for text in ["a c", "ac", "bcd", "acd", "bc cd"]:
+        assert rule_set.apply(text) == apply_sequential(rules, text)
+
+
+def test_matches_left_unchanged_dont_need_a_stage():
+    rules = [Rule("tik tok", "TikTok", ignore_case=True, whole_word=True),
+             Rule("tiktok", "TikTok", ignore_case=True, whole_word=True)]
+    rule_set = RuleSet(rules)
+    assert len(rule_set.stages) == 1
+    assert rule_set.apply("Tik tok and TIKTOK") == "TikTok and TikTok"
+
+
+def test_shipped_rules_compile_to_few_stages():
+    for lang, rules in fix_translations_v2.RULES.items():
+        assert len((rules + fix_capitalization.BRAND_RULES).stages) <= 2, lang
+
+
+def test_ignore_case_and_whole_word():
+    rules = [Rule("tik tok", "TikTok", ignore_case=True, whole_word=True)]
+    assert RuleSet(rules).apply("Tik Tok, TIK TOK, tik toks") == "TikTok, TikTok, tik toks"
+
+
+def test_repeated_rules_are_merged():
+    # Case variants of text without case are all the same rule
+    rule_set = RuleSet(case_variant_rules({"幽霊": "ゴースト", "状況関係": "シチュエーションシップ"}))
+    assert len(rule_set.rules) == 2
+    assert len(rule_set.stages) == 1
+    assert rule_set.apply("幽霊の状況関係") == "ゴーストのシチュエーションシップ"
+
+
+def test_repeated_rule_that_feeds_itself_is_kept():
+    rules = [Rule("a", "ab"), Rule("a", "ab")]
+    assert RuleSet(rules).apply("a") == apply_sequential(rules, "a") == "abb"
+
+
+def random_rule(rng, alphabet):
+    text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3)))
+    replacement = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 3)))
+    if rng.random() < 0.2:
+        replacement = text
+    return Rule(text, replacement, ignore_case=rng.random() < 0.3, whole_word=rng.random() < 0.3)
+
+
+def test_matches_sequential_application_on_random_rules():
+    rng = random.Random(1234)
+    alphabet = "abAB -"
+    for _ in range(2000):
+        rules = [random_rule(rng, alphabet) for _ in range(rng.randint(1, 6))]
+        rule_set = RuleSet(rules)
+        for _ in range(10):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            assert rule_set.apply(text) == apply_sequential(rules, text), (rules, text)